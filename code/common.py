@@ -26,15 +26,13 @@
 
 import ure
 import usys
+import utime
 import usocket
 import _thread
 from usr.logging import getLogger
 
 logger = getLogger(__name__)
 
-_socket_lock = _thread.allocate_lock()
-_serial_no_lock = _thread.allocate_lock()
-
 
 def option_lock(thread_lock):
     """Function thread lock decorator"""
@@ -64,87 +62,615 @@ def str_fill(source, rl="l", target_len=0, fill_field="0"):
         return source + fill_info
 
 
-class Singleton(object):
-    """Singleton base class"""
-    _instance_lock = _thread.allocate_lock()
-
-    def __init__(self, *args, **kwargs):
-        pass
-
-    def __new__(cls, *args, **kwargs):
-        if not hasattr(cls, "_instance"):
-            Singleton.instance_dict = {}
-
-        if str(cls) not in Singleton.instance_dict.keys():
-            with Singleton._instance_lock:
-                _instance = super().__new__(cls)
-                Singleton.instance_dict[str(cls)] = _instance
-
-        return Singleton.instance_dict[str(cls)]
-
-
-class SerialNo(Singleton):
+class SerialNo(object):
+    """Message serial number space, each session has its own object."""
 
     def __init__(self, start_no=0):
         self.__start_no = start_no
         self.__num = 0xFFFF
+        self.__lock = _thread.allocate_lock()
         self.__init_iter_serial_no()
 
     def __init_iter_serial_no(self):
         self.__iter_serial_no = iter(range(self.__start_no, self.__num))
 
-    @option_lock(_serial_no_lock)
     def get_serial_no(self):
         """Get message serial number.
 
         Returns:
             int: serial number
         """
+        with self.__lock:
+            try:
+                return next(self.__iter_serial_no)
+            except StopIteration:
+                self.__init_iter_serial_no()
+                return next(self.__iter_serial_no)
+
+
+class MonotonicClock(object):
+    """Monotonic time in ms which does not wrap around like utime.ticks_ms."""
+
+    def __init__(self):
+        self.__ticks = utime.ticks_ms()
+        self.__now = 0
+
+    def now(self):
+        """Get monotonic time.
+
+        Returns:
+            int: milliseconds since this object is created.
+        """
+        ticks = utime.ticks_ms()
+        self.__now += utime.ticks_diff(ticks, self.__ticks)
+        self.__ticks = ticks
+        return self.__now
+
+
+class _SendWaiter(object):
+    """Waiter of one sender whose data is written by another thread."""
+
+    def __init__(self):
+        self.result = False
+        self.__lock = _thread.allocate_lock()
+        self.__lock.acquire()
+
+    def set(self, result):
+        self.result = result
+        self.__lock.release()
+
+    def wait(self):
+        self.__lock.acquire()
+        return self.result
+
+
+class WriteBatcher(object):
+    """This class coalesces data of concurrent senders into one socket write.
+
+    The first sender becomes the writer, it waits `linger` ms for more data, then writes the pending data
+    up to `batch_size` bytes together, and keeps writing until no data is pending. The other senders wait
+    for the writer to report their result.
+    """
+
+    def __init__(self, write, batch_size=1460, linger=0):
+        """
+        Args:
+            write(function): write function, args is bytes, returns bool.
+            batch_size(int): max bytes of one write, one sender's data is never split. (default: {1460})
+            linger(int): time to wait for more data before write. unit: ms. (default: {0})
+        """
+        self.__write = write
+        self.__batch_size = batch_size
+        self.__linger = linger
+        self.__lock = _thread.allocate_lock()
+        self.__pending = []
+        self.__writing = False
+        self.__stats = {"writes": 0, "msgs": 0, "bytes": 0, "max_msgs": 0}
+
+    def __write_batch(self, batch):
+        """Write batch data and set result to waiters.
+
+        Args:
+            batch(list): each item is tuple (datas, waiter).
+
+        Returns:
+            bool: write result.
+        """
+        datas = []
+        for item in batch:
+            datas.extend(item[0])
+        data = datas[0] if len(datas) == 1 else b"".join(datas)
+        try:
+            result = self.__write(data)
+        except Exception as e:
+            usys.print_exception(e)
+            result = False
+        if result:
+            with self.__lock:
+                self.__stats["writes"] += 1
+                self.__stats["msgs"] += len(datas)
+                self.__stats["bytes"] += len(data)
+                if len(datas) > self.__stats["max_msgs"]:
+                    self.__stats["max_msgs"] = len(datas)
+        for _, waiter in batch:
+            if waiter is not None:
+                waiter.set(result)
+        return result
+
+    def __take_pending(self, batch, size):
+        """Move pending data to batch until batch size is reached, lock must be held."""
+        while self.__pending:
+            datas, waiter = self.__pending[0]
+            data_size = sum([len(i) for i in datas])
+            if batch and size + data_size > self.__batch_size:
+                break
+            batch.append(self.__pending.pop(0))
+            size += data_size
+        return batch
+
+    def send(self, datas):
+        """Send data, blocks until the data is written.
+
+        Args:
+            datas(tuple|list): byte stream list, they are written in order without other data between them.
+
+        Returns:
+            bool: True - success, False - falied.
+        """
+        with self.__lock:
+            if self.__writing:
+                waiter = _SendWaiter()
+                self.__pending.append((datas, waiter))
+            else:
+                waiter = None
+                self.__writing = True
+
+        if waiter is not None:
+            return waiter.wait()
+
+        result = False
+        try:
+            if self.__linger > 0:
+                utime.sleep_ms(self.__linger)
+            with self.__lock:
+                batch = self.__take_pending([(datas, None)], sum([len(i) for i in datas]))
+            result = self.__write_batch(batch)
+            while True:
+                with self.__lock:
+                    if not self.__pending:
+                        break
+                    batch = self.__take_pending([], 0)
+                self.__write_batch(batch)
+        finally:
+            # Always give up writer role, or all later senders wait for it forever.
+            with self.__lock:
+                self.__writing = False
+                pending = self.__pending
+                self.__pending = []
+            for _, waiter in pending:
+                waiter.set(False)
+        return result
+
+    def stats(self):
+        """Get write statistics.
+
+        Returns:
+            dict:
+                writes(int): write count.
+                msgs(int): written message count.
+                bytes(int): written bytes.
+                max_msgs(int): max message count of one write.
+        """
+        with self.__lock:
+            return dict(self.__stats)
+
+
+DISPATCH_DROP_OLDEST = 0
+DISPATCH_REJECT = 1
+DISPATCH_BLOCK = 2
+
+
+class CallbackDispatcher(object):
+    """This class runs callbacks in a fixed number of worker threads with a bounded queue.
+
+    Callbacks with the same key are run one by one in submit order, callbacks with different keys
+    are run in parallel. When the queue is full, the new callback is handled by the overflow policy.
+    """
+
+    def __init__(self, size=2, queue_size=8, policy=DISPATCH_REJECT):
+        """
+        Args:
+            size(int): worker thread count. (default: {2})
+            queue_size(int): max callbacks waiting in queue. (default: {8})
+            policy(int): queue overflow policy. (default: {DISPATCH_REJECT})
+                DISPATCH_DROP_OLDEST - drop the oldest callback in queue.
+                DISPATCH_REJECT - reject the new callback.
+                DISPATCH_BLOCK - block the submitter until queue is not full.
+        """
+        self.__queue_size = queue_size
+        self.__policy = policy
+        self.__lock = _thread.allocate_lock()
+        self.__queue = []
+        self.__running_keys = []
+        self.__idle_workers = []
+        self.__blocked_submitters = []
+        self.__stats = {"submitted": 0, "done": 0, "errors": 0, "dropped": 0, "rejected": 0, "depth": 0, "max_depth": 0, "latency": 0, "max_latency": 0}
+        self.__latency_sum = 0
+        for _ in range(size):
+            _thread.start_new_thread(self.__worker, ())
+
+    def __take_task(self):
+        """Take the first task whose key is not running, lock must be held."""
+        for index, task in enumerate(self.__queue):
+            key = task[0]
+            if key is None or key not in self.__running_keys:
+                self.__queue.pop(index)
+                if key is not None:
+                    self.__running_keys.append(key)
+                if self.__blocked_submitters:
+                    self.__blocked_submitters.pop(0).set(True)
+                return task
+        return None
+
+    def __wake_worker(self):
+        """Wake one idle worker, lock must be held."""
+        if self.__idle_workers:
+            self.__idle_workers.pop(0).set(True)
+
+    def __worker(self):
+        while True:
+            waiter = None
+            with self.__lock:
+                task = self.__take_task()
+                if task is None:
+                    waiter = _SendWaiter()
+                    self.__idle_workers.append(waiter)
+            if waiter is not None:
+                waiter.wait()
+                continue
+
+            key, func, args, submit_time = task
+            latency = utime.ticks_diff(utime.ticks_ms(), submit_time)
+            error = False
+            try:
+                func(*args)
+            except Exception as e:
+                usys.print_exception(e)
+                error = True
+
+            with self.__lock:
+                if key is not None:
+                    self.__running_keys.remove(key)
+                self.__stats["done"] += 1
+                if error:
+                    self.__stats["errors"] += 1
+                self.__latency_sum += latency
+                if latency > self.__stats["max_latency"]:
+                    self.__stats["max_latency"] = latency
+                if self.__queue:
+                    self.__wake_worker()
+
+    def submit(self, func, args=(), key=None):
+        """Submit callback to run in worker thread.
+
+        Args:
+            func(function): callback function.
+            args(tuple): callback args. (default: {()})
+            key: callbacks with the same key are run in submit order, None means no order. (default: {None})
+
+        Returns:
+            bool: True - success, False - rejected by queue overflow policy.
+        """
+        with self.__lock:
+            self.__stats["submitted"] += 1
+            while len(self.__queue) >= self.__queue_size:
+                if self.__policy == DISPATCH_REJECT:
+                    self.__stats["rejected"] += 1
+                    logger.warn("Callback queue is full, reject new callback.")
+                    return False
+                elif self.__policy == DISPATCH_DROP_OLDEST:
+                    self.__queue.pop(0)
+                    self.__stats["dropped"] += 1
+                    logger.warn("Callback queue is full, drop oldest callback.")
+                else:
+                    waiter = _SendWaiter()
+                    self.__blocked_submitters.append(waiter)
+                    self.__lock.release()
+                    try:
+                        waiter.wait()
+                    finally:
+                        self.__lock.acquire()
+            self.__queue.append((key, func, args, utime.ticks_ms()))
+            if len(self.__queue) > self.__stats["max_depth"]:
+                self.__stats["max_depth"] = len(self.__queue)
+            self.__wake_worker()
+        return True
+
+    def stats(self):
+        """Get dispatch statistics.
+
+        Returns:
+            dict:
+                submitted(int): submitted callback count.
+                done(int): finished callback count.
+                errors(int): callback count raising exception.
+                dropped(int): callback count dropped by DISPATCH_DROP_OLDEST.
+                rejected(int): callback count rejected by DISPATCH_REJECT.
+                depth(int): current queue depth.
+                max_depth(int): max queue depth.
+                latency(int): average time from submit to run. unit: ms.
+                max_latency(int): max time from submit to run. unit: ms.
+        """
+        with self.__lock:
+            stats = dict(self.__stats)
+            stats["depth"] = len(self.__queue)
+            stats["latency"] = self.__latency_sum // stats["done"] if stats["done"] else 0
+        return stats
+
+
+_dispatcher = None
+_dispatcher_lock = _thread.allocate_lock()
+
+
+def get_dispatcher():
+    """Get the callback dispatcher shared by all GT06 objects which are not given a dispatcher.
+
+    Returns:
+        CallbackDispatcher: dispatcher object.
+    """
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = CallbackDispatcher()
+    return _dispatcher
+
+
+RESOLVE_ROUND_ROBIN = 0
+RESOLVE_FASTEST = 1
+
+
+class _ResolveEntry(object):
+    """DNS result of one host."""
+
+    def __init__(self, ips, expires, error=None):
+        self.ips = ips
+        self.expires = expires
+        self.error = error
+        self.index = 0
+
+
+class Resolver(object):
+    """This class caches domain DNS results, it is shared by all sockets.
+
+    All addresses returned by DNS are kept until TTL expires, so a reconnect does not resolve the domain
+    again. A DNS failure is cached for negative TTL. Addresses failed to connect are skipped for negative
+    TTL, and the host is resolved again once all of its addresses failed.
+    """
+
+    def __init__(self, ttl=300, negative_ttl=30, policy=RESOLVE_ROUND_ROBIN):
+        """
+        Args:
+            ttl(int): time to keep DNS result. unit: second. (default: {300})
+            negative_ttl(int): time to keep DNS failure and to skip address failed to connect. unit: second. (default: {30})
+            policy(int):
+                RESOLVE_ROUND_ROBIN - use addresses in turn.
+                RESOLVE_FASTEST - use address with the smallest connect time, addresses not measured are tried first.
+                (default: {RESOLVE_ROUND_ROBIN})
+        """
+        self.__ttl = ttl * 1000
+        self.__negative_ttl = negative_ttl * 1000
+        self.__policy = policy
+        self.__lock = _thread.allocate_lock()
+        self.__clock = MonotonicClock()
+        self.__entries = {}
+        self.__rtt = {}
+        self.__failed = {}
+
+    def __lookup(self, host, port):
+        """Resolve host by DNS, lock must not be held."""
         try:
-            return next(self.__iter_serial_no)
-        except StopIteration:
-            self.__init_iter_serial_no()
-            return self.get_serial_no()
+            ips = []
+            for addr_info in usocket.getaddrinfo(host, port):
+                ip = addr_info[-1][0]
+                if ip not in ips:
+                    ips.append(ip)
+            if not ips:
+                raise ValueError("No address.")
+            return ips, None
+        except Exception as e:
+            usys.print_exception(e)
+            return [], str(e)
+
+    def __get_entry(self, host, port):
+        with self.__lock:
+            entry = self.__entries.get(host)
+            if entry is not None and self.__clock.now() < entry.expires:
+                return entry
+        # DNS query blocks, do not hold lock.
+        ips, error = self.__lookup(host, port)
+        with self.__lock:
+            expires = self.__clock.now() + (self.__negative_ttl if error is not None else self.__ttl)
+            entry = _ResolveEntry(ips, expires, error)
+            self.__entries[host] = entry
+            logger.debug("Resolve %s: %s" % (host, ips if error is None else error))
+        return entry
+
+    def resolve(self, host, port):
+        """Get all addresses of host, DNS is queried only when the cached result expires.
 
+        Args:
+            host(str): domain.
+            port(int): server port.
 
-class SocketBase(Singleton):
-    """This class is socket base"""
+        Returns:
+            list: ip address list.
 
-    def __init__(self, ip=None, port=None, domain=None, method="TCP"):
+        Raises:
+            ValueError: Domain DNS parsing falied.
+        """
+        entry = self.__get_entry(host, port)
+        if entry.error is not None:
+            raise ValueError("Domain %s DNS parsing error. %s" % (host, entry.error))
+        return list(entry.ips)
+
+    def get_addr(self, host, port):
+        """Select an address of host to connect by policy.
+
+        Args:
+            host(str): domain.
+            port(int): server port.
+
+        Returns:
+            str: ip address.
+
+        Raises:
+            ValueError: Domain DNS parsing falied.
+        """
+        entry = self.__get_entry(host, port)
+        if entry.error is not None:
+            raise ValueError("Domain %s DNS parsing error. %s" % (host, entry.error))
+        with self.__lock:
+            now = self.__clock.now()
+            ips = [i for i in entry.ips if self.__failed.get(i, 0) <= now]
+            if not ips:
+                # All addresses failed, try them again and resolve host again next time.
+                ips = entry.ips
+                entry.expires = now
+                for i in ips:
+                    self.__failed.pop(i, None)
+            if self.__policy == RESOLVE_FASTEST:
+                unmeasured = [i for i in ips if i not in self.__rtt]
+                if unmeasured:
+                    return unmeasured[0]
+                ip = ips[0]
+                for i in ips:
+                    if self.__rtt[i] < self.__rtt[ip]:
+                        ip = i
+                return ip
+            ip = ips[entry.index % len(ips)]
+            entry.index += 1
+            return ip
+
+    def report(self, ip, rtt=-1, ok=True):
+        """Report connect result of an address.
+
+        Args:
+            ip(str): ip address.
+            rtt(int): connect time. unit: ms. (default: {-1})
+            ok(bool): True - connect success, False - connect failed, the address is skipped for negative TTL. (default: {True})
+        """
+        with self.__lock:
+            if ok:
+                self.__failed.pop(ip, None)
+                if rtt >= 0:
+                    # Smoothed connect time, the same gain as RFC 6298 SRTT.
+                    self.__rtt[ip] = rtt if ip not in self.__rtt else (self.__rtt[ip] * 7 + rtt) // 8
+            else:
+                self.__failed[ip] = self.__clock.now() + self.__negative_ttl
+
+    def invalidate(self, host=None):
+        """Remove cached DNS result.
+
+        Args:
+            host(str): domain, all hosts are removed if None. (default: {None})
+        """
+        with self.__lock:
+            if host is None:
+                self.__entries = {}
+            else:
+                self.__entries.pop(host, None)
+
+
+_resolver = None
+_resolver_lock = _thread.allocate_lock()
+
+
+def get_resolver():
+    """Get the resolver shared by all sockets which are not given a resolver.
+
+    Returns:
+        Resolver: resolver object.
+    """
+    global _resolver
+    with _resolver_lock:
+        if _resolver is None:
+            _resolver = Resolver()
+    return _resolver
+
+
+# Socket capture record types, see `usr.gt06_capture.WireCapture`.
+CAPTURE_OUT = 0
+CAPTURE_IN = 1
+CAPTURE_CONNECT = 2
+CAPTURE_CLOSE = 3
+
+
+class SocketBase(object):
+    """This class is socket base, each object has its own socket and lock."""
+
+    def __init__(self, ip=None, port=None, domain=None, method="TCP", linger=0, batch_size=1460, resolver=None, capture=None):
         """
         Args:
             ip: server ip address (default: {None})
             port: server port (default: {None})
             domain: server domain (default: {None})
             method: TCP or UDP (default: {"TCP"})
+            linger: time to wait for more messages before socket write. unit: ms. (default: {0})
+            batch_size: max bytes of messages written by one socket write. (default: {1460})
+            resolver: Resolver object to resolve domain, the shared resolver is used if None. (default: {None})
+            capture: WireCapture object to record socket bytes, nothing is recorded if None. (default: {None})
         """
         self.__ip = ip
         self.__port = port
         self.__domain = domain
         self.__addr = None
+        self.__resolver = resolver if resolver is not None else get_resolver()
+        self.__reselect = False
+        self.__capture = capture
         self.__method = method
         self.__socket = None
+        self.__socket_lock = _thread.allocate_lock()
         self.__socket_args = []
         self.__timeout = 30
-        self.__init_addr()
-        self.__init_socket()
+        self.__write_batcher = WriteBatcher(self.__send, batch_size, linger)
+        if ip is not None or domain is not None:
+            self.__init_addr()
+            self.__init_socket()
 
     def __init_addr(self):
         """Get ip and port from domain.
 
         Raises:
-            ValueError: Domain DNS parsing falied.
+            ValueError: port is not set or domain DNS parsing falied.
         """
+        if self.__port is None:
+            raise ValueError("Args port is required.")
         if self.__domain is not None and self.__domain:
-            if self.__port is None:
-                self.__port == 8883 if self.__domain.startswith("https://") else 1883
+            self.__ip = self.__resolver.get_addr(self.__domain, self.__port)
+        self.__addr = (self.__ip, self.__port)
+
+    def __select_addr(self):
+        """Select server address again by resolver before reconnect, lock must be held.
+
+        Returns:
+            bool: True - success, False - domain DNS parsing falied.
+        """
+        if not self.__domain or not self.__reselect:
+            self.__reselect = True
+            return True
+        try:
+            self.__init_addr()
+            self.__init_socket()
+            return True
+        except Exception as e:
+            usys.print_exception(e)
+            return False
+
+    def _set_server(self, host, port):
+        """Change server address, it is used by the next connect.
+
+        Args:
+            host(str): server ip address or domain.
+            port(int): server port.
+
+        Returns:
+            bool: True - success, False - host is illegal or domain DNS parsing falied.
+        """
+        with self.__socket_lock:
+            self.__ip = host
+            self.__domain = None
+            self.__port = port
+            if not self.__check_ipv4() and host.find(":") == -1:
+                self.__domain = host
             try:
-                addr_info = usocket.getaddrinfo(self.__domain, self.__port)
-                self.__ip = addr_info[0][-1][0]
+                self.__init_addr()
+                self.__init_socket()
+                self.__reselect = False
+                return True
             except Exception as e:
                 usys.print_exception(e)
-                raise ValueError("Domain %s DNS parsing error. %s" % (self.__domain, str(e)))
-        self.__addr = (self.__ip, self.__port)
+                self.__socket_args = []
+                return False
 
     def __init_socket(self):
         """Init socket by ip, port and method
@@ -213,96 +739,157 @@ class SocketBase(Singleton):
         #     ^({ipv6}:){6}:$
         # """.format(ipv4=ipv4_regex, ipv6=self.__ipv6_item)
 
-        if self.ip.startswith("::") or ure.search(self.__ipv6_item + ":", self.__ip):
+        if self.__ip.startswith("::") or ure.search(self.__ipv6_item + ":", self.__ip):
             return True
         else:
             return False
 
-    @option_lock(_socket_lock)
     def __connect(self):
         """Socket connect when method is TCP
 
         Returns:
             bool: True - success, False - falied
         """
-        if self.__socket_args:
-            try:
-                self.__socket = usocket.socket(*self.__socket_args)
-                if self.__method == 'TCP':
-                    self.__socket.connect(self.__addr)
-                return True
-            except Exception as e:
-                usys.print_exception(e)
+        with self.__socket_lock:
+            if self.__select_addr() and self.__socket_args:
+                start = utime.ticks_ms()
+                try:
+                    self.__socket = usocket.socket(*self.__socket_args)
+                    if self.__method == 'TCP':
+                        self.__socket.connect(self.__addr)
+                        if self.__domain:
+                            self.__resolver.report(self.__ip, utime.ticks_diff(utime.ticks_ms(), start))
+                    if self.__capture is not None:
+                        self.__capture.record(CAPTURE_CONNECT, ("%s:%s" % self.__addr).encode())
+                    return True
+                except Exception as e:
+                    usys.print_exception(e)
+                    if self.__domain:
+                        self.__resolver.report(self.__ip, ok=False)
+                    if self.__socket is not None:
+                        try:
+                            self.__socket.close()
+                        except Exception as e:
+                            usys.print_exception(e)
+                        self.__socket = None
 
-        return False
+            return False
 
-    @option_lock(_socket_lock)
     def __disconnect(self):
         """Socket disconnect
 
         Returns:
             bool: True - success, False - falied
         """
-        if self.__socket is not None:
-            try:
-                self.__socket.close()
-                self.__socket = None
+        with self.__socket_lock:
+            if self.__socket is not None:
+                try:
+                    self.__socket.close()
+                    self.__socket = None
+                    if self.__capture is not None:
+                        self.__capture.record(CAPTURE_CLOSE)
+                    return True
+                except Exception as e:
+                    usys.print_exception(e)
+                    return False
+            else:
                 return True
-            except Exception as e:
-                usys.print_exception(e)
-                return False
-        else:
-            return True
 
-    @option_lock(_socket_lock)
     def __send(self, data):
         """Send data by socket.
 
+        When TCP socket writes part of data, the rest data is written again.
+
         Args:
             data(bytes): byte stream
 
         Returns:
             bool: True - success, False - falied.
         """
-        if self.__socket is not None:
-            try:
-                if self.__method == "TCP":
-                    write_data_num = self.__socket.write(data)
-                    if write_data_num == len(data):
-                        return True
-                elif self.__method == "UDP":
-                    send_data_num = self.__socket.sendto(data, self.__addr)
-                    if send_data_num == len(data):
-                        return True
-            except Exception as e:
-                usys.print_exception(e)
+        with self.__socket_lock:
+            if self.__socket is not None:
+                try:
+                    # Record before write, server response may be read and recorded before write returns.
+                    if self.__capture is not None:
+                        self.__capture.record(CAPTURE_OUT, data)
+                    if self.__method == "TCP":
+                        data_view = memoryview(data)
+                        write_data_num = 0
+                        while write_data_num < len(data_view):
+                            num = self.__socket.write(data_view[write_data_num:])
+                            if not num:
+                                break
+                            write_data_num += num
+                        if write_data_num == len(data_view):
+                            return True
+                    elif self.__method == "UDP":
+                        send_data_num = self.__socket.sendto(data, self.__addr)
+                        if send_data_num == len(data):
+                            return True
+                except Exception as e:
+                    usys.print_exception(e)
 
-        return False
+            return False
+
+    def _send(self, data):
+        """Send data by socket.
 
-    def __read(self, bufsize=1024):
+        TCP data sent by different threads at the same time are written together, see `WriteBatcher`.
+
+        Args:
+            data(bytes): byte stream
+
+        Returns:
+            bool: True - success, False - falied.
+        """
+        if self.__method == "TCP":
+            return self.__write_batcher.send((data,))
+        return self.__send(data)
+
+    def get_send_stats(self):
+        """Get statistics of socket writes.
+
+        Returns:
+            dict:
+                writes(int): socket write count.
+                msgs(int): sent message count.
+                bytes(int): sent bytes.
+                max_msgs(int): max message count of one socket write.
+        """
+        return self.__write_batcher.stats()
+
+    def _read(self, bufsize=1024, idle_timeout=None):
         """Read data by socket.
 
+        By default this function returns as soon as any data is received, so the data can be handed to the
+        message framer without delay. Set idle_timeout to keep reading until the socket is quiet.
+
         Args:
             bufsize(int): read data size.
+            idle_timeout(float): keep reading until no data is received in this seconds. (default: {None})
 
         Returns:
             bytes: read data info
         """
-        logger.debug("start read")
         data = b""
         if self.__socket is not None:
             try:
-                while True:
-                    if data:
-                        self.__socket.settimeout(0.5)
-                    else:
-                        self.__socket.settimeout(self.__timeout)
-                    read_data = self.__socket.recv(bufsize)
-                    logger.debug("read_data: %s" % read_data)
-                    if read_data:
-                        data += read_data
-                    else:
-                        break
+                self.__socket.settimeout(self.__timeout)
+                data = self.__socket.recv(bufsize)
+                logger.debug("read_data: %s" % data)
+                if data and self.__capture is not None:
+                    self.__capture.record(CAPTURE_IN, data)
+                if idle_timeout is not None:
+                    self.__socket.settimeout(idle_timeout)
+                    while data:
+                        read_data = self.__socket.recv(bufsize)
+                        logger.debug("read_data: %s" % read_data)
+                        if read_data and self.__capture is not None:
+                            self.__capture.record(CAPTURE_IN, read_data)
+                        if read_data:
+                            data += read_data
+                        else:
+                            break
             except Exception as e:
                 if e.args[0] != 110:
                     usys.print_exception(e)
@@ -310,6 +897,22 @@ class SocketBase(Singleton):
 
         return data
 
+    def set_capture(self, capture):
+        """Set WireCapture object to record socket bytes.
+
+        Args:
+            capture(WireCapture): capture object, recording stops if None.
+        """
+        self.__capture = capture
+
+    def _get_socket(self):
+        """Get socket object, it is used to register in selector.
+
+        Returns:
+            usocket.socket: socket object, None if not connected.
+        """
+        return self.__socket
+
     def _downlink_thread_start(self):
         """This function starts a thread to read the data sent by the server"""
         pass
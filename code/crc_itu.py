@@ -60,8 +60,31 @@ CRC_TAB = (
 )
 
 
+CRC_INIT = 0xffff
+
+
+def crc16_update(fcs, data):
+    """Resume CRC register over data.
+
+    The register of a constant prefix can be saved and resumed over the rest bytes, `crc16(prefix + rest)`
+    equals `crc16_update(crc16_update(CRC_INIT, prefix), rest) ^ 0xffff`.
+
+    Args:
+        fcs(int): CRC register, CRC_INIT to start.
+        data(bytes): data bytes.
+
+    Returns:
+        int: CRC register.
+    """
+    for b in iter(data):
+        index = (fcs ^ b) & 0xff
+        fcs = (fcs >> 8) ^ CRC_TAB[index]
+    return fcs
+
+
 def crc16(data):
-    fcs = 0xffff
+    # Loop is not shared with crc16_update to save a call on the hot path.
+    fcs = CRC_INIT
     for b in iter(data):
         index = (fcs ^ b) & 0xff
         fcs = (fcs >> 8) ^ CRC_TAB[index]
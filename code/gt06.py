@@ -25,74 +25,230 @@
 """
 
 import usys
-import utime
 import _thread
 import osTimer
 from misc import Power
 
 from usr.logging import getLogger
-from usr.common import SocketBase
-from usr.gt06_msg import GT06MsgParse, T01, T12, T13, T15, T16
+from usr.gt06_ack import AckWaiter
+from usr.timer_wheel import TimerWheel
+from usr.common import SocketBase, get_dispatcher
+from usr.gt06_core import GT06Protocol, EVENT_COMMAND, check_location, check_device_status
+from usr.gt06_endpoint import EndpointPool
 
 logger = getLogger(__name__)
 
+# Protocol numbers of messages which have server response.
+_ACK_PROTOCOL_NOS = (0x01, 0x13, 0x16)
+
+_timer_service = None
+_timer_service_lock = _thread.allocate_lock()
+
+
+class TimerService(object):
+    """This class runs a timer wheel by one osTimer.
+
+    The osTimer is armed for the earliest timer only, so timers of all GT06 objects need one osTimer.
+    """
+
+    def __init__(self, wheel=None):
+        """
+        Args:
+            wheel(TimerWheel): timer wheel, a new one is created if None. (default: {None})
+        """
+        self.__wheel = wheel if wheel is not None else TimerWheel()
+        self.__timer = osTimer()
+        self.__lock = _thread.allocate_lock()
+        self.__armed = None
+
+    def __arm(self):
+        """Arm osTimer if the earliest timer is earlier than the armed time."""
+        delay = self.__wheel.next_delay()
+        with self.__lock:
+            if delay is None:
+                return
+            expires = self.__wheel.now() + delay
+            if self.__armed is not None and self.__armed <= expires:
+                return
+            self.__timer.stop()
+            self.__armed = expires
+            self.__timer.start(max(delay, 1), 0, self.__run)
+
+    def __run(self, args):
+        with self.__lock:
+            self.__armed = None
+        self.__wheel.advance()
+        self.__arm()
+
+    def now(self):
+        """Get timer wheel clock time.
+
+        Returns:
+            int: monotonic time. unit: ms.
+        """
+        return self.__wheel.now()
+
+    def call_later(self, delay, func, *args):
+        """Run function in osTimer callback after delay.
+
+        Args:
+            delay(int): unit: ms.
+            func(function): function to run.
+            args: function args.
+
+        Returns:
+            Timer: timer handle, it can be cancelled.
+        """
+        timer = self.__wheel.schedule(delay, func, *args)
+        self.__arm()
+        return timer
+
+
+def get_timer_service():
+    """Get the timer service shared by all GT06 objects which are not in a session manager.
+
+    Returns:
+        TimerService: timer service object.
+    """
+    global _timer_service
+    with _timer_service_lock:
+        if _timer_service is None:
+            _timer_service = TimerService()
+    return _timer_service
+
 
 class GT06(SocketBase):
     """This class is option for GT06 protocol."""
 
-    def __init__(self, ip=None, port=None, domain=None, timeout=5, retry_count=3, life_time=180):
+    def __init__(self, ip=None, port=None, domain=None, timeout=5, retry_count=3, life_time=180, window_size=4, queue=None, linger=0,
+                 dispatcher=None, manager=None, piggyback=False, resolver=None,
+                 endpoints=None, capture=None):
         """
         Args:
             ip: server ip address (default: {None})
             port: server port (default: {None})
             domain: server domain (default: {None})
-            timeout: socket read data timeout. (default: {5})
-            retry_count: socket send data retry count. (default: {3})
-            life_time: heart beat recycle time. (default: {180})
+            timeout: initial server response timeout, then the timeout is estimated by round trip time. (default: {5})
+            retry_count: socket connect and send data retry count. (default: {3})
+            life_time: heart beat is sent when the link is idle for this time. unit: second. (default: {180})
+            window_size: max in flight requests waiting for server response of one protocol number. (default: {4})
+            queue: GT06Queue object, location and device status messages are saved in it when they can not be sent,
+                and they are sent after login success. (default: {None})
+            linger: time to wait for more messages before socket write, messages sent at the same time are written
+                together. unit: ms. (default: {0})
+            dispatcher: CallbackDispatcher object to run server command callback, the shared dispatcher is used
+                when callback is set if it is None. (default: {None})
+            manager: GT06SessionManager object, server data and timers of this session are serviced by the manager
+                thread instead of a downlink thread and timer of its own. (default: {None})
+            piggyback: when device status is changed, the next location report carries it as 0x16 instead of
+                waiting for a heart beat. (default: {False})
+            resolver: Resolver object to resolve domain, the shared resolver is used if None. Reconnect selects
+                server address again from the cached DNS result. (default: {None})
+            endpoints: server list instead of ip, port and domain, each item is (host, port), host is ip address
+                or domain, or an EndpointPool object. The server is selected by login round trip time before each
+                connect, and the next server is tried when connect or login failed. (default: {None})
+            capture: WireCapture object to record socket bytes for replay, nothing is recorded if None. (default: {None})
             imei: device imei number. (default: {""})
         """
-        super().__init__(ip=ip, port=port, domain=domain, method="TCP")
-        self.__timeout = timeout
+        super().__init__(ip=ip, port=port, domain=domain, method="TCP", linger=linger, resolver=resolver, capture=capture)
         self.__retry_count = retry_count
-        self.__life_time = life_time
-        self.__response_res = {}
+        self.__window_size = window_size
+        self.__core = GT06Protocol(retry_count=retry_count, life_time=life_time, window_size=window_size, timeout=timeout * 1000,
+                                   piggyback=piggyback)
+        self.__core_lock = _thread.allocate_lock()
+        # Protocol core deadlines and timers use the clock of the shared timer wheel.
+        self.__timers = manager.get_reactor() if manager is not None else get_timer_service()
+        self.__waiters = {}
+        self.__manager = manager
+        self.__timer = None
+        self.__timer_deadline = None
         self.__read_thread = None
-        self.__heart_beat_timer = osTimer()
-        self.__heart_beat_is_running = False
-        self.__power_restart_timer = osTimer()
+        self.__power_restart_timer = None
+        self.__supervisor = None
         self.__callback = None
-        self.__device_status = (0, 0, 0, 0, 0, 0, 0, 0)
-
-    def __get_packet_from_message(self, message):
-        msgs = list(bytearray(message))
-        start_indexs = []
-        end_indexs = []
-        first_index = 0
-        for index, item in enumerate(msgs):
-            if index + 1 < len(msgs):
-                if item == 0x78 and msgs[index + 1] == 0x78:
-                    start_indexs.append(index)
-                elif item == 0x0D and msgs[index + 1] == 0x0A:
-                    end_indexs.append(index + 1)
-
-                if start_indexs and not end_indexs:
-                    first_index = 0
-                elif not start_indexs and end_indexs:
-                    first_index = 1
-        if first_index == 1:
-            end_indexs.pop(0)
-
-        packets = []
-        for index, item in enumerate(start_indexs):
-            if index < len(end_indexs):
-                packets.append(bytearray(msgs[index:end_indexs[index] + 1]))
-
-        if len(start_indexs) > len(end_indexs):
-            message = bytearray(msgs[start_indexs[-1]:]).decode().encode()
-        else:
-            message = b""
+        self.__dispatcher = dispatcher
+        self.__commands = []
+        self.__queue = queue
+        self.__replay_lock = _thread.allocate_lock()
+        self.__endpoints = None
+        self.__endpoint = None
+        if endpoints is not None:
+            self.__endpoints = endpoints if isinstance(endpoints, EndpointPool) else EndpointPool(endpoints)
+
+    def __process(self, now):
+        """Handle protocol core events, arm timer for core deadline and get core output data.
+
+        Core lock must be held. The output data is written by `__write` after core lock is released,
+        so that data of different threads can be written together.
+
+        Args:
+            now(int): monotonic time. unit: ms.
+
+        Returns:
+            bytes: data to send.
+        """
+        for event in self.__core.events():
+            if event.type == EVENT_COMMAND:
+                self.__commands.append(event.msg_info.to_dict())
+            else:
+                waiter = self.__waiters.pop((event.protocol_no, event.msg_no), None)
+                if waiter is not None:
+                    waiter._complete(event.msg_info, event.rtt)
+
+        deadline = self.__core.next_deadline()
+        if deadline != self.__timer_deadline:
+            self.__timer_deadline = deadline
+            if self.__manager is not None:
+                self.__manager._schedule(self, deadline - now if deadline is not None else None)
+            else:
+                if self.__timer is not None:
+                    self.__timer.cancel()
+                    self.__timer = None
+                if deadline is not None:
+                    self.__timer = self.__timers.call_later(deadline - now, self.__core_timer, None)
+        return self.__core.data_to_send()
+
+    def __write(self, data):
+        """Write protocol core output data to socket.
+
+        Args:
+            data(bytes): data to send.
+
+        Returns:
+            bool: True - success or nothing to send, False - failed.
+        """
+        if not data:
+            return True
+        send_res = self._send(data)
+        logger.debug("_send res: %s" % send_res)
+        return send_res
 
-        return packets, message
+    def __core_timer(self, args):
+        """Protocol core timer callback, retransmit requests and send heart beat.
+
+        Args:
+            args: useless.
+        """
+        with self.__core_lock:
+            now = self.__timers.now()
+            self.__timer = None
+            self.__timer_deadline = None
+            self.__core.tick(now)
+            data = self.__process(now)
+        self.__write(data)
+
+    def __register(self, protocol_no, msg_no):
+        """Register a waiter for server response, core lock must be held.
+
+        Returns:
+            AckWaiter: request waiter.
+        """
+        waiter = AckWaiter(protocol_no, msg_no)
+        old_waiter = self.__waiters.pop((protocol_no, msg_no), None)
+        if old_waiter is not None:
+            old_waiter._complete(None)
+        self.__waiters[(protocol_no, msg_no)] = waiter
+        return waiter
 
     def __read_response(self):
         """This function is downlink thread function.
@@ -101,85 +257,133 @@ class GT06(SocketBase):
             1. receive server response.
             2. receive server request.
         """
-        message = b""
         while True:
             try:
                 if self.status() not in (0, 1):
-                    logger.error("%s connection status is %s" % (self.__method, self.status()))
+                    logger.error("GT06 connection status is %s" % self.status())
+                    self.__read_thread = None
+                    self.__connection_lost()
+                    self.__notify_lost()
                     break
 
-                # When read data is empty, discard message's data
-                new_msg = self.__read()
-                if new_msg:
-                    message += new_msg
-                else:
-                    message = new_msg
-
-                if message:
-                    self._heart_beat_timer_stop()
-                    packets, message = self.__get_packet_from_message(message)
-
-                    # Parse each packet in order
-                    for msg in packets:
-                        logger.debug("__read_response: %s" % msg)
-                        gt_msg_parse = GT06MsgParse()
-                        if gt_msg_parse.set_msg(msg):
-                            msg_info = gt_msg_parse.get_msg_info()
-                            logger.debug("__read_response msg_info: %s" % msg_info)
-                            if msg_info["protocol_no"] == 0x80:
-                                if self.__callback:
-                                    _thread.start_new_thread(self.__callback, (msg_info,))
-                                else:
-                                    raise OSError("callback funcion is not exists!")
-                            else:
-                                self.__response_res[msg_info["protocol_no"]] = {msg_info["msg_no"]: msg_info}
-
+                data = self._read()
+                if data:
+                    self.__receive(data)
             except Exception as e:
                 usys.print_exception(e)
 
-    def __get_response(self, protocol_no, msg_no):
-        """Get server response data.
+    def __receive(self, data):
+        """Feed server data to protocol core, then send response and dispatch server commands."""
+        with self.__core_lock:
+            now = self.__timers.now()
+            self.__core.receive_data(data, now)
+            data = self.__process(now)
+        self.__write(data)
+        self.__dispatch_commands()
+
+    def __connection_lost(self):
+        """Complete all requests waiting for server response as failed."""
+        with self.__core_lock:
+            now = self.__timers.now()
+            self.__core.connection_lost(now)
+            self.__process(now)
+
+    def __notify_lost(self):
+        """Tell reconnect supervisor that connection is lost by server or network."""
+        if self.__supervisor is not None:
+            self.__supervisor._connection_lost()
+
+    def _set_supervisor(self, supervisor):
+        """Set reconnect supervisor, it is called by `ReconnectSupervisor`.
+
+        Power restart timer started by a failed connect before is stopped, the supervisor keeps reconnecting.
+        """
+        self.__supervisor = supervisor
+        if supervisor is not None:
+            self._power_restart_timer_stop()
 
-        Args:
-            protocol_no(int): server response message id.
-            msg_no(int): terminal request serial number.
+    def _get_timers(self):
+        """Get timers of this object, reactor of session manager or the shared timer service."""
+        return self.__timers
+
+    def _readable(self):
+        """Read server data when socket is readable, this function is called by session manager thread.
 
         Returns:
-            bool: True - success, False - falied
+            bool: True - success, False - connection is closed.
         """
-        response_res = False
-        count = 0
-        while count < self.__timeout * 10:
-            if self.status() != 0:
-                break
-            if self.__response_res.get(protocol_no) is not None:
-                if self.__response_res[protocol_no].get(msg_no) is not None:
-                    response_res = self.__response_res[protocol_no].pop(msg_no)
-                    if self.__response_res.get(protocol_no) is not None:
-                        self.__response_res.pop(protocol_no)
-                    break
-                elif self.__response_res[protocol_no].get(protocol_no) is not None:
-                    response_res = self.__response_res[protocol_no].pop(protocol_no)
-                    if self.__response_res.get(protocol_no) is not None:
-                        self.__response_res.pop(protocol_no)
-                    break
-            utime.sleep_ms(100)
-            count += 1
-        return response_res
+        try:
+            data = self._read()
+            if data:
+                self.__receive(data)
+                return True
+        except Exception as e:
+            usys.print_exception(e)
+        logger.error("GT06 connection is closed, status is %s" % self.status())
+        self.__connection_lost()
+        self.__notify_lost()
+        return False
+
+    def _timeout(self):
+        """Protocol core deadline is reached, this function is called by session manager thread."""
+        self.__core_timer(None)
+
+    def __dispatch_commands(self):
+        """Submit server commands to dispatcher in receive order, core lock must not be held."""
+        while self.__commands:
+            msg_info = self.__commands.pop(0)
+            if self.__callback:
+                self.__dispatcher.submit(self.__callback, (msg_info,), key=id(self))
+            else:
+                logger.error("callback funcion is not exists!")
+
+    def __power_restart(self, args):
+        Power.powerRestart()
 
-    def __heart_beat(self, args):
-        """Heart beat to server.
+    def __send_or_save(self, data, protocol_no, msg_no):
+        """Send data to server, save data to queue if connection is not ready or send failed.
 
         Args:
-            args: useless.
+            data(bytes): message info
+            protocol_no(int): server response protocol no
+            msg_no(int): this send message serial number.
+
+        Returns:
+            bool: True - success or saved to queue, False - failed.
         """
         if self.status() == 0:
-            self.report_device_status()
-        else:
-            self._heart_beat_timer_stop()
+            send_res = self.send(data, protocol_no, msg_no)
+            if send_res or self.__queue is None:
+                return send_res
+        if self.__queue is not None:
+            logger.debug("Save message to queue, msg_no: %s" % msg_no)
+            return self.__queue.put(data)
+        return False
 
-    def __power_restart(self, args):
-        Power.powerRestart()
+    def __replay_queue(self):
+        """Send messages saved in queue to server by batch, until queue is empty or send failed."""
+        if not self.__replay_lock.acquire(0):
+            return
+        try:
+            while self.status() == 0:
+                msgs = self.__queue.peek(self.__window_size * 4)
+                if not msgs:
+                    break
+                batch = []
+                for _, data in msgs:
+                    protocol_no = data[3] if data[3] in _ACK_PROTOCOL_NOS else None
+                    # Saved serial number may collide with live messages, send it with a new one.
+                    msg_no, data = self.__core.get_resend_msg(data)
+                    batch.append((data, protocol_no, msg_no))
+                results = self.send_batch(batch)
+                logger.debug("__replay_queue results: %s" % results)
+                if False in results:
+                    break
+                self.__queue.pop(len(msgs))
+        except Exception as e:
+            usys.print_exception(e)
+        finally:
+            self.__replay_lock.release()
 
     def __format_gps_lbs(self, date_time, satellite_num, latitude, longitude, speed, course, lat_ns, lon_ew, gps_onoff, is_real_time,
                          mcc, mnc, lac, cell_id):
@@ -215,93 +419,179 @@ class GT06(SocketBase):
             bool: True - success, False - failed.
         """
         try:
-            if len(date_time) != 12:
-                raise ValueError("date_time format error.")
-            if satellite_num < 0 or satellite_num > 15:
-                raise ValueError("Satellite numbers range is [0, 15]")
-            if speed < 0 or speed > 255:
-                raise ValueError("speed range is [0, 255]")
-            if course < 0 and course > 359:
-                raise ValueError("course range is [0, 359]")
-            if lat_ns not in (0, 1):
-                raise ValueError("lat_ns is not in (0, 1).")
-            if lon_ew not in (0, 1):
-                raise ValueError("lon_ew is not in (0, 1).")
-            if gps_onoff not in (0, 1):
-                raise ValueError("gps_onoff is not in (0, 1).")
-            if is_real_time not in (0, 1):
-                raise ValueError("is_real_time is not in (0, 1).")
-
             _gps = (date_time, satellite_num, latitude, longitude, speed, course, lat_ns, lon_ew, gps_onoff, is_real_time)
             _lbs = (mcc, mnc, lac, cell_id)
+            check_location(_gps, _lbs)
             return (_gps, _lbs)
         except Exception as e:
             usys.print_exception(e)
             return ()
 
     def _downlink_thread_start(self):
-        self.__read_thread = _thread.start_new_thread(self.__read_response, ())
+        with self.__core_lock:
+            self.__core.connection_made(self.__timers.now())
+        if self.__manager is not None:
+            self.__manager._register(self)
+        else:
+            self.__read_thread = _thread.start_new_thread(self.__read_response, ())
 
     def _downlink_thread_stop(self):
-        if self.__read_thread is not None:
+        if self.__manager is not None:
+            self.__manager._unregister(self)
+        elif self.__read_thread is not None:
             _thread.stop_thread(self.__read_thread)
             self.__read_thread = None
-
-    def _heart_beat_timer_start(self):
-        self.__heart_beat_timer.start(self.__life_time * 1000, 1, self.__heart_beat)
-        self.__heart_beat_is_running = True
-
-    def _heart_beat_timer_stop(self):
-        self.__heart_beat_timer.stop()
-        self.__heart_beat_is_running = False
+        self.__connection_lost()
 
     def _power_restart_timer_start(self):
-        self.__power_restart_timer.start(2 * 6 * 10 ** 5, 0, self.__power_restart)
+        if self.__manager is None and self.__power_restart_timer is None:
+            self.__power_restart_timer = self.__timers.call_later(2 * 6 * 10 ** 5, self.__power_restart, None)
 
     def _power_restart_timer_stop(self):
-        self.__power_restart_timer.stop()
+        if self.__power_restart_timer is not None:
+            self.__power_restart_timer.cancel()
+            self.__power_restart_timer = None
 
     def connect(self):
         """Device connect to server.
 
         While connect failed and retry count greater than 3, start device power restart after 20 munites.
         If user retry this funcion and connect success, then stop device power restart timer.
+        When a `ReconnectSupervisor` is set, connect is tried only once and the device is not restarted,
+        the supervisor retries connecting with backoff.
+        When endpoints are set, each retry connects the next selected server, and every server is tried
+        at least once before giving up.
         """
         try_num = 0
         conn_res = False
+        retry_count = self.__retry_count
+        if self.__supervisor is not None:
+            retry_count = 0
+        elif self.__endpoints is not None:
+            retry_count = max(retry_count, self.__endpoints.size() - 1)
         while True:
-            conn_res = super().connect()
+            if self.__endpoints is not None:
+                self.__endpoint = self.__endpoints.select()
+                logger.debug("Connect endpoint %s:%s" % self.__endpoint)
+                conn_res = self._set_server(*self.__endpoint) and super().connect()
+                if not conn_res:
+                    self.__endpoints.report(self.__endpoint, ok=False)
+            else:
+                conn_res = super().connect()
             if conn_res:
-                self._heart_beat_timer_stop()
                 break
             else:
                 try_num += 1
-                if try_num > self.__retry_count:
-                    self._power_restart_timer_start()
+                if try_num > retry_count:
+                    if self.__supervisor is None:
+                        self._power_restart_timer_start()
                     break
         return conn_res
 
+    def disconnect(self):
+        """Disconnect server, session socket is unregistered from manager before it is closed.
+
+        Returns:
+            bool: True - success, False - failed
+        """
+        if self.__manager is not None:
+            self.__manager._unregister(self)
+        return super().disconnect()
+
     def send(self, data, protocol_no, msg_no):
         """Send data to server
 
+        Requests which have server response are retransmitted with the same serial number when the response
+        is timeout, until retry count is reached. The timeout is estimated by round trip time.
+
         Args:
             data(bytes): message info
             protocol_no(int): server response protocol no
             msg_no(int): this send message serial number.
 
         Returns:
-            dict: Return empty dict if not get server response, eles return server response data.
+            bool: True - success, False - failed. If protocol_no is not None, success means server response is received.
         """
-        send_res = self.__send(data)
-        logger.debug("__send res: %s" % send_res)
         if protocol_no is not None:
-            resp_res = self.__get_response(protocol_no, msg_no)
-            logger.debug("__get_response res: %s" % resp_res)
-            resp_res = True if resp_res else False
-        else:
-            resp_res = send_res
+            return self.send_nowait(data, protocol_no, msg_no).wait() is not None
+
+        with self.__core_lock:
+            now = self.__timers.now()
+            if not self.__core.send(data, None, msg_no, now):
+                return False
+            data = self.__process(now)
+        return self.__write(data)
+
+    def send_rtt(self, data, protocol_no, msg_no):
+        """Send data to server, wait for server response and measure round trip time.
+
+        Args:
+            data(bytes): message info
+            protocol_no(int): server response protocol no
+            msg_no(int): this send message serial number.
+
+        Returns:
+            int: round trip time from sending data (the last transmission if retransmitted) to receiving server response,
+                unit: ms. -1 if not get server response.
+        """
+        waiter = self.send_nowait(data, protocol_no, msg_no)
+        waiter.wait()
+        return waiter.rtt
+
+    def send_nowait(self, data, protocol_no, msg_no):
+        """Send data to server without waiting for server response.
+
+        Args:
+            data(bytes): message info
+            protocol_no(int): server response protocol no
+            msg_no(int): this send message serial number.
+
+        Returns:
+            AckWaiter: request waiter, call `wait` to get server response, the response is None if timeout.
+        """
+        with self.__core_lock:
+            now = self.__timers.now()
+            waiter = self.__register(protocol_no, msg_no)
+            self.__core.send(data, protocol_no, msg_no, now)
+            data = self.__process(now)
+        self.__write(data)
+        return waiter
+
+    def send_batch(self, msgs):
+        """Send messages to server by pipeline, the server responses are matched by serial number.
+
+        The messages in window are written to socket together, the others are sent when responses are received.
+
+        Args:
+            msgs(list): each item is a tuple (data, protocol_no, msg_no), protocol_no is None if no server response.
+
+        Returns:
+            list: send result of each message, True - success, False - failed or not get server response.
+        """
+        waiters = []
+        with self.__core_lock:
+            now = self.__timers.now()
+            for data, protocol_no, msg_no in msgs:
+                if protocol_no is None:
+                    waiters.append(self.__core.send(data, None, msg_no, now))
+                else:
+                    waiters.append(self.__register(protocol_no, msg_no))
+                    self.__core.send(data, protocol_no, msg_no, now)
+            data = self.__process(now)
+        send_res = self.__write(data)
+        return [(i and send_res) if isinstance(i, bool) else i.wait() is not None for i in waiters]
 
-        return resp_res
+    def get_rto_info(self):
+        """Get server response timeout infomation estimated by round trip time.
+
+        Returns:
+            dict:
+                srtt(int): smoothed round trip time, -1 if no sample. unit: ms.
+                rttvar(int): round trip time variance, -1 if no sample. unit: ms.
+                rto(int): current server response timeout. unit: ms.
+        """
+        with self.__core_lock:
+            return self.__core.rto_info()
 
     def set_callback(self, callback):
         """Set callback for server response or request
@@ -313,10 +603,20 @@ class GT06(SocketBase):
             bool: True - success, False - falied.
         """
         if callable(callback):
+            if self.__dispatcher is None:
+                self.__dispatcher = get_dispatcher()
             self.__callback = callback
             return True
         return False
 
+    def get_dispatch_stats(self):
+        """Get server command callback dispatch statistics.
+
+        Returns:
+            dict: see `CallbackDispatcher.stats`, empty if callback is not set.
+        """
+        return self.__dispatcher.stats() if self.__dispatcher is not None else {}
+
     def set_device_status(self, defend=0, acc=0, charge=0, alarm=0, gps=0, power=0, voltage_level=0, gsm_signal=0):
         """Set device status.
 
@@ -363,24 +663,9 @@ class GT06(SocketBase):
             bool: True - success, False - failed.
         """
         try:
-            if defend not in (0, 1):
-                raise ValueError("defend is not (0, 1)")
-            if acc not in (0, 1):
-                raise ValueError("acc is not (0, 1)")
-            if charge not in (0, 1):
-                raise ValueError("charge is not (0, 1)")
-            if alarm not in (0, 1, 2, 3, 4):
-                raise ValueError("alarm is not (0, 1, 2, 3, 4)")
-            if gps not in (0, 1):
-                raise ValueError("gps is not (0, 1)")
-            if power not in (0, 1):
-                raise ValueError("power is not (0, 1)")
-            if voltage_level not in (0, 1, 2, 3, 4, 5, 6):
-                raise ValueError("voltage_level is not (0, 1, 2, 3, 4, 5, 6)")
-            if gsm_signal not in (0, 1, 2, 3, 4):
-                raise ValueError("gsm_signal is not (0, 1, 2, 3, 4)")
-
-            self.__device_status = (defend, acc, charge, alarm, gps, power, voltage_level, gsm_signal)
+            device_status = (defend, acc, charge, alarm, gps, power, voltage_level, gsm_signal)
+            check_device_status(device_status)
+            self.__core.set_device_status(device_status)
             return True
         except Exception as e:
             usys.print_exception(e)
@@ -395,17 +680,59 @@ class GT06(SocketBase):
         Returns:
             bool: True - success, False - failed.
         """
-        up_msg_obj = T01()
-        up_msg_obj.set_imei(imei)
-        msg_no, data = up_msg_obj.get_msg()
-        logger.debug("login data: %s" % data)
-        send_res = self.send(data, 0x01, msg_no)
-        logger.debug("login send res: %s" % send_res)
+        send_res = self.__login(imei)
         if send_res:
-            self._heart_beat_timer_stop()
-            self._heart_beat_timer_start()
+            if self.__queue is not None and self.__queue.size() > 0:
+                _thread.start_new_thread(self.__replay_queue, ())
         return send_res
 
+    def __login(self, imei):
+        """Send login message and report login round trip time of the connected server.
+
+        Returns:
+            bool: True - success, False - failed.
+        """
+        msg_no, data = self.__core.get_login_msg(imei)
+        logger.debug("login data: %s" % data)
+        waiter = self.send_nowait(data, 0x01, msg_no)
+        send_res = waiter.wait() is not None
+        logger.debug("login send res: %s, rtt: %s" % (send_res, waiter.rtt))
+        if self.__endpoint is not None:
+            self.__endpoints.report(self.__endpoint, waiter.rtt, send_res)
+        return send_res
+
+    def probe_endpoints(self, imei):
+        """Connect and login every server once to measure login round trip time, then disconnect.
+
+        Messages saved in queue are not sent while probing. Call `connect` and `login` after probing,
+        the fastest healthy server is selected.
+
+        Args:
+            imei(str): device imei number
+
+        Returns:
+            list: see `EndpointPool.stats`, empty if endpoints are not set.
+        """
+        if self.__endpoints is None:
+            return []
+        for endpoint in [(i["host"], i["port"]) for i in self.__endpoints.stats()]:
+            self.disconnect()
+            self.__endpoint = endpoint
+            if self._set_server(*endpoint) and super().connect():
+                self.__login(imei)
+            else:
+                self.__endpoints.report(endpoint, ok=False)
+        self.disconnect()
+        return self.__endpoints.stats()
+
+    def get_endpoint_stats(self):
+        """Get server statistics.
+
+        Returns:
+            list: see `EndpointPool.stats`, empty if endpoints are not set.
+        """
+        return self.__endpoints.stats() if self.__endpoints is not None else []
+
     def report_location(self, date_time, satellite_num, latitude, longitude, speed, course, lat_ns, lon_ew, gps_onoff, is_real_time,
                         mcc, mnc, lac, cell_id, include_device_status=False):
         """Report GPS and LBS to server.
@@ -438,7 +765,7 @@ class GT06(SocketBase):
                 False - not report device status together
 
         Returns:
-            bool: True - success, False - failed.
+            bool: True - success or saved to queue, False - failed.
         """
         _gps_lbs = self.__format_gps_lbs(
             date_time, satellite_num, latitude, longitude, speed, course, lat_ns, lon_ew, gps_onoff, is_real_time,
@@ -446,19 +773,9 @@ class GT06(SocketBase):
         )
         if _gps_lbs:
             _gps, _lbs = _gps_lbs
-            if include_device_status:
-                up_msg_obj = T16()
-                up_msg_obj.set_device_status(*self.__device_status)
-            else:
-                up_msg_obj = T12()
-            up_msg_obj.set_gps(*_gps)
-            up_msg_obj.set_lbs(*_lbs)
-            msg_no, data = up_msg_obj.get_msg()
+            protocol_no, msg_no, data = self.__core.get_location_msg(_gps, _lbs, include_device_status)
             logger.debug("report_location data: %s" % data)
-            if include_device_status:
-                send_res = self.send(data, 0x16, msg_no)
-            else:
-                send_res = self.send(data, None, msg_no)
+            send_res = self.__send_or_save(data, protocol_no, msg_no)
             logger.debug("report_location send res: %s" % send_res)
             return send_res
         return False
@@ -469,17 +786,13 @@ class GT06(SocketBase):
         Call set_device_status before call this function.
 
         Returns:
-            bool: True - success, False - failed.
+            bool: True - success or saved to queue, False - failed.
         """
-        if self.__device_status:
-            up_msg_obj = T13()
-            up_msg_obj.set_device_status(*self.__device_status)
-            msg_no, data = up_msg_obj.get_msg()
-            logger.debug("report_device_status data: %s" % data)
-            send_res = self.send(data, 0x13, msg_no)
-            logger.debug("report_device_status send res: %s" % send_res)
-            return send_res
-        return False
+        msg_no, data = self.__core.get_device_status_msg()
+        logger.debug("report_device_status data: %s" % data)
+        send_res = self.__send_or_save(data, 0x13, msg_no)
+        logger.debug("report_device_status send res: %s" % send_res)
+        return send_res
 
     def report_device_cmd(self, server_flag, cmd_data):
         """Report device command to server.
@@ -491,9 +804,7 @@ class GT06(SocketBase):
         Returns:
             bool: True - success, False - failed.
         """
-        up_msg_obj = T15()
-        up_msg_obj.set_device_cmd(server_flag, cmd_data)
-        msg_no, data = up_msg_obj.get_msg()
+        msg_no, data = self.__core.get_device_cmd_msg(server_flag, cmd_data)
         logger.debug("report_device_cmd data: %s" % data)
         send_res = self.send(data, None, msg_no)
         logger.debug("report_device_cmd send res: %s" % send_res)
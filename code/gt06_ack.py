@@ -0,0 +1,132 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :gt06_ack.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :GT06 server response waiting and timeout estimation
+@version   :1.0.0
+@date      :2026-10-17 09:12:31
+@copyright :Copyright (c) 2022
+"""
+
+import _thread
+
+
+class RtoEstimator(object):
+    """This class estimates retransmission timeout from measured round trip time.
+
+    The algorithm is the same as TCP (RFC 6298): smoothed RTT and RTT variance are updated by every valid
+    sample, the timeout is doubled by every retransmission until a new sample is got.
+    """
+
+    def __init__(self, init_rto=3000, min_rto=1000, max_rto=60000):
+        """
+        Args:
+            init_rto(int): timeout before any RTT sample. unit: ms. (default: {3000})
+            min_rto(int): min timeout. unit: ms. (default: {1000})
+            max_rto(int): max timeout. unit: ms. (default: {60000})
+        """
+        self.__min_rto = min_rto
+        self.__max_rto = max_rto
+        self.__srtt = -1
+        self.__rttvar = -1
+        self.__rto = max(min(init_rto, max_rto), min_rto)
+
+    def sample(self, rtt):
+        """Update estimator by a RTT sample.
+
+        Do not sample the response of a retransmitted request, it can not tell which transmission is responded.
+
+        Args:
+            rtt(int): round trip time. unit: ms.
+        """
+        if self.__srtt < 0:
+            self.__srtt = rtt
+            self.__rttvar = rtt // 2
+        else:
+            self.__rttvar = (3 * self.__rttvar + abs(self.__srtt - rtt)) // 4
+            self.__srtt = (7 * self.__srtt + rtt) // 8
+        rto = self.__srtt + max(10, 4 * self.__rttvar)
+        self.__rto = max(min(rto, self.__max_rto), self.__min_rto)
+
+    def backoff(self):
+        """Double timeout after a request is timeout."""
+        self.__rto = min(self.__rto * 2, self.__max_rto)
+
+    def rto(self):
+        """Get current retransmission timeout.
+
+        Returns:
+            int: timeout. unit: ms.
+        """
+        return self.__rto
+
+    def info(self):
+        """Get estimator infomation.
+
+        Returns:
+            dict:
+                srtt(int): smoothed round trip time, -1 if no sample. unit: ms.
+                rttvar(int): round trip time variance, -1 if no sample. unit: ms.
+                rto(int): retransmission timeout. unit: ms.
+        """
+        return {"srtt": self.__srtt, "rttvar": self.__rttvar, "rto": self.__rto}
+
+
+class AckWaiter(object):
+    """This class is one request waiting for server response."""
+
+    def __init__(self, protocol_no, msg_no, callback=None):
+        """
+        Args:
+            protocol_no(int): server response protocol number.
+            msg_no(int): request message serial number.
+            callback(function): called with this waiter when waiting is completed. (default: {None})
+        """
+        self.protocol_no = protocol_no
+        self.msg_no = msg_no
+        self.response = None
+        self.rtt = -1
+        self.done = False
+        self.__callback = callback
+        self.__lock = _thread.allocate_lock()
+        self.__lock.acquire()
+
+    def _complete(self, response, rtt=-1):
+        """Complete waiting, called only once.
+
+        Args:
+            response: server response message info, None means timeout or connection lost.
+            rtt(int): round trip time. unit: ms. (default: {-1})
+        """
+        self.done = True
+        self.response = response
+        self.rtt = rtt
+        self.__lock.release()
+        if self.__callback is not None:
+            self.__callback(self)
+
+    def wait(self):
+        """Block until server response, timeout or connection lost.
+
+        Returns:
+            object: server response message info, None if not get server response.
+        """
+        self.__lock.acquire()
+        self.__lock.release()
+        return self.response
@@ -0,0 +1,387 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :gt06_async.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :GT06 Protocol Client on asyncio
+@version   :1.0.0
+@date      :2026-10-17 16:02:48
+@copyright :Copyright (c) 2022
+"""
+
+import usys
+
+try:
+    import uasyncio as asyncio
+except ImportError:
+    import asyncio
+
+from usr.logging import getLogger
+from usr.common import MonotonicClock
+from usr.gt06_core import GT06Protocol, EVENT_COMMAND, check_location, check_device_status
+
+logger = getLogger(__name__)
+
+
+class _AsyncWaiter(object):
+    """Request waiting for server response in event loop."""
+
+    def __init__(self):
+        self.response = None
+        self.rtt = -1
+        self.event = asyncio.Event()
+
+
+class AsyncGT06(object):
+    """This class is GT06 protocol client running in one asyncio/uasyncio event loop.
+
+    It uses stream reader and writer instead of downlink thread, and a keepalive coroutine instead of timers,
+    so many clients can run in one event loop without threads.
+    """
+
+    def __init__(self, ip=None, port=None, domain=None, timeout=5, retry_count=3, life_time=180, window_size=4, piggyback=False):
+        """
+        Args:
+            ip: server ip address (default: {None})
+            port: server port (default: {None})
+            domain: server domain (default: {None})
+            timeout: initial server response timeout, then the timeout is estimated by round trip time. (default: {5})
+            retry_count: send data retry count. (default: {3})
+            life_time: heart beat is sent when the link is idle for this time. unit: second. (default: {180})
+            window_size: max in flight requests waiting for server response of one protocol number. (default: {4})
+            piggyback: when device status is changed, the next location report carries it as 0x16 instead of
+                waiting for a heart beat. (default: {False})
+        """
+        self.__host = domain if domain else ip
+        self.__port = port
+        self.__core = GT06Protocol(retry_count=retry_count, life_time=life_time, window_size=window_size, timeout=timeout * 1000,
+                                   piggyback=piggyback)
+        self.__clock = MonotonicClock()
+        self.__reader = None
+        self.__writer = None
+        self.__tasks = []
+        self.__callback_tasks = set()
+        self.__waiters = {}
+        self.__wake = asyncio.Event()
+        self.__callback = None
+
+    def __process(self):
+        """Handle protocol core events and get core output data.
+
+        Returns:
+            bytes: data to send.
+        """
+        for event in self.__core.events():
+            if event.type == EVENT_COMMAND:
+                if self.__callback:
+                    res = self.__callback(event.msg_info.to_dict())
+                    if res is not None and hasattr(res, "send"):
+                        # Event loop keeps only weak reference of task, keep it until it is done.
+                        self.__callback_tasks.add(asyncio.create_task(self.__run_callback(res)))
+                else:
+                    logger.error("callback funcion is not exists!")
+            else:
+                waiter = self.__waiters.pop((event.protocol_no, event.msg_no), None)
+                if waiter is not None:
+                    waiter.response = event.msg_info
+                    waiter.rtt = event.rtt
+                    waiter.event.set()
+        # Next deadline may be changed, wake keepalive coroutine.
+        self.__wake.set()
+        return self.__core.data_to_send()
+
+    async def __run_callback(self, coro):
+        """Run coroutine returned by callback and forget its task when it is done."""
+        try:
+            await coro
+        except Exception as e:
+            usys.print_exception(e)
+        finally:
+            self.__callback_tasks.discard(asyncio.current_task())
+
+    async def __flush(self):
+        """Write protocol core output data.
+
+        Returns:
+            bool: True - success or nothing to send, False - failed.
+        """
+        data = self.__process()
+        if not data:
+            return True
+        try:
+            self.__writer.write(data)
+            await self.__writer.drain()
+            return True
+        except Exception as e:
+            usys.print_exception(e)
+            self.__connection_lost()
+            return False
+
+    def __connection_lost(self):
+        if self.__writer is not None:
+            self.__core.connection_lost(self.__clock.now())
+            self.__process()
+            self.__writer = None
+            self.__reader = None
+
+    async def __read_loop(self):
+        """Receive server response and server request."""
+        try:
+            while self.__reader is not None:
+                data = await self.__reader.read(1024)
+                if not data:
+                    logger.error("GT06 connection is closed by server.")
+                    break
+                self.__core.receive_data(data, self.__clock.now())
+                await self.__flush()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            usys.print_exception(e)
+        writer = self.__writer
+        self.__connection_lost()
+        if writer is not None:
+            try:
+                writer.close()
+                await writer.wait_closed()
+            except Exception as e:
+                usys.print_exception(e)
+
+    async def __keepalive_loop(self):
+        """Call protocol core tick at its deadline to retransmit requests and send heart beat."""
+        while self.__writer is not None:
+            deadline = self.__core.next_deadline()
+            self.__wake.clear()
+            if deadline is None:
+                await self.__wake.wait()
+                continue
+            delay = deadline - self.__clock.now()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self.__wake.wait(), delay / 1000)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            self.__core.tick(self.__clock.now())
+            await self.__flush()
+
+    def __register(self, protocol_no, msg_no):
+        waiter = _AsyncWaiter()
+        old_waiter = self.__waiters.pop((protocol_no, msg_no), None)
+        if old_waiter is not None:
+            old_waiter.event.set()
+        self.__waiters[(protocol_no, msg_no)] = waiter
+        return waiter
+
+    def status(self):
+        """Get connection status
+
+        Returns:
+            [int]:
+                0: Connected
+                2: Disconnect
+        """
+        return 0 if self.__writer is not None else 2
+
+    async def connect(self):
+        """Connect server and start read and keepalive coroutines.
+
+        The coroutines and connection of last connect are stopped first.
+
+        Returns:
+            bool: True - success, False - failed
+        """
+        if self.__tasks or self.__writer is not None:
+            await self.disconnect()
+        try:
+            self.__reader, self.__writer = await asyncio.open_connection(self.__host, self.__port)
+        except Exception as e:
+            usys.print_exception(e)
+            return False
+        self.__core.connection_made(self.__clock.now())
+        self.__tasks = [asyncio.create_task(self.__read_loop()), asyncio.create_task(self.__keepalive_loop())]
+        return True
+
+    async def disconnect(self):
+        """Disconnect server and stop coroutines.
+
+        Returns:
+            bool: True - success, False - failed
+        """
+        for task in self.__tasks:
+            task.cancel()
+        self.__tasks = []
+        writer = self.__writer
+        self.__connection_lost()
+        if writer is not None:
+            try:
+                writer.close()
+                await writer.wait_closed()
+            except Exception as e:
+                usys.print_exception(e)
+                return False
+        return True
+
+    async def send(self, data, protocol_no, msg_no):
+        """Send data to server
+
+        Args:
+            data(bytes): message info
+            protocol_no(int): server response protocol no
+            msg_no(int): this send message serial number.
+
+        Returns:
+            bool: True - success, False - failed. If protocol_no is not None, success means server response is received.
+        """
+        if protocol_no is not None:
+            return await self.send_rtt(data, protocol_no, msg_no) >= 0
+        if not self.__core.send(data, None, msg_no, self.__clock.now()):
+            return False
+        return await self.__flush()
+
+    async def send_rtt(self, data, protocol_no, msg_no):
+        """Send data to server, wait for server response and measure round trip time.
+
+        Args:
+            data(bytes): message info
+            protocol_no(int): server response protocol no
+            msg_no(int): this send message serial number.
+
+        Returns:
+            int: round trip time, unit: ms. -1 if not get server response.
+        """
+        waiter = self.__register(protocol_no, msg_no)
+        self.__core.send(data, protocol_no, msg_no, self.__clock.now())
+        await self.__flush()
+        await waiter.event.wait()
+        return waiter.rtt if waiter.response is not None else -1
+
+    async def send_batch(self, msgs):
+        """Send messages to server by pipeline, the server responses are matched by serial number.
+
+        Args:
+            msgs(list): each item is a tuple (data, protocol_no, msg_no), protocol_no is None if no server response.
+
+        Returns:
+            list: send result of each message, True - success, False - failed or not get server response.
+        """
+        now = self.__clock.now()
+        waiters = []
+        for data, protocol_no, msg_no in msgs:
+            if protocol_no is None:
+                waiters.append(self.__core.send(data, None, msg_no, now))
+            else:
+                waiters.append(self.__register(protocol_no, msg_no))
+                self.__core.send(data, protocol_no, msg_no, now)
+        send_res = await self.__flush()
+        results = []
+        for waiter in waiters:
+            if isinstance(waiter, bool):
+                results.append(waiter and send_res)
+            else:
+                await waiter.event.wait()
+                results.append(waiter.response is not None)
+        return results
+
+    def get_rto_info(self):
+        """Get server response timeout infomation estimated by round trip time.
+
+        Returns:
+            dict: srtt, rttvar, rto. unit: ms.
+        """
+        return self.__core.rto_info()
+
+    def set_callback(self, callback):
+        """Set callback for server request, the callback can be a function or a coroutine function.
+
+        Args:
+            callback(function): user callback function.
+
+        Returns:
+            bool: True - success, False - falied.
+        """
+        if callable(callback):
+            self.__callback = callback
+            return True
+        return False
+
+    def set_device_status(self, defend=0, acc=0, charge=0, alarm=0, gps=0, power=0, voltage_level=0, gsm_signal=0):
+        """Set device status used by heart beat, args are the same as GT06.set_device_status.
+
+        Returns:
+            bool: True - success, False - failed.
+        """
+        device_status = (defend, acc, charge, alarm, gps, power, voltage_level, gsm_signal)
+        try:
+            check_device_status(device_status)
+        except Exception as e:
+            usys.print_exception(e)
+            return False
+        self.__core.set_device_status(device_status)
+        return True
+
+    async def login(self, imei):
+        """Device login server.
+
+        Args:
+            imei(str): device imei number
+
+        Returns:
+            bool: True - success, False - failed.
+        """
+        msg_no, data = self.__core.get_login_msg(imei)
+        return await self.send(data, 0x01, msg_no)
+
+    async def report_location(self, date_time, satellite_num, latitude, longitude, speed, course, lat_ns, lon_ew, gps_onoff, is_real_time,
+                              mcc, mnc, lac, cell_id, include_device_status=False):
+        """Report GPS and LBS to server, args are the same as GT06.report_location.
+
+        Returns:
+            bool: True - success, False - failed.
+        """
+        _gps = (date_time, satellite_num, latitude, longitude, speed, course, lat_ns, lon_ew, gps_onoff, is_real_time)
+        _lbs = (mcc, mnc, lac, cell_id)
+        try:
+            check_location(_gps, _lbs)
+        except Exception as e:
+            usys.print_exception(e)
+            return False
+        protocol_no, msg_no, data = self.__core.get_location_msg(_gps, _lbs, include_device_status)
+        return await self.send(data, protocol_no, msg_no)
+
+    async def report_device_status(self):
+        """Report device status to server.
+
+        Returns:
+            bool: True - success, False - failed.
+        """
+        msg_no, data = self.__core.get_device_status_msg()
+        return await self.send(data, 0x13, msg_no)
+
+    async def report_device_cmd(self, server_flag, cmd_data):
+        """Report device command to server.
+
+        Args:
+            server_flag(int): this data is from server command message.
+            cmd_data(str): device command data(This data format is provided by server.)
+
+        Returns:
+            bool: True - success, False - failed.
+        """
+        msg_no, data = self.__core.get_device_cmd_msg(server_flag, cmd_data)
+        return await self.send(data, None, msg_no)
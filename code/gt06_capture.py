@@ -0,0 +1,175 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :gt06_capture.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :Socket byte stream capture file
+@version   :1.0.0
+@date      :2026-10-17 03:58:12
+@copyright :Copyright (c) 2022
+"""
+
+import usys
+import _thread
+
+from usr.logging import getLogger
+from usr.common import MonotonicClock, CAPTURE_OUT, CAPTURE_IN, CAPTURE_CONNECT, CAPTURE_CLOSE
+from usr.gt06_msg import pack_int
+
+logger = getLogger(__name__)
+
+# File format: magic + records, record: type(1) + time(4) + length(2) + data, integers are big-endian.
+_MAGIC = b"GT06CAP1"
+_RECORD_HEAD_SIZE = 7
+_MAX_CHUNK = 0xFFFF
+
+
+class WireCapture(object):
+    """This class records socket bytes to a capture file.
+
+    Set it to `SocketBase` by `capture` arg or `set_capture`, every socket write, read, connect and close is
+    recorded with the time since capture start. Records are buffered and written to file when the buffer is
+    full or the connection is closed. Recording stops when the file reaches max size.
+    """
+
+    def __init__(self, path, max_size=512 * 1024, buffer_size=1024):
+        """
+        Args:
+            path(str): capture file path.
+            max_size(int): max file size. unit: byte. (default: {512 * 1024})
+            buffer_size(int): records are written to file when buffer reaches this size. unit: byte. (default: {1024})
+        """
+        self.__path = path
+        self.__max_size = max_size
+        self.__buffer_size = buffer_size
+        self.__clock = MonotonicClock()
+        self.__lock = _thread.allocate_lock()
+        self.__buffer = bytearray()
+        self.__file = open(path, "wb")
+        self.__file.write(_MAGIC)
+        self.__size = len(_MAGIC)
+        self.__stats = {"records": 0, "bytes": 0, "dropped": 0}
+
+    def __write(self):
+        """Write buffer to file, lock must be held."""
+        if self.__buffer and self.__file is not None:
+            try:
+                self.__file.write(self.__buffer)
+                self.__file.flush()
+            except Exception as e:
+                usys.print_exception(e)
+            self.__buffer = bytearray()
+
+    def record(self, record_type, data=b""):
+        """Record socket bytes.
+
+        Args:
+            record_type(int):
+                CAPTURE_OUT - bytes written to socket.
+                CAPTURE_IN - bytes read from socket.
+                CAPTURE_CONNECT - socket is connected.
+                CAPTURE_CLOSE - socket is closed.
+            data(bytes): socket bytes. (default: {b""})
+        """
+        with self.__lock:
+            if self.__file is None:
+                return
+            now = self.__clock.now() & 0xFFFFFFFF
+            view = memoryview(data)
+            pos = 0
+            while True:
+                chunk = view[pos:pos + _MAX_CHUNK]
+                size = _RECORD_HEAD_SIZE + len(chunk)
+                if self.__size + size > self.__max_size:
+                    self.__stats["dropped"] += 1
+                    break
+                head = bytearray(_RECORD_HEAD_SIZE)
+                head[0] = record_type
+                pack_int(head, 1, now, 4)
+                pack_int(head, 5, len(chunk), 2)
+                self.__buffer.extend(head)
+                self.__buffer.extend(chunk)
+                self.__size += size
+                self.__stats["records"] += 1
+                self.__stats["bytes"] += len(chunk)
+                pos += len(chunk)
+                if pos >= len(view):
+                    break
+            if len(self.__buffer) >= self.__buffer_size or record_type == CAPTURE_CLOSE:
+                self.__write()
+
+    def flush(self):
+        """Write buffered records to file."""
+        with self.__lock:
+            self.__write()
+
+    def close(self):
+        """Write buffered records and close file."""
+        with self.__lock:
+            self.__write()
+            if self.__file is not None:
+                self.__file.close()
+                self.__file = None
+
+    def stats(self):
+        """Get capture statistics.
+
+        Returns:
+            dict:
+                records(int): record count.
+                bytes(int): recorded socket bytes.
+                dropped(int): records dropped because the file is full.
+        """
+        with self.__lock:
+            return dict(self.__stats)
+
+
+class CaptureReader(object):
+    """This class reads records of a capture file."""
+
+    def __init__(self, path):
+        """
+        Args:
+            path(str): capture file path.
+
+        Raises:
+            ValueError: file is not a capture file.
+        """
+        self.__path = path
+        with open(path, "rb") as f:
+            if f.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError("%s is not a GT06 capture file." % path)
+
+    def records(self):
+        """Get records in order.
+
+        Returns:
+            generator: (record_type, time, data), time is ms since capture start.
+        """
+        with open(self.__path, "rb") as f:
+            f.read(len(_MAGIC))
+            while True:
+                head = f.read(_RECORD_HEAD_SIZE)
+                if len(head) < _RECORD_HEAD_SIZE:
+                    break
+                size = (head[5] << 8) | head[6]
+                data = f.read(size) if size else b""
+                if len(data) < size:
+                    logger.error("Capture file %s is truncated." % self.__path)
+                    break
+                yield (head[0], (head[1] << 24) | (head[2] << 16) | (head[3] << 8) | head[4], data)
@@ -0,0 +1,470 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :gt06_core.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :GT06 protocol state machine without IO
+@version   :1.0.0
+@date      :2026-10-17 14:20:37
+@copyright :Copyright (c) 2022
+"""
+
+from usr.logging import getLogger
+from usr.common import SerialNo
+from usr.gt06_ack import RtoEstimator
+from usr.gt06_msg import pack_msg, GT06MsgParse, GT06MsgFramer, T01, T12, T13, T15, T16
+
+logger = getLogger(__name__)
+
+# Event types
+EVENT_RESPONSE = 0
+EVENT_TIMEOUT = 1
+EVENT_COMMAND = 2
+
+# Max cached heart beat templates, one for each device status.
+_STATUS_TEMPLATE_SIZE = 4
+
+
+def check_location(gps, lbs):
+    """Check args of location message, raise ValueError if any of them is invalid.
+
+    Args:
+        gps(tuple): (date_time, satellite_num, latitude, longitude, speed, course, lat_ns, lon_ew, gps_onoff, is_real_time)
+        lbs(tuple): (mcc, mnc, lac, cell_id)
+    """
+    date_time, satellite_num, latitude, longitude, speed, course, lat_ns, lon_ew, gps_onoff, is_real_time = gps
+    if len(date_time) != 12:
+        raise ValueError("date_time format error.")
+    if satellite_num < 0 or satellite_num > 15:
+        raise ValueError("Satellite numbers range is [0, 15]")
+    if speed < 0 or speed > 255:
+        raise ValueError("speed range is [0, 255]")
+    if course < 0 or course > 359:
+        raise ValueError("course range is [0, 359]")
+    if lat_ns not in (0, 1):
+        raise ValueError("lat_ns is not in (0, 1).")
+    if lon_ew not in (0, 1):
+        raise ValueError("lon_ew is not in (0, 1).")
+    if gps_onoff not in (0, 1):
+        raise ValueError("gps_onoff is not in (0, 1).")
+    if is_real_time not in (0, 1):
+        raise ValueError("is_real_time is not in (0, 1).")
+
+
+def check_device_status(device_status):
+    """Check device status, raise ValueError if any field is invalid.
+
+    Args:
+        device_status(tuple): (defend, acc, charge, alarm, gps, power, voltage_level, gsm_signal)
+    """
+    defend, acc, charge, alarm, gps, power, voltage_level, gsm_signal = device_status
+    if defend not in (0, 1):
+        raise ValueError("defend is not (0, 1)")
+    if acc not in (0, 1):
+        raise ValueError("acc is not (0, 1)")
+    if charge not in (0, 1):
+        raise ValueError("charge is not (0, 1)")
+    if alarm not in (0, 1, 2, 3, 4):
+        raise ValueError("alarm is not (0, 1, 2, 3, 4)")
+    if gps not in (0, 1):
+        raise ValueError("gps is not (0, 1)")
+    if power not in (0, 1):
+        raise ValueError("power is not (0, 1)")
+    if voltage_level not in (0, 1, 2, 3, 4, 5, 6):
+        raise ValueError("voltage_level is not (0, 1, 2, 3, 4, 5, 6)")
+    if gsm_signal not in (0, 1, 2, 3, 4):
+        raise ValueError("gsm_signal is not (0, 1, 2, 3, 4)")
+
+
+class GT06Event(object):
+    """This class is the event output by GT06Protocol."""
+
+    def __init__(self, event_type, protocol_no, msg_no, msg_info=None, rtt=-1):
+        """
+        Args:
+            event_type(int):
+                EVENT_RESPONSE - server response of a request is received.
+                EVENT_TIMEOUT - request is not responded after all retransmissions, or connection is lost.
+                EVENT_COMMAND - server command (protocol number 0x80) is received.
+            protocol_no(int): protocol number.
+            msg_no(int): message serial number.
+            msg_info(GT06MsgInfo): server message of EVENT_RESPONSE and EVENT_COMMAND. (default: {None})
+            rtt(int): round trip time of EVENT_RESPONSE, measured from the last transmission. unit: ms. (default: {-1})
+        """
+        self.type = event_type
+        self.protocol_no = protocol_no
+        self.msg_no = msg_no
+        self.msg_info = msg_info
+        self.rtt = rtt
+
+
+class _Request(object):
+    """Request waiting for server response."""
+
+    def __init__(self, data, protocol_no, msg_no):
+        self.data = data
+        self.protocol_no = protocol_no
+        self.msg_no = msg_no
+        self.send_time = 0
+        self.deadline = 0
+        self.retry = 0
+
+
+class GT06Protocol(object):
+    """This class is GT06 protocol state machine without socket, thread and timer.
+
+    Feed received bytes by `receive_data` and clock by `tick`, then get bytes to send by `data_to_send` and
+    events by `events`. All functions take `now` as a monotonic time in ms given by caller, call `tick` again
+    before `next_deadline`.
+
+    Functions:
+        1. match server responses with requests by (protocol_no, msg_no).
+        2. limit in flight requests of one protocol number by window size.
+        3. retransmit requests by timeout estimated from round trip time.
+        4. send heart beat after login when the link is idle for life time.
+        5. output server commands as events.
+    """
+
+    def __init__(self, retry_count=3, life_time=180, window_size=4, timeout=5000, piggyback=False):
+        """
+        Args:
+            retry_count(int): retransmission count of a request. (default: {3})
+            life_time(int): heart beat is sent when no message is sent or received in this time. unit: second. (default: {180})
+            window_size(int): max in flight requests of one protocol number. (default: {4})
+            timeout(int): initial server response timeout. unit: ms. (default: {5000})
+            piggyback(bool): when device status is changed, the next location message is sent as 0x16 with
+                device status. (default: {False})
+        """
+        self.__retry_count = retry_count
+        self.__life_time = life_time
+        self.__piggyback = piggyback
+        self.__window_size = window_size
+        self.__rto = RtoEstimator(init_rto=timeout)
+        self.__framer = GT06MsgFramer()
+        self.__serial_no_obj = SerialNo(start_no=1)
+        self.__parser = GT06MsgParse()
+        self.__connected = False
+        self.__logged_in = False
+        self.__device_status = (0, 0, 0, 0, 0, 0, 0, 0)
+        self.__status_changed = False
+        self.__status_templates = {}
+        self.__last_active = 0
+        self.__last_heart_beat = 0
+        self.__in_flight = {}
+        self.__in_flight_count = {}
+        self.__backlog = []
+        self.__out = []
+        self.__events = []
+
+    def __transmit(self, req, now):
+        self.__in_flight[(req.protocol_no, req.msg_no)] = req
+        self.__in_flight_count[req.protocol_no] = self.__in_flight_count.get(req.protocol_no, 0) + 1
+        req.send_time = now
+        req.deadline = now + self.__rto.rto()
+        self.__last_active = now
+        self.__out.append(req.data)
+
+    def __finish(self, req, now):
+        """Remove request from in flight requests and send the next request of its protocol number."""
+        self.__in_flight.pop((req.protocol_no, req.msg_no))
+        self.__in_flight_count[req.protocol_no] -= 1
+        for index, item in enumerate(self.__backlog):
+            if item.protocol_no == req.protocol_no:
+                self.__transmit(self.__backlog.pop(index), now)
+                break
+
+    def __heart_beat_deadline(self):
+        """Heart beat is sent when no message is sent or received and no heart beat is issued in life time."""
+        return max(self.__last_active, self.__last_heart_beat) + self.__life_time * 1000
+
+    def __response(self, msg_info, now):
+        req = self.__in_flight.get((msg_info.protocol_no, msg_info.msg_no))
+        if req is None and msg_info.msg_no == msg_info.protocol_no:
+            # Some servers respond protocol number as serial number, match the earliest request.
+            for item in self.__in_flight.values():
+                if item.protocol_no == msg_info.protocol_no and (req is None or item.send_time < req.send_time):
+                    req = item
+        if req is None:
+            logger.debug("No request waits for response protocol_no: %s, msg_no: %s" % (msg_info.protocol_no, msg_info.msg_no))
+            return
+        self.__finish(req, now)
+        rtt = now - req.send_time
+        if req.retry == 0:
+            self.__rto.sample(rtt)
+        if req.protocol_no == 0x01:
+            self.__logged_in = True
+        self.__events.append(GT06Event(EVENT_RESPONSE, req.protocol_no, req.msg_no, msg_info, rtt))
+
+    def connection_made(self, now):
+        """Connection is established, login is needed again."""
+        self.__framer.reset()
+        self.__connected = True
+        self.__logged_in = False
+
+    def connection_lost(self, now):
+        """Connection is closed, all waiting requests are timeout."""
+        self.__connected = False
+        self.__logged_in = False
+        self.__out = []
+        for req in list(self.__in_flight.values()) + self.__backlog:
+            self.__events.append(GT06Event(EVENT_TIMEOUT, req.protocol_no, req.msg_no))
+        self.__in_flight = {}
+        self.__in_flight_count = {}
+        self.__backlog = []
+
+    def receive_data(self, data, now):
+        """Feed received bytes.
+
+        Args:
+            data(bytes): received bytes in arbitrary chunks.
+            now(int): monotonic time. unit: ms.
+        """
+        for msg in self.__framer.feed(data):
+            msg_info = self.__parser.parse(msg)
+            if msg_info is None:
+                continue
+            self.__last_active = now
+            if msg_info.protocol_no == 0x80:
+                self.__events.append(GT06Event(EVENT_COMMAND, msg_info.protocol_no, msg_info.msg_no, msg_info))
+            else:
+                self.__response(msg_info, now)
+
+    def tick(self, now):
+        """Retransmit timeout requests, time out requests waiting for window and send heart beat when the link
+        is idle for life time.
+
+        Args:
+            now(int): monotonic time. unit: ms.
+        """
+        for req in [i for i in self.__backlog if now >= i.deadline]:
+            self.__backlog.remove(req)
+            self.__events.append(GT06Event(EVENT_TIMEOUT, req.protocol_no, req.msg_no))
+        expired = [i for i in self.__in_flight.values() if now >= i.deadline]
+        if [i for i in expired if i.retry < self.__retry_count]:
+            # Timeout is doubled once by one timer expiry, not by every request retransmitted in it.
+            self.__rto.backoff()
+        for req in expired:
+            if req.retry < self.__retry_count:
+                req.retry += 1
+                req.send_time = now
+                req.deadline = now + self.__rto.rto()
+                self.__out.append(req.data)
+                logger.debug("Retransmit protocol_no: %s, msg_no: %s, retry: %s" % (req.protocol_no, req.msg_no, req.retry))
+            else:
+                self.__finish(req, now)
+                self.__events.append(GT06Event(EVENT_TIMEOUT, req.protocol_no, req.msg_no))
+        if self.__logged_in and now >= self.__heart_beat_deadline():
+            # A heart beat waiting for window does not make the link active, count it as issued.
+            self.__last_heart_beat = now
+            msg_no, data = self.get_device_status_msg()
+            self.send(data, 0x13, msg_no, now)
+
+    def next_deadline(self):
+        """Get the time when `tick` should be called.
+
+        Returns:
+            int: monotonic time. unit: ms. None if no timer is waiting.
+        """
+        deadline = self.__heart_beat_deadline() if self.__logged_in else None
+        for req in list(self.__in_flight.values()) + self.__backlog:
+            if deadline is None or req.deadline < deadline:
+                deadline = req.deadline
+        return deadline
+
+    def send(self, data, protocol_no, msg_no, now):
+        """Send a message.
+
+        When the window of the protocol number is full, the message is sent after a response of this protocol
+        number is received, or it is timeout after the time of all retransmissions. A request with the same
+        protocol number and serial number as a waiting one replaces it. When the connection is not established,
+        the request is timeout at once.
+
+        Args:
+            data(bytes): message bytes.
+            protocol_no(int): server response protocol number, None if no server response.
+            msg_no(int): message serial number.
+            now(int): monotonic time. unit: ms.
+
+        Returns:
+            bool: True - message is sent or waiting for window, False - connection is not established.
+        """
+        if not self.__connected:
+            if protocol_no is not None:
+                self.__events.append(GT06Event(EVENT_TIMEOUT, protocol_no, msg_no))
+            return False
+        if protocol_no is None:
+            self.__last_active = now
+            self.__out.append(data)
+            return True
+        key = (protocol_no, msg_no)
+        if key in self.__in_flight:
+            # The same request is sent again, replace it without taking another window slot.
+            self.__in_flight.pop(key)
+            self.__in_flight_count[protocol_no] -= 1
+        else:
+            for index, item in enumerate(self.__backlog):
+                if item.protocol_no == protocol_no and item.msg_no == msg_no:
+                    self.__backlog.pop(index)
+                    break
+        req = _Request(data, protocol_no, msg_no)
+        if self.__in_flight_count.get(protocol_no, 0) < self.__window_size:
+            self.__transmit(req, now)
+        else:
+            # Waiting for window is limited by the time of all retransmissions.
+            req.deadline = now + self.__rto.rto() * (self.__retry_count + 1)
+            self.__backlog.append(req)
+        return True
+
+    def data_to_send(self):
+        """Get bytes to send.
+
+        Returns:
+            bytes: all pending bytes, empty if nothing to send.
+        """
+        if not self.__out:
+            return b""
+        data = self.__out[0] if len(self.__out) == 1 else b"".join(self.__out)
+        self.__out = []
+        return data
+
+    def events(self):
+        """Get events since last call.
+
+        Returns:
+            list: GT06Event list.
+        """
+        events = self.__events
+        self.__events = []
+        return events
+
+    def set_device_status(self, device_status):
+        """Set device status used by heart beat.
+
+        Args:
+            device_status(tuple): (defend, acc, charge, alarm, gps, power, voltage_level, gsm_signal)
+        """
+        if device_status != self.__device_status:
+            self.__status_changed = True
+        self.__device_status = device_status
+
+    def get_device_status(self):
+        return self.__device_status
+
+    def is_connected(self):
+        return self.__connected
+
+    def is_logged_in(self):
+        return self.__logged_in
+
+    def in_flight(self):
+        """Get number of requests waiting for server response, including requests waiting for window.
+
+        Returns:
+            int: request count.
+        """
+        return len(self.__in_flight) + len(self.__backlog)
+
+    def rto_info(self):
+        return self.__rto.info()
+
+    def get_login_msg(self, imei):
+        """Get login message.
+
+        Args:
+            imei(str): device imei number
+
+        Returns:
+            tuple: (message_no, message_bytes)
+        """
+        up_msg_obj = T01(self.__serial_no_obj)
+        up_msg_obj.set_imei(imei)
+        return up_msg_obj.get_msg()
+
+    def get_location_msg(self, gps, lbs, include_device_status=False):
+        """Get GPS and LBS message.
+
+        Args:
+            gps(tuple): args of GT06MsgBase.set_gps
+            lbs(tuple): args of GT06MsgBase.set_lbs
+            include_device_status(bool): Whether to report device status or not, device status is also reported
+                if it is changed and piggyback is enabled. (default: {False})
+
+        Returns:
+            tuple: (server_response_protocol_no, message_no, message_bytes), protocol number is None if no server response.
+        """
+        if self.__piggyback and self.__status_changed:
+            include_device_status = True
+        if include_device_status:
+            up_msg_obj = T16(self.__serial_no_obj)
+            up_msg_obj.set_device_status(*self.__device_status)
+            self.__status_changed = False
+        else:
+            up_msg_obj = T12(self.__serial_no_obj)
+        up_msg_obj.set_gps(*gps)
+        up_msg_obj.set_lbs(*lbs)
+        msg_no, data = up_msg_obj.get_msg()
+        return (0x16 if include_device_status else None, msg_no, data)
+
+    def get_device_status_msg(self):
+        """Get device status message.
+
+        Heart beat frames are built from a cached template of the device status, only serial number and CRC
+        are packed for each message.
+
+        Returns:
+            tuple: (message_no, message_bytes)
+        """
+        key = tuple(self.__device_status)
+        template = self.__status_templates.get(key)
+        if template is None:
+            if len(self.__status_templates) >= _STATUS_TEMPLATE_SIZE:
+                self.__status_templates.clear()
+            up_msg_obj = T13(self.__serial_no_obj)
+            up_msg_obj.set_device_status(*key)
+            template = up_msg_obj.get_template()
+            self.__status_templates[key] = template
+        self.__status_changed = False
+        return template.get_msg()
+
+    def get_resend_msg(self, data):
+        """Get a saved message again with a new serial number of this session.
+
+        Serial numbers of saved messages may be used by messages sent after reboot or wrap around.
+
+        Args:
+            data(bytes): complete message.
+
+        Returns:
+            tuple: (message_no, message_bytes)
+        """
+        msg_no = self.__serial_no_obj.get_serial_no()
+        return (msg_no, pack_msg(data[3], msg_no, data[4:-6]))
+
+    def get_device_cmd_msg(self, server_flag, cmd_data):
+        """Get device command message.
+
+        Args:
+            server_flag(int): this data is from server command message.
+            cmd_data(str): device command data.
+
+        Returns:
+            tuple: (message_no, message_bytes)
+        """
+        up_msg_obj = T15(self.__serial_no_obj)
+        up_msg_obj.set_device_cmd(server_flag, cmd_data)
+        return up_msg_obj.get_msg()
@@ -0,0 +1,143 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :gt06_endpoint.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :GT06 server endpoint selection by login round trip time
+@version   :1.0.0
+@date      :2026-10-17 00:26:31
+@copyright :Copyright (c) 2022
+"""
+
+import _thread
+from usr.logging import getLogger
+from usr.common import MonotonicClock
+
+logger = getLogger(__name__)
+
+
+class _Endpoint(object):
+    """Health and login round trip time of one server."""
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.rtt = -1
+        self.failures = 0
+        self.failed_until = 0
+
+
+class EndpointPool(object):
+    """This class selects the GT06 server to connect from several servers.
+
+    Servers whose login round trip time is not measured are tried first, then the healthy server with the
+    smallest smoothed login round trip time is used. A server failed to connect or login is skipped for
+    fail time, if all servers failed, the one which failed earliest is tried.
+    """
+
+    def __init__(self, endpoints, fail_time=60):
+        """
+        Args:
+            endpoints(list): server list, each item is (host, port), host is ip address or domain.
+            fail_time(int): time to skip a failed server. unit: second. (default: {60})
+        """
+        if not endpoints:
+            raise ValueError("Args endpoints is empty!")
+        self.__endpoints = [_Endpoint(host, port) for host, port in endpoints]
+        self.__fail_time = fail_time * 1000
+        self.__lock = _thread.allocate_lock()
+        self.__clock = MonotonicClock()
+
+    def __find(self, endpoint):
+        for item in self.__endpoints:
+            if (item.host, item.port) == tuple(endpoint):
+                return item
+        return None
+
+    def size(self):
+        """Get server count.
+
+        Returns:
+            int: server count.
+        """
+        return len(self.__endpoints)
+
+    def select(self):
+        """Select server to connect.
+
+        Returns:
+            tuple: (host, port)
+        """
+        with self.__lock:
+            now = self.__clock.now()
+            healthy = [i for i in self.__endpoints if i.failed_until <= now]
+            if not healthy:
+                endpoint = self.__endpoints[0]
+                for item in self.__endpoints:
+                    if item.failed_until < endpoint.failed_until:
+                        endpoint = item
+            else:
+                unmeasured = [i for i in healthy if i.rtt < 0]
+                if unmeasured:
+                    endpoint = unmeasured[0]
+                else:
+                    endpoint = healthy[0]
+                    for item in healthy:
+                        if item.rtt < endpoint.rtt:
+                            endpoint = item
+            return (endpoint.host, endpoint.port)
+
+    def report(self, endpoint, rtt=-1, ok=True):
+        """Report connect or login result of a server.
+
+        Args:
+            endpoint(tuple): (host, port) returned by `select`.
+            rtt(int): login round trip time. unit: ms. (default: {-1})
+            ok(bool): True - success, False - failed, the server is skipped for fail time. (default: {True})
+        """
+        with self.__lock:
+            item = self.__find(endpoint)
+            if item is None:
+                return
+            if ok:
+                item.failed_until = 0
+                if rtt >= 0:
+                    # Smoothed login time, the same gain as RFC 6298 SRTT.
+                    item.rtt = rtt if item.rtt < 0 else (item.rtt * 7 + rtt) // 8
+            else:
+                item.failures += 1
+                item.failed_until = self.__clock.now() + self.__fail_time
+                logger.debug("Endpoint %s:%s failed, skip it for %s ms." % (item.host, item.port, self.__fail_time))
+
+    def stats(self):
+        """Get server statistics.
+
+        Returns:
+            list: one dict for each server:
+                host(str): ip address or domain.
+                port(int): server port.
+                rtt(int): smoothed login round trip time, -1 if not measured. unit: ms.
+                failures(int): connect and login failure count.
+                healthy(bool): False - the server is skipped by failure.
+        """
+        with self.__lock:
+            now = self.__clock.now()
+            return [
+                {"host": i.host, "port": i.port, "rtt": i.rtt, "failures": i.failures, "healthy": i.failed_until <= now}
+                for i in self.__endpoints
+            ]
@@ -28,7 +28,7 @@ import usys
 import math
 import ubinascii
 
-from usr.crc_itu import crc16
+from usr.crc_itu import crc16, crc16_update, CRC_INIT
 from usr.logging import getLogger
 from usr.common import str_fill, SerialNo
 
@@ -37,28 +37,119 @@ logger = getLogger(__name__)
 _serial_no_obj = SerialNo(start_no=1)
 
 
+def pack_int(buf, offset, value, size):
+    """Write an unsigned integer into buffer by big-endian.
+
+    Args:
+        buf(bytearray): target buffer.
+        offset(int): start index in buffer.
+        value(int): integer value, the high bits out of size are discarded.
+        size(int): byte size of the integer.
+    """
+    for i in range(offset + size - 1, offset - 1, -1):
+        buf[i] = value & 0xFF
+        value >>= 8
+
+
+def pack_msg(protocol_no, msg_no, content=b""):
+    """Pack a complete GT06 message in one buffer.
+
+    Message format: start(0x7878) + length + protocol number + content + serial number + crc + end(0x0D0A).
+
+    Args:
+        protocol_no(int): protocol number.
+        msg_no(int): message serial number.
+        content(bytes): message content.
+
+    Raises:
+        ValueError: Total message length is greater than 255.
+
+    Returns:
+        bytes: message bytes.
+    """
+    content_len = len(content)
+    msg_len = 5 + content_len
+    if msg_len > 0xFF:
+        raise ValueError("Message concent bit length is greater than 250!")
+    msg = bytearray(msg_len + 5)
+    msg[0] = 0x78
+    msg[1] = 0x78
+    msg[2] = msg_len
+    msg[3] = protocol_no
+    index = 4 + content_len
+    msg[4:index] = content
+    msg[index] = (msg_no >> 8) & 0xFF
+    msg[index + 1] = msg_no & 0xFF
+    crc_code = crc16(memoryview(msg)[2:index + 2])
+    msg[index + 2] = crc_code >> 8
+    msg[index + 3] = crc_code & 0xFF
+    msg[index + 4] = 0x0D
+    msg[index + 5] = 0x0A
+    return bytes(msg)
+
+
+class GT06MsgTemplate(object):
+    """This class is a message frame with static content.
+
+    The frame head, content and CRC register over them are computed once, each message only packs the
+    serial number and resumes CRC over it.
+    """
+
+    def __init__(self, protocol_no, content=b"", serial_no_obj=None):
+        """
+        Args:
+            protocol_no(int): protocol number.
+            content(bytes): message content. (default: {b""})
+            serial_no_obj(SerialNo): serial number space of the session, module default is used if None. (default: {None})
+
+        Raises:
+            ValueError: Total message length is greater than 255.
+        """
+        content_len = len(content)
+        if content_len + 5 > 0xFF:
+            raise ValueError("Message concent bit length is greater than 250!")
+        head = bytearray(4 + content_len)
+        head[0] = 0x78
+        head[1] = 0x78
+        head[2] = content_len + 5
+        head[3] = protocol_no
+        head[4:] = content
+        self.__head = bytes(head)
+        self.__fcs = crc16_update(CRC_INIT, memoryview(self.__head)[2:])
+        self.__serial_no_obj = serial_no_obj if serial_no_obj is not None else _serial_no_obj
+
+    def get_msg(self):
+        """Get message with the next serial number.
+
+        Returns:
+            tuple: (message_no, message_bytes)
+        """
+        msg_no = self.__serial_no_obj.get_serial_no()
+        no_high = (msg_no >> 8) & 0xFF
+        no_low = msg_no & 0xFF
+        crc_code = crc16_update(self.__fcs, (no_high, no_low)) ^ 0xffff
+        return (msg_no, self.__head + bytes((no_high, no_low, crc_code >> 8, crc_code & 0xFF, 0x0D, 0x0A)))
+
+
 class GT06MsgBase(object):
     """This is base class for GT06 protocol message."""
 
-    def __init__(self):
-        self.__msg_len = ""
-        self.__protocal_no = ""
-        self.__msg_no = ""
-        self.__crc_code = ""
-        self.__start_byte = "7878"
-        self.__end_byte = "0d0a"
-        self.__content_info = {}
-        self.__content_byte = ""
-        self.__serial_no_obj = _serial_no_obj
-
-        self.__imei = ""
-        self.__gps = ""
-        self.__lbs = ""
-        self.__device_status = ""
-        self.__device_cmd = ""
-
-    def __init_protocal_no(self, protocal_no):
-        """Init protocal number to hex.
+    def __init__(self, serial_no_obj=None):
+        """
+        Args:
+            serial_no_obj(SerialNo): serial number space of the session, module default is used if None. (default: {None})
+        """
+        self._protocal_no = None
+        self.__serial_no_obj = serial_no_obj if serial_no_obj is not None else _serial_no_obj
+
+        self._imei = b""
+        self._gps = b""
+        self._lbs = b""
+        self._device_status = b""
+        self._device_cmd = b""
+
+    def _init_protocal_no(self, protocal_no):
+        """Init protocal number.
 
         Args:
             protocal_no(int): protocal number
@@ -68,40 +159,17 @@ class GT06MsgBase(object):
                 0x15 - device command
                 0x16 - GPS & device status
         """
-        self.__protocal_no = str_fill(hex(protocal_no)[2:], target_len=2)
+        self._protocal_no = protocal_no
 
-    def __init_content_byte(self):
+    def _init_content_byte(self):
         """Init message content by different protocal number.
 
         The function is implemented in the subclass.
-        """
-        pass
-
-    def __init_msg_len(self):
-        """Init message length.
 
-        Raises:
-            ValueError: Total message length is less than or equal to 250.
-        """
-        _msg_len = 5 + int(len(self.__content_byte) / 2)
-        if _msg_len > 0xFF:
-            raise ValueError("Message concent bit length is greater than 250!")
-        self.__msg_len = str_fill(hex(_msg_len)[2:], target_len=2)
-
-    def __init_msg_no(self):
-        """Init message serial number.
-
-        Serial number is start from 1.
+        Returns:
+            bytes: message content.
         """
-        _msg_no = self.__serial_no_obj.get_serial_no()
-        self.__msg_no = str_fill(hex(_msg_no)[2:], target_len=4)
-
-    def __init_crc_code(self):
-        """Init error checking by CRC-ITU"""
-        args = (self.__msg_len, self.__protocal_no, self.__content_byte, self.__msg_no)
-        _msg_byte_info = ("{}" * len(args)).format(*args)
-        _crc_code = crc16(bytearray([int(_msg_byte_info[i:i + 2], 16) for i in range(0, len(_msg_byte_info), 2)]))
-        self.__crc_code = str_fill(hex(_crc_code)[2:], target_len=4)
+        return b""
 
     def get_msg(self):
         """Get byte message for different protocol number to send to server.
@@ -111,20 +179,20 @@ class GT06MsgBase(object):
                 message_no(int): message serial number.
                 message_bytes(byte): byte message infomation.
         """
-        if not self.__protocal_no:
+        if self._protocal_no is None:
             return (-1, b'')
 
-        self.__init_content_byte()
-        self.__init_msg_len()
-        self.__init_msg_no()
-        self.__init_crc_code()
+        content = self._init_content_byte()
+        msg_no = self.__serial_no_obj.get_serial_no()
+        return (msg_no, pack_msg(self._protocal_no, msg_no, content))
 
-        args = (self.__start_byte, self.__msg_len, self.__protocal_no, self.__content_byte, self.__msg_no, self.__crc_code, self.__end_byte)
-        logger.debug("get_msg args: %s" % str(args))
-        _msg_byte_info = ("{}" * len(args)).format(*args)
-        logger.debug("get_msg _msg_byte_info: %s" % _msg_byte_info)
-        _msg_byte = bytearray([int(_msg_byte_info[i:i + 2], 16) for i in range(0, len(_msg_byte_info), 2)]).decode().encode()
-        return (int(self.__msg_no, 16), _msg_byte)
+    def get_template(self):
+        """Get message template of current content, for message sent repeatedly with the same content.
+
+        Returns:
+            GT06MsgTemplate: message template sharing the serial number space of this message.
+        """
+        return GT06MsgTemplate(self._protocal_no, self._init_content_byte(), self.__serial_no_obj)
 
     def set_gps(self, date_time, satellite_num, latitude, longitude, speed, course, lat_ns, lon_ew, gps_onoff, is_real_time):
         """Set GPS infomations.
@@ -155,19 +223,20 @@ class GT06MsgBase(object):
             bool: True - success, False - failed.
         """
         try:
-            date_time_byte = ubinascii.hexlify(bytearray([int(date_time[i:i + 2]) for i in range(0, len(date_time), 2)])).decode()
-            gps_len_byte = "c"
-            satellite_num_byte = hex(satellite_num if satellite_num <= 15 else 15)[2:]
-            latitude_byte = str_fill(hex(math.trunc(latitude * 6 * 3 * 10 ** 5))[2:], target_len=8)
-            longitude_byte = str_fill(hex(math.trunc(longitude * 6 * 3 * 10 ** 5))[2:], target_len=8)
-            speed_byte = str_fill(hex(int(speed))[2:], target_len=2)
-            status_course_args = (is_real_time, gps_onoff, lon_ew, lat_ns, str_fill(bin(int(course))[2:], target_len=10))
-            status_course_bit = ("{}" * len(status_course_args)).format(*status_course_args)
-            status_course_byte = str_fill(hex(int(status_course_bit, 2))[2:], target_len=4)
-            gps_args = (date_time_byte, gps_len_byte, satellite_num_byte, latitude_byte, longitude_byte, speed_byte, status_course_byte)
-            logger.debug("set_gps gps_args: %s" % str(gps_args))
-            self.__gps = ("{}" * len(gps_args)).format(*gps_args)
-            logger.debug("set_gps self.__gps: %s" % str(self.__gps))
+            date_time_len = len(date_time) // 2
+            gps = bytearray(date_time_len + 12)
+            for i in range(date_time_len):
+                gps[i] = int(date_time[i * 2:i * 2 + 2])
+            # High 4 bits is GPS info length, low 4 bits is satellite numbers.
+            gps[date_time_len] = 0xC0 | (satellite_num if satellite_num <= 15 else 15)
+            _latitude = math.trunc(latitude * 6 * 3 * 10 ** 5)
+            _longitude = math.trunc(longitude * 6 * 3 * 10 ** 5)
+            status_course = (is_real_time << 13) | (gps_onoff << 12) | (lon_ew << 11) | (lat_ns << 10) | int(course)
+            pack_int(gps, date_time_len + 1, _latitude, 4)
+            pack_int(gps, date_time_len + 5, _longitude, 4)
+            gps[date_time_len + 9] = int(speed) & 0xFF
+            pack_int(gps, date_time_len + 10, status_course, 2)
+            self._gps = gps
             return True
         except Exception as e:
             usys.print_exception(e)
@@ -188,16 +257,14 @@ class GT06MsgBase(object):
             bool: True - success, False - failed.
         """
         try:
-            mcc_byte = str_fill(hex(mcc)[2:], target_len=4)
-            mnc_byte = str_fill(hex(mnc)[2:], target_len=2)
-            lac_byte = str_fill(hex(lac)[2:], target_len=4)
             if cell_id > 0xFFFFFF:
                 cell_id = 0xFFFFFF
-            cell_id_byte = str_fill(hex(cell_id)[2:], target_len=6)
-            lbs_args = (mcc_byte, mnc_byte, lac_byte, cell_id_byte)
-            logger.debug("set_lbs lbs_args: %s" % str(lbs_args))
-            self.__lbs = ("{}" * len(lbs_args)).format(*lbs_args)
-            logger.debug("set_lbs __lbs: %s" % str(self.__lbs))
+            lbs = bytearray(8)
+            pack_int(lbs, 0, mcc, 2)
+            lbs[2] = mnc & 0xFF
+            pack_int(lbs, 3, lac, 2)
+            pack_int(lbs, 5, cell_id, 3)
+            self._lbs = lbs
             return True
         except Exception as e:
             usys.print_exception(e)
@@ -247,70 +314,99 @@ class GT06MsgBase(object):
             bool: True - success, False - failed.
         """
         try:
-            device_info_bit_args = (power, gps, str_fill(bin(alarm)[2:], target_len=3), charge, acc, defend)
-            device_info_bit = ("{}" * len(device_info_bit_args)).format(*device_info_bit_args)
-            _device_info = str_fill(hex(int(device_info_bit, 2))[2:], target_len=2)
-            _voltage_level = str_fill(hex(voltage_level)[2:], target_len=2)
-            _gsm_signal = str_fill(hex(gsm_signal)[2:], target_len=2)
-            # This is additional info for server. Can change by different server.
-            additional_alarm = str_fill(hex(int(alarm))[2:], target_len=2)
-            language = "02"
-            device_status_args = (_device_info, _voltage_level, _gsm_signal, additional_alarm, language)
-            self.__device_status = ("{}" * len(device_status_args)).format(*device_status_args)
-            logger.debug("set_device_status self.__device_status: %s" % self.__device_status)
+            device_info = (power << 7) | (gps << 6) | (alarm << 3) | (charge << 2) | (acc << 1) | defend
+            # The 4th byte is additional alarm info for server and the 5th byte is language (0x02).
+            # These two bytes can change by different server.
+            self._device_status = bytes((device_info & 0xFF, voltage_level, gsm_signal, alarm, 0x02))
             return True
         except Exception as e:
             usys.print_exception(e)
             return False
 
 
-class GT06MsgParse(GT06MsgBase):
-    """This class is for parsing server message."""
+class GT06MsgInfo(object):
+    """This class is parsed server message.
 
-    def __init__(self):
-        super().__init__()
-
-    def __parse_msg_len(self):
-        """Parse message len from server message."""
-        self.__msg_len = self.__msg_byte[4:6]
-
-    def __parse_protocol_no(self):
-        """Parse protocol number from server message."""
-        self.__protocal_no = self.__msg_byte[6:8]
-
-    def __parse_content(self):
-        """Parse content information from server message."""
-        self.__content_byte = self.__msg_byte[8:-12]
-        if self.__content_byte:
-            _server_flag = int(self.__content_byte[2:10], 16)
-            _cmd_data_byte = self.__content_byte[10:]
-            _cmd_data = bytearray([_cmd_data_byte[i:i + 2] for i in range(0, len(_cmd_data_byte), 2)]).decode()
-            self.__content_info = {
-                "server_flag": _server_flag,
-                "cmd_data": _cmd_data,
+    The content is a memoryview of the source message, so no bytes are copied while parsing.
+    Command fields are decoded only when they are read.
+    """
+
+    def __init__(self, protocol_no, msg_no, content):
+        """
+        Args:
+            protocol_no(int): protocal number
+            msg_no(int): message serial number
+            content(memoryview): message content
+        """
+        self.protocol_no = protocol_no
+        self.msg_no = msg_no
+        self.content = content
+
+    @property
+    def server_flag(self):
+        """Server flag of server command message, -1 if message has no content."""
+        content = self.content
+        if len(content) < 5:
+            return -1
+        return (content[1] << 24) | (content[2] << 16) | (content[3] << 8) | content[4]
+
+    @property
+    def cmd_data(self):
+        """Command data of server command message."""
+        return bytes(self.content[5:]).decode()
+
+    def to_dict(self):
+        """Get message infomation as dict.
+
+        Returns:
+            dict:
+                protocol_no(int): protocal number
+                msg_no(int): message serial number
+                content(dict):
+                    server_flag(int): server flag
+                    cmd_data(str): server command data
+        """
+        content_info = {}
+        if self.content:
+            content_info = {
+                "server_flag": self.server_flag,
+                "cmd_data": self.cmd_data,
             }
+        return {
+            "protocol_no": self.protocol_no,
+            "msg_no": self.msg_no,
+            "content": content_info,
+        }
+
+
+class GT06MsgParse(object):
+    """This class is for parsing server message."""
 
-    def __parse_msg_no(self):
-        """Parse message serial number from server message."""
-        self.__msg_no = self.__msg_byte[-12:-8]
+    def __init__(self):
+        self.__msg_info = None
 
-    def __parse_crc_code(self):
-        """Parse message error checking code (crc code) from server message."""
-        self.__crc_code = self.__msg_byte[-8:-4]
+    def parse(self, msg):
+        """Parse server message.
 
-    def __check_crc_code(self):
-        """Check crc code is legal.
+        Args:
+            msg(bytes): one complete server message, from start bytes to end bytes.
 
         Returns:
-            bool: True - success, False - failed.
+            GT06MsgInfo: message infomation, None if message is illegal or crc code check failed.
         """
-        _msg_byte_info = self.__msg_byte[4:-8]
-        _crc_code = crc16(bytearray([int(_msg_byte_info[i:i + 2], 16) for i in range(0, len(_msg_byte_info), 2)]))
-        if _crc_code == int(self.__crc_code, 16):
-            return True
-        else:
-            logger.error("Server message crc[%s] is not compare with actual calculation crc[%s]" % (int(self.__crc_code, 16), _crc_code))
-            return False
+        msg_view = memoryview(msg)
+        msg_size = len(msg_view)
+        if msg_size < 10 or msg_view[2] + 5 != msg_size:
+            logger.error("Server message length %s is illegal." % msg_size)
+            return None
+
+        _crc_code = crc16(msg_view[2:-4])
+        crc_code = (msg_view[-4] << 8) | msg_view[-3]
+        if _crc_code != crc_code:
+            logger.error("Server message crc[%s] is not compare with actual calculation crc[%s]" % (crc_code, _crc_code))
+            return None
+
+        return GT06MsgInfo(msg_view[3], (msg_view[-6] << 8) | msg_view[-5], msg_view[4:-6])
 
     def set_msg(self, msg):
         """Set source server send message.
@@ -321,15 +417,8 @@ class GT06MsgParse(GT06MsgBase):
         Returns:
             bool: True - success, False - crc code check failed.
         """
-        self.__msg_byte = ubinascii.hexlify(msg).decode()
-        self.__parse_crc_code()
-        if self.__check_crc_code():
-            self.__parse_msg_len()
-            self.__parse_protocol_no()
-            self.__parse_content()
-            self.__parse_msg_no()
-            return True
-        return False
+        self.__msg_info = self.parse(msg)
+        return self.__msg_info is not None
 
     def get_msg_info(self):
         """Get parse message infomation.
@@ -342,25 +431,80 @@ class GT06MsgParse(GT06MsgBase):
                     server_flag(int): server flag
                     cmd_data(str): server command data
         """
-        _msg_info = {
-            "protocol_no": int(self.__protocal_no, 16) if self.__protocal_no else -1,
-            "msg_no": int(self.__msg_no, 16) if self.__msg_no else -1,
-            "content": self.__content_info,
-        }
-        return _msg_info
+        if self.__msg_info is None:
+            return {"protocol_no": -1, "msg_no": -1, "content": {}}
+        return self.__msg_info.to_dict()
+
+
+class GT06MsgFramer(object):
+    """This class splits server byte stream into complete messages.
+
+    Data can be fed in arbitrary chunks. A message is returned as soon as the bytes given by its length byte
+    are received, only the unconsumed tail (at most one message) is kept between calls.
+    """
+
+    def __init__(self):
+        self.__tail = b""
+
+    def feed(self, data):
+        """Feed received bytes and get complete messages.
+
+        Args:
+            data(bytes): received bytes.
+
+        Returns:
+            list: complete messages, each item is a memoryview of one message from start bytes to end bytes.
+        """
+        if self.__tail:
+            data = self.__tail + data
+        buf = memoryview(data)
+        size = len(buf)
+        msgs = []
+        pos = 0
+        while size - pos > 2:
+            if buf[pos] != 0x78 or buf[pos + 1] != 0x78:
+                # Discard bytes until next start bytes.
+                pos += 1
+                continue
+            msg_size = buf[pos + 2] + 5
+            if size - pos < msg_size:
+                break
+            end = pos + msg_size
+            if buf[end - 2] != 0x0D or buf[end - 1] != 0x0A:
+                logger.error("Server message end bytes is illegal, discard start bytes.")
+                pos += 1
+                continue
+            msgs.append(buf[pos:end])
+            pos = end
+        while pos < size and (buf[pos] != 0x78 or (pos + 1 < size and buf[pos + 1] != 0x78)):
+            pos += 1
+        self.__tail = bytes(buf[pos:]) if pos < size else b""
+        return msgs
+
+    def pending(self):
+        """Get size of received bytes which are not a complete message yet.
+
+        Returns:
+            int: pending bytes size.
+        """
+        return len(self.__tail)
+
+    def reset(self):
+        """Discard pending bytes."""
+        self.__tail = b""
 
 
 class T01(GT06MsgBase):
     """Device login message."""
 
-    def __init__(self):
-        super().__init__()
-        self.__init_protocal_no(0x01)
+    def __init__(self, serial_no_obj=None):
+        super().__init__(serial_no_obj)
+        self._init_protocal_no(0x01)
 
-    def __init_content_byte(self):
-        if not self.__imei:
+    def _init_content_byte(self):
+        if not self._imei:
             raise ValueError("IMEI is not set!")
-        self.__content_byte = self.__imei
+        return self._imei
 
     def set_imei(self, imei):
         """Set device imei to login.
@@ -372,7 +516,7 @@ class T01(GT06MsgBase):
             bool: True - success, False - failed.
         """
         try:
-            self.__imei = str_fill(imei, target_len=16)
+            self._imei = ubinascii.unhexlify(str_fill(imei, target_len=16))
             return True
         except Exception as e:
             usys.print_exception(e)
@@ -385,14 +529,14 @@ class T12(GT06MsgBase):
     These functions set_gps, set_lbs are necessary for this message.
     """
 
-    def __init__(self):
-        super().__init__()
-        self.__init_protocal_no(0x12)
+    def __init__(self, serial_no_obj=None):
+        super().__init__(serial_no_obj)
+        self._init_protocal_no(0x12)
 
-    def __init_content_byte(self):
-        if not self.__gps:
+    def _init_content_byte(self):
+        if not self._gps:
             raise ValueError("GPS info is not set!")
-        self.__content_byte = self.__gps + self.__lbs
+        return self._gps + self._lbs
 
 
 class T13(GT06MsgBase):
@@ -403,27 +547,27 @@ class T13(GT06MsgBase):
     The function set_device_status is necessary for this message.
     """
 
-    def __init__(self):
-        super().__init__()
-        self.__init_protocal_no(0x13)
+    def __init__(self, serial_no_obj=None):
+        super().__init__(serial_no_obj)
+        self._init_protocal_no(0x13)
 
-    def __init_content_byte(self):
-        if not self.__device_status:
+    def _init_content_byte(self):
+        if not self._device_status:
             raise ValueError("Device status is not set!")
-        self.__content_byte = self.__device_status
+        return self._device_status
 
 
 class T15(GT06MsgBase):
     """Report device command to server."""
 
-    def __init__(self):
-        super().__init__()
-        self.__init_protocal_no(0x15)
+    def __init__(self, serial_no_obj=None):
+        super().__init__(serial_no_obj)
+        self._init_protocal_no(0x15)
 
-    def __init_content_byte(self):
-        if not self.__device_cmd:
+    def _init_content_byte(self):
+        if not self._device_cmd:
             raise ValueError("Device command info is not set!")
-        self.__content_byte = self.__device_cmd
+        return self._device_cmd
 
     def set_device_cmd(self, server_flag, cmd_data):
         """Set device command.
@@ -436,11 +580,13 @@ class T15(GT06MsgBase):
             bool: True - success, False - failed.
         """
         try:
-            _server_flag = str_fill(hex(server_flag)[2:], target_len=8)
-            _cmd_data = ubinascii.hexlify(cmd_data).decode()
-            _cmd_len = str_fill(hex(4 + int(len(_cmd_data) / 2))[2:], target_len=2)
-            cmd_args = (_cmd_len, _server_flag, _cmd_data)
-            self.__device_cmd = ("{}" * len(cmd_args)).format(*cmd_args)
+            if isinstance(cmd_data, str):
+                cmd_data = cmd_data.encode()
+            device_cmd = bytearray(5 + len(cmd_data))
+            device_cmd[0] = 4 + len(cmd_data)
+            pack_int(device_cmd, 1, server_flag, 4)
+            device_cmd[5:] = cmd_data
+            self._device_cmd = device_cmd
             return True
         except Exception as e:
             usys.print_exception(e)
@@ -453,13 +599,13 @@ class T16(GT06MsgBase):
     These functions set_gps, set_lbs, set_device_status are necessary for this message.
     """
 
-    def __init__(self):
-        super().__init__()
-        self.__init_protocal_no(0x16)
+    def __init__(self, serial_no_obj=None):
+        super().__init__(serial_no_obj)
+        self._init_protocal_no(0x16)
 
-    def __init_content_byte(self):
-        if not self.__gps:
+    def _init_content_byte(self):
+        if not self._gps:
             raise ValueError("GPS info is not set!")
-        if not self.__device_status:
+        if not self._device_status:
             raise ValueError("Device status is not set!")
-        self.__content_byte = self.__gps + str_fill(hex(int(len(self.__lbs) / 2))[2:], target_len=2) + self.__lbs + self.__device_status
+        return self._gps + bytes((len(self._lbs),)) + self._lbs + self._device_status
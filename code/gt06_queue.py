@@ -0,0 +1,317 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :gt06_queue.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :GT06 message store and forward queue
+@version   :1.0.0
+@date      :2026-10-17 10:05:12
+@copyright :Copyright (c) 2022
+"""
+
+import usys
+import utime
+import _thread
+
+try:
+    import uos
+except ImportError:
+    import os as uos
+
+from usr.crc_itu import crc16
+from usr.gt06_msg import pack_int
+from usr.logging import getLogger
+
+logger = getLogger(__name__)
+
+# Record header: message length(2 bytes) + timestamp(4 bytes).
+_RECORD_HEAD_SIZE = 6
+# Index slot: seq(4 bytes) + head(4 bytes) + tail(4 bytes) + count(4 bytes) + crc(2 bytes).
+_INDEX_SLOT_SIZE = 18
+_MSG_MAX_SIZE = 0xFF + 5
+
+
+def _unpack_int(buf, offset, size):
+    value = 0
+    for i in range(offset, offset + size):
+        value = (value << 8) | buf[i]
+    return value
+
+
+class GT06Queue(object):
+    """This class is a persistent FIFO queue for messages which can not be sent to server.
+
+    Messages are appended to a fixed size ring buffer file, the oldest messages are overwritten when it is full.
+    The read and write positions are saved in two index slots alternately with sequence number and crc code,
+    so a power failure while saving index leaves the previous index valid.
+
+    Files in queue directory:
+        data: ring buffer of records, each record is message length + timestamp + message.
+        index: two index slots.
+    """
+
+    def __init__(self, path="/usr/gt06_queue", max_size=32768, flush_size=0):
+        """
+        Args:
+            path(str): queue directory. (default: {"/usr/gt06_queue"})
+            max_size(int): ring buffer file size. unit: byte. (default: {32768})
+            flush_size(int): messages are buffered in memory and written to file together until their size
+                reaches this value, buffered messages are lost on power failure. 0 means writing every message
+                at once, it is not greater than max_size. unit: byte. (default: {0})
+        """
+        self.__path = path
+        self.__data_file = path + "/data"
+        self.__index_file = path + "/index"
+        self.__max_size = max_size
+        self.__flush_size = min(flush_size, max_size)
+        self.__seq = 0
+        self.__head = 0
+        self.__tail = 0
+        self.__count = 0
+        self.__buffer = bytearray()
+        self.__buffer_count = 0
+        self.__lock = _thread.allocate_lock()
+        self.__init_files()
+
+    def __file_size(self, file):
+        try:
+            return uos.stat(file)[6]
+        except OSError:
+            return -1
+
+    def __init_files(self):
+        """Create queue files if not exists, else load index."""
+        if self.__file_size(self.__path) < 0:
+            uos.mkdir(self.__path)
+        if self.__file_size(self.__data_file) != self.__max_size or self.__file_size(self.__index_file) != _INDEX_SLOT_SIZE * 2:
+            block = bytes(1024)
+            with open(self.__data_file, "wb") as f:
+                for i in range(0, self.__max_size, 1024):
+                    f.write(block[:min(1024, self.__max_size - i)])
+            with open(self.__index_file, "wb") as f:
+                f.write(bytes(_INDEX_SLOT_SIZE * 2))
+            self.__save_index()
+        else:
+            self.__load_index()
+
+    def __load_index(self):
+        """Load the valid index slot which has the larger sequence number."""
+        with open(self.__index_file, "rb") as f:
+            data = f.read()
+        index = None
+        for offset in (0, _INDEX_SLOT_SIZE):
+            slot = data[offset:offset + _INDEX_SLOT_SIZE]
+            if crc16(slot[:-2]) != _unpack_int(slot, _INDEX_SLOT_SIZE - 2, 2):
+                continue
+            slot_index = [_unpack_int(slot, i, 4) for i in range(0, 16, 4)]
+            if index is None or slot_index[0] > index[0]:
+                index = slot_index
+        if index is None:
+            logger.error("Queue index is broken, queue is reset.")
+            index = (0, 0, 0, 0)
+        self.__seq, self.__head, self.__tail, self.__count = index
+
+    def __save_index(self):
+        """Save index to the slot which is not the latest one."""
+        if self.__head >= self.__max_size:
+            self.__head -= self.__max_size
+            self.__tail -= self.__max_size
+        self.__seq += 1
+        slot = bytearray(_INDEX_SLOT_SIZE)
+        for i, value in enumerate((self.__seq, self.__head, self.__tail, self.__count)):
+            pack_int(slot, i * 4, value, 4)
+        pack_int(slot, _INDEX_SLOT_SIZE - 2, crc16(memoryview(slot)[:-2]), 2)
+        with open(self.__index_file, "r+b") as f:
+            f.seek((self.__seq % 2) * _INDEX_SLOT_SIZE)
+            f.write(slot)
+
+    def __write(self, f, offset, data):
+        """Write data to ring buffer file at logical offset."""
+        offset %= self.__max_size
+        size = min(len(data), self.__max_size - offset)
+        f.seek(offset)
+        f.write(data[:size])
+        if size < len(data):
+            f.seek(0)
+            f.write(data[size:])
+
+    def __read(self, f, offset, size):
+        """Read data from ring buffer file at logical offset."""
+        offset %= self.__max_size
+        f.seek(offset)
+        data = f.read(min(size, self.__max_size - offset))
+        if len(data) < size:
+            f.seek(0)
+            data += f.read(size - len(data))
+        return data
+
+    def __read_record_head(self, f, offset):
+        """Read record head, raise ValueError if the record is broken.
+
+        Returns:
+            tuple: (message_size, timestamp)
+        """
+        head = self.__read(f, offset, _RECORD_HEAD_SIZE)
+        msg_size = _unpack_int(head, 0, 2)
+        if msg_size < 10 or msg_size > _MSG_MAX_SIZE:
+            raise ValueError("Queue record at %s is broken." % offset)
+        return (msg_size, _unpack_int(head, 2, 4))
+
+    def __reset(self):
+        logger.error("Queue data is broken, queue is reset.")
+        self.__head = self.__tail
+        self.__count = 0
+        self.__save_index()
+
+    def __flush(self):
+        """Write buffered records to file, lock must be held."""
+        if not self.__buffer:
+            return True
+        start = 0
+        count = self.__buffer_count
+        # Buffered records which do not fit in the ring buffer would overwrite each other, discard the oldest.
+        while len(self.__buffer) - start > self.__max_size:
+            start += _RECORD_HEAD_SIZE + _unpack_int(self.__buffer, start, 2)
+            count -= 1
+        data = memoryview(self.__buffer)[start:]
+        size = len(data)
+        try:
+            with open(self.__data_file, "r+b") as f:
+                if self.__tail - self.__head + size > self.__max_size:
+                    # Discard the oldest records, save index before they are overwritten.
+                    while self.__count > 0 and self.__tail - self.__head + size > self.__max_size:
+                        msg_size, _ = self.__read_record_head(f, self.__head)
+                        self.__head += _RECORD_HEAD_SIZE + msg_size
+                        self.__count -= 1
+                    logger.debug("Queue is full, discard the oldest messages.")
+                    self.__save_index()
+                self.__write(f, self.__tail, data)
+            self.__tail += size
+            self.__count += count
+            self.__save_index()
+            return True
+        except ValueError as e:
+            usys.print_exception(e)
+            self.__reset()
+            return False
+        except Exception as e:
+            usys.print_exception(e)
+            return False
+        finally:
+            self.__buffer = bytearray()
+            self.__buffer_count = 0
+
+    def put(self, data, timestamp=None):
+        """Append a message to queue.
+
+        Args:
+            data(bytes): complete GT06 message.
+            timestamp(int): message time, used to sort messages when they are read. (default: {utime.time()})
+
+        Returns:
+            bool: True - success, False - failed.
+        """
+        if len(data) < 10 or len(data) > _MSG_MAX_SIZE or _RECORD_HEAD_SIZE + len(data) > self.__max_size:
+            return False
+        if timestamp is None:
+            timestamp = utime.time()
+        record = bytearray(_RECORD_HEAD_SIZE + len(data))
+        pack_int(record, 0, len(data), 2)
+        pack_int(record, 2, timestamp, 4)
+        record[_RECORD_HEAD_SIZE:] = data
+        with self.__lock:
+            self.__buffer.extend(record)
+            self.__buffer_count += 1
+            if len(self.__buffer) >= self.__flush_size:
+                return self.__flush()
+        return True
+
+    def flush(self):
+        """Write buffered messages to file.
+
+        Returns:
+            bool: True - success, False - failed.
+        """
+        with self.__lock:
+            return self.__flush()
+
+    def peek(self, count):
+        """Read messages from the head of queue without removing them.
+
+        Args:
+            count(int): max message count.
+
+        Returns:
+            list: messages sorted by timestamp, each item is tuple (timestamp, message).
+        """
+        msgs = []
+        with self.__lock:
+            self.__flush()
+            try:
+                with open(self.__data_file, "rb") as f:
+                    offset = self.__head
+                    for i in range(min(count, self.__count)):
+                        msg_size, timestamp = self.__read_record_head(f, offset)
+                        msgs.append((timestamp, self.__read(f, offset + _RECORD_HEAD_SIZE, msg_size)))
+                        offset += _RECORD_HEAD_SIZE + msg_size
+            except ValueError as e:
+                usys.print_exception(e)
+                self.__reset()
+                return []
+        msgs.sort(key=lambda i: i[0])
+        return msgs
+
+    def pop(self, count):
+        """Remove messages from the head of queue.
+
+        Args:
+            count(int): message count.
+
+        Returns:
+            bool: True - success, False - failed.
+        """
+        with self.__lock:
+            try:
+                with open(self.__data_file, "rb") as f:
+                    for i in range(min(count, self.__count)):
+                        msg_size, _ = self.__read_record_head(f, self.__head)
+                        self.__head += _RECORD_HEAD_SIZE + msg_size
+                        self.__count -= 1
+                self.__save_index()
+                return True
+            except ValueError as e:
+                usys.print_exception(e)
+                self.__reset()
+                return False
+
+    def size(self):
+        """Get message count in queue, including buffered messages.
+
+        Returns:
+            int: message count.
+        """
+        return self.__count + self.__buffer_count
+
+    def clear(self):
+        """Remove all messages."""
+        with self.__lock:
+            self.__buffer = bytearray()
+            self.__buffer_count = 0
+            self.__head = self.__tail
+            self.__count = 0
+            self.__save_index()
@@ -0,0 +1,471 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :gt06_session.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :GT06 Multi-Session Manager
+@version   :1.0.0
+@date      :2026-10-17 18:25:31
+@copyright :Copyright (c) 2022
+"""
+
+import usys
+import _thread
+
+from usr.gt06 import GT06
+from usr.reactor import Reactor
+from usr.gt06_ack import AckWaiter
+from usr.logging import getLogger
+from usr.common import CallbackDispatcher
+from usr.gt06_core import GT06Protocol, EVENT_COMMAND, check_device_status
+
+logger = getLogger(__name__)
+
+
+class GT06Connection(object):
+    """This class is GT06 session whose socket connect, read, write and timers are all serviced by a `Reactor`.
+
+    Functions do not block, they return `AckWaiter` at once. Wait the waiter in user thread, or set
+    callback to get the result in reactor thread, the callback must not block.
+    """
+
+    def __init__(self, reactor, ip, port, timeout=5, retry_count=3, life_time=180, window_size=4, dispatcher=None,
+                 piggyback=False):
+        """
+        Args:
+            reactor: Reactor object.
+            ip: server ip address.
+            port: server port.
+            timeout: initial server response timeout, then the timeout is estimated by round trip time. (default: {5})
+            retry_count: send data retry count. (default: {3})
+            life_time: heart beat is sent when the link is idle for this time. unit: second. (default: {180})
+            window_size: max in flight requests waiting for server response of one protocol number. (default: {4})
+            dispatcher: CallbackDispatcher object to run server command callback, the callback is run in reactor
+                thread if it is None. (default: {None})
+            piggyback: when device status is changed, the next location report carries it as 0x16 instead of
+                waiting for a heart beat. (default: {False})
+        """
+        self.__reactor = reactor
+        self.__addr = (ip, port)
+        self.__core = GT06Protocol(retry_count=retry_count, life_time=life_time, window_size=window_size, timeout=timeout * 1000,
+                                   piggyback=piggyback)
+        self.__lock = _thread.allocate_lock()
+        self.__conn = None
+        self.__connect_waiter = None
+        self.__timer = None
+        self.__timer_deadline = None
+        self.__waiters = {}
+        self.__callback = None
+        self.__dispatcher = dispatcher
+
+    def __process(self, now):
+        """Handle protocol core events and schedule reactor timer for core deadline, lock must be held.
+
+        Returns:
+            tuple: (data, completions, commands), they are handled by `__finish` after lock is released.
+        """
+        completions = []
+        commands = []
+        for event in self.__core.events():
+            if event.type == EVENT_COMMAND:
+                commands.append(event.msg_info.to_dict())
+            else:
+                waiter = self.__waiters.pop((event.protocol_no, event.msg_no), None)
+                if waiter is not None:
+                    completions.append((waiter, event.msg_info, event.rtt))
+
+        deadline = self.__core.next_deadline()
+        if deadline != self.__timer_deadline:
+            self.__timer_deadline = deadline
+            if self.__timer is not None:
+                self.__timer.cancel()
+                self.__timer = None
+            if deadline is not None:
+                self.__timer = self.__reactor.call_later(deadline - now, self.__on_timer)
+        return (self.__core.data_to_send(), completions, commands)
+
+    def __finish(self, output):
+        """Write data, complete waiters and run server command callbacks, lock must not be held."""
+        data, completions, commands = output
+        conn = self.__conn
+        if data and conn is not None:
+            conn.write(data)
+        for waiter, response, rtt in completions:
+            waiter._complete(response, rtt)
+        for msg_info in commands:
+            if not self.__callback:
+                logger.error("callback funcion is not exists!")
+            elif self.__dispatcher is not None:
+                self.__dispatcher.submit(self.__callback, (msg_info,), key=id(self))
+            else:
+                self.__callback(msg_info)
+
+    def __on_timer(self):
+        with self.__lock:
+            now = self.__reactor.now()
+            self.__timer = None
+            self.__timer_deadline = None
+            self.__core.tick(now)
+            output = self.__process(now)
+        self.__finish(output)
+
+    def connection_made(self, conn):
+        """Connection is established, it is called by reactor."""
+        with self.__lock:
+            self.__core.connection_made(self.__reactor.now())
+            waiter = self.__connect_waiter
+            self.__connect_waiter = None
+        if waiter is not None:
+            waiter._complete(True)
+
+    def data_received(self, data):
+        """Server data is received, it is called by reactor."""
+        with self.__lock:
+            now = self.__reactor.now()
+            self.__core.receive_data(data, now)
+            output = self.__process(now)
+        self.__finish(output)
+
+    def connection_lost(self):
+        """Connection is failed or closed, it is called by reactor."""
+        with self.__lock:
+            now = self.__reactor.now()
+            self.__conn = None
+            self.__core.connection_lost(now)
+            output = self.__process(now)
+            waiter = self.__connect_waiter
+            self.__connect_waiter = None
+        self.__finish(output)
+        if waiter is not None:
+            waiter._complete(None)
+
+    def status(self):
+        """Get connection status
+
+        Returns:
+            [int]:
+                0: Connected
+                1: Connecting
+                2: Disconnect
+        """
+        conn = self.__conn
+        if conn is None:
+            return 2
+        return 0 if conn.is_connected() else 1
+
+    def connect(self, timeout=30, callback=None):
+        """Start connecting server.
+
+        Args:
+            timeout(int): connect timeout. unit: second. (default: {30})
+            callback(function): called with the waiter when connect is finished. (default: {None})
+
+        Returns:
+            AckWaiter: its response is True if connected, None if failed.
+        """
+        waiter = AckWaiter(None, None, callback)
+        error = False
+        with self.__lock:
+            conn = self.__conn
+            if conn is None:
+                self.__connect_waiter = waiter
+                try:
+                    # Reactor callbacks of the new connection wait for the lock until it is saved.
+                    self.__conn = self.__reactor.connect(self.__addr, self, timeout * 1000)
+                except Exception as e:
+                    usys.print_exception(e)
+                    self.__connect_waiter = None
+                    error = True
+        if error:
+            waiter._complete(None)
+        elif conn is not None:
+            waiter._complete(True if conn.is_connected() else None)
+        return waiter
+
+    def disconnect(self):
+        """Disconnect server.
+
+        Returns:
+            bool: True - success, False - failed.
+        """
+        conn = self.__conn
+        if conn is not None:
+            conn.close()
+        return True
+
+    def send(self, data, protocol_no, msg_no, callback=None):
+        """Send data to server.
+
+        Args:
+            data(bytes): message info
+            protocol_no(int): server response protocol no, None if no server response.
+            msg_no(int): this send message serial number.
+            callback(function): called with the waiter when server response is got or failed. (default: {None})
+
+        Returns:
+            AckWaiter: its response is server response message info or True if no server response,
+                None if failed.
+        """
+        waiter = AckWaiter(protocol_no, msg_no, callback)
+        old_waiter = None
+        with self.__lock:
+            if protocol_no is not None:
+                old_waiter = self.__waiters.pop((protocol_no, msg_no), None)
+                self.__waiters[(protocol_no, msg_no)] = waiter
+            now = self.__reactor.now()
+            send_res = self.__core.send(data, protocol_no, msg_no, now)
+            output = self.__process(now)
+        if old_waiter is not None:
+            old_waiter._complete(None)
+        self.__finish(output)
+        if protocol_no is None:
+            waiter._complete(True if send_res else None)
+        return waiter
+
+    def get_rto_info(self):
+        """Get server response timeout infomation estimated by round trip time.
+
+        Returns:
+            dict: srtt, rttvar, rto. unit: ms.
+        """
+        with self.__lock:
+            return self.__core.rto_info()
+
+    def set_callback(self, callback):
+        """Set callback for server request
+
+        Args:
+            callback(function): user callback function.
+
+        Returns:
+            bool: True - success, False - falied.
+        """
+        if callable(callback):
+            self.__callback = callback
+            return True
+        return False
+
+    def set_device_status(self, defend=0, acc=0, charge=0, alarm=0, gps=0, power=0, voltage_level=0, gsm_signal=0):
+        """Set device status used by heart beat, args are the same as GT06.set_device_status.
+
+        Returns:
+            bool: True - success, False - failed.
+        """
+        device_status = (defend, acc, charge, alarm, gps, power, voltage_level, gsm_signal)
+        try:
+            check_device_status(device_status)
+        except Exception as e:
+            usys.print_exception(e)
+            return False
+        with self.__lock:
+            self.__core.set_device_status(device_status)
+        return True
+
+    def login(self, imei, callback=None):
+        """Device login server.
+
+        Args:
+            imei(str): device imei number
+            callback(function): called with the waiter when finished. (default: {None})
+
+        Returns:
+            AckWaiter: request waiter.
+        """
+        with self.__lock:
+            msg_no, data = self.__core.get_login_msg(imei)
+        return self.send(data, 0x01, msg_no, callback)
+
+    def report_location(self, date_time, satellite_num, latitude, longitude, speed, course, lat_ns, lon_ew, gps_onoff, is_real_time,
+                        mcc, mnc, lac, cell_id, include_device_status=False, callback=None):
+        """Report GPS and LBS to server, args are the same as GT06.report_location.
+
+        Returns:
+            AckWaiter: request waiter.
+        """
+        _gps = (date_time, satellite_num, latitude, longitude, speed, course, lat_ns, lon_ew, gps_onoff, is_real_time)
+        _lbs = (mcc, mnc, lac, cell_id)
+        with self.__lock:
+            protocol_no, msg_no, data = self.__core.get_location_msg(_gps, _lbs, include_device_status)
+        return self.send(data, protocol_no, msg_no, callback)
+
+    def report_device_status(self, callback=None):
+        """Report device status to server.
+
+        Returns:
+            AckWaiter: request waiter.
+        """
+        with self.__lock:
+            msg_no, data = self.__core.get_device_status_msg()
+        return self.send(data, 0x13, msg_no, callback)
+
+    def report_device_cmd(self, server_flag, cmd_data, callback=None):
+        """Report device command to server.
+
+        Args:
+            server_flag(int): this data is from server command message.
+            cmd_data(str): device command data(This data format is provided by server.)
+
+        Returns:
+            AckWaiter: request waiter.
+        """
+        with self.__lock:
+            msg_no, data = self.__core.get_device_cmd_msg(server_flag, cmd_data)
+        return self.send(data, None, msg_no, callback)
+
+
+class GT06SessionManager(object):
+    """This class holds many independent GT06 sessions.
+
+    Each session has its own socket, lock, serial number space and heart beat. All sessions are serviced by
+    one `Reactor` thread, so no downlink thread and timer is created for each session.
+
+    Sessions created by `create_session` are `GT06` objects, they connect and write by blocking socket in user
+    thread, the reactor reads server data and runs their timers. Sessions created by `create_connection` are
+    `GT06Connection` objects, the reactor also does their connect and write.
+    """
+
+    def __init__(self, dispatcher=None, poll_interval=100):
+        """
+        Args:
+            dispatcher: CallbackDispatcher object shared by all sessions. (default: {None})
+            poll_interval: max time of one poll. unit: ms. (default: {100})
+        """
+        self.__dispatcher = dispatcher if dispatcher is not None else CallbackDispatcher()
+        self.__reactor = Reactor(poll_interval=poll_interval)
+        self.__lock = _thread.allocate_lock()
+        self.__sessions = {}
+        self.__sockets = {}
+        self.__timers = {}
+
+    def __on_readable(self, session):
+        if not session._readable():
+            self._unregister(session)
+
+    def _register(self, session):
+        """Watch session socket, it is called by session after connect."""
+        sock = session._get_socket()
+        with self.__lock:
+            self.__sockets[id(session)] = sock
+        self.__reactor.add_reader(sock, self.__on_readable, session)
+
+    def _unregister(self, session):
+        """Stop watching session socket, it is called by session before disconnect."""
+        with self.__lock:
+            sock = self.__sockets.pop(id(session), None)
+        if sock is not None:
+            try:
+                self.__reactor.remove_reader(sock)
+            except Exception as e:
+                usys.print_exception(e)
+
+    def _schedule(self, session, delay):
+        """Schedule session timeout, it is called by session when its protocol core deadline is changed.
+
+        Args:
+            session(GT06): session object.
+            delay(int): time to call session `_timeout`, None to cancel. unit: ms.
+        """
+        with self.__lock:
+            timer = self.__timers.pop(id(session), None)
+            if timer is not None:
+                timer.cancel()
+            if delay is not None:
+                self.__timers[id(session)] = self.__reactor.call_later(delay, session._timeout)
+
+    def get_reactor(self):
+        """Get reactor which services all sessions.
+
+        Returns:
+            Reactor: reactor object.
+        """
+        return self.__reactor
+
+    def create_session(self, ip=None, port=None, domain=None, **kwargs):
+        """Create a GT06 session serviced by this manager.
+
+        Args:
+            ip: server ip address (default: {None})
+            port: server port (default: {None})
+            domain: server domain (default: {None})
+            kwargs: other GT06 args, see `GT06.__init__`.
+
+        Returns:
+            GT06: session object, call its `connect` and `login` to use it.
+        """
+        session = GT06(ip=ip, port=port, domain=domain, dispatcher=self.__dispatcher, manager=self, **kwargs)
+        with self.__lock:
+            self.__sessions[id(session)] = session
+        return session
+
+    def create_connection(self, ip, port, **kwargs):
+        """Create a non-blocking GT06 session, its connect, read, write and timers are all run by reactor.
+
+        Args:
+            ip: server ip address.
+            port: server port.
+            kwargs: other GT06Connection args, see `GT06Connection.__init__`.
+
+        Returns:
+            GT06Connection: session object.
+        """
+        if "dispatcher" not in kwargs:
+            kwargs["dispatcher"] = self.__dispatcher
+        session = GT06Connection(self.__reactor, ip, port, **kwargs)
+        with self.__lock:
+            self.__sessions[id(session)] = session
+        return session
+
+    def remove_session(self, session):
+        """Disconnect session and remove it from manager.
+
+        Args:
+            session(GT06|GT06Connection): session object.
+
+        Returns:
+            bool: True - success, False - failed.
+        """
+        res = session.disconnect()
+        self._schedule(session, None)
+        with self.__lock:
+            self.__sessions.pop(id(session), None)
+        return res
+
+    def sessions(self):
+        """Get all sessions.
+
+        Returns:
+            list: session objects.
+        """
+        with self.__lock:
+            return list(self.__sessions.values())
+
+    def start(self):
+        """Start reactor thread.
+
+        Returns:
+            bool: True - success, False - failed.
+        """
+        return self.__reactor.start()
+
+    def stop(self):
+        """Stop reactor thread, sessions are not disconnected.
+
+        Returns:
+            bool: True - success, False - failed.
+        """
+        return self.__reactor.stop()
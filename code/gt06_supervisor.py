@@ -0,0 +1,209 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :gt06_supervisor.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :GT06 Reconnect Supervisor
+@version   :1.0.0
+@date      :2026-10-17 23:12:47
+@copyright :Copyright (c) 2022
+"""
+
+import usys
+import _thread
+
+try:
+    import urandom as random
+except ImportError:
+    import random
+
+from usr.logging import getLogger
+
+logger = getLogger(__name__)
+
+
+class Backoff(object):
+    """Exponential backoff delay with random jitter."""
+
+    def __init__(self, base_delay=1000, max_delay=300000, factor=2, jitter=0.5):
+        """
+        Args:
+            base_delay(int): delay of the first retry. unit: ms. (default: {1000})
+            max_delay(int): max delay. unit: ms. (default: {300000})
+            factor(int): delay is multiplied by factor after each retry. (default: {2})
+            jitter(float): delay is reduced by random percent up to jitter, so devices do not retry
+                at the same time. (default: {0.5})
+        """
+        self.__base_delay = base_delay
+        self.__max_delay = max_delay
+        self.__factor = factor
+        self.__jitter = jitter
+        self.__delay = base_delay
+
+    def next(self):
+        """Get delay of next retry and increase delay.
+
+        Returns:
+            int: unit: ms.
+        """
+        delay = self.__delay
+        self.__delay = min(self.__delay * self.__factor, self.__max_delay)
+        return delay - random.randint(0, int(delay * self.__jitter))
+
+    def reset(self):
+        """Reset delay to base delay after success."""
+        self.__delay = self.__base_delay
+
+
+class ReconnectSupervisor(object):
+    """This class keeps a GT06 object connected and logged in.
+
+    When the connection is lost, it reconnects with exponential backoff instead of restarting the device,
+    and logs in again. Messages saved in the GT06 queue are sent after login success.
+    """
+
+    def __init__(self, client, imei, backoff=None, timers=None):
+        """
+        Args:
+            client(GT06): GT06 object.
+            imei(str): device imei number used to login again.
+            backoff(Backoff): reconnect delay, default Backoff is used if None. (default: {None})
+            timers: object has `now` and `call_later` to schedule reconnect, timers of the client are used
+                if None, they are the reactor of its session manager or the shared timer service. (default: {None})
+        """
+        self.__client = client
+        self.__imei = imei
+        self.__backoff = backoff if backoff is not None else Backoff()
+        self.__timers = timers if timers is not None else client._get_timers()
+        self.__lock = _thread.allocate_lock()
+        self.__running = False
+        self.__connecting = False
+        self.__connected = False
+        self.__timer = None
+        self.__lost_time = None
+        self.__stats = {"attempts": 0, "failures": 0, "reconnects": 0, "connect_time": 0, "max_connect_time": 0, "downtime": 0}
+
+    def __schedule(self, delay):
+        """Schedule a reconnect attempt, lock must be held."""
+        if self.__timer is not None:
+            self.__timer.cancel()
+        self.__timer = self.__timers.call_later(delay, self.__start_attempt)
+        logger.debug("Reconnect after %s ms." % delay)
+
+    def __start_attempt(self):
+        with self.__lock:
+            self.__timer = None
+            if not self.__running or self.__connecting:
+                return
+            self.__connecting = True
+        # Connect blocks, do not run it in timer callback.
+        _thread.start_new_thread(self.__attempt, ())
+
+    def __attempt(self):
+        start = self.__timers.now()
+        res = False
+        try:
+            self.__client.disconnect()
+            if self.__client.connect():
+                res = self.__client.login(self.__imei)
+        except Exception as e:
+            usys.print_exception(e)
+
+        now = self.__timers.now()
+        with self.__lock:
+            self.__connecting = False
+            self.__stats["attempts"] += 1
+            self.__connected = res
+            if res:
+                connect_time = now - start
+                self.__stats["connect_time"] = connect_time
+                self.__stats["max_connect_time"] = max(self.__stats["max_connect_time"], connect_time)
+                if self.__lost_time is not None:
+                    self.__stats["reconnects"] += 1
+                    self.__stats["downtime"] += now - self.__lost_time
+                    self.__lost_time = None
+                self.__backoff.reset()
+            else:
+                self.__stats["failures"] += 1
+                logger.error("GT06 reconnect failed.")
+                if self.__running:
+                    self.__schedule(self.__backoff.next())
+
+    def _connection_lost(self):
+        """Connection is lost, it is called by client."""
+        with self.__lock:
+            self.__connected = False
+            if self.__lost_time is None:
+                self.__lost_time = self.__timers.now()
+            if self.__running and not self.__connecting and self.__timer is None:
+                self.__schedule(self.__backoff.next())
+
+    def start(self, connected=False):
+        """Start supervising client.
+
+        Args:
+            connected(bool): client is already connected and logged in, otherwise connect at once. (default: {False})
+
+        Returns:
+            bool: True - success, False - failed.
+        """
+        self.__client._set_supervisor(self)
+        with self.__lock:
+            self.__running = True
+            self.__connected = connected
+            if not connected:
+                self.__schedule(0)
+        return True
+
+    def stop(self):
+        """Stop supervising client, the client connection is not closed.
+
+        Returns:
+            bool: True - success, False - failed.
+        """
+        with self.__lock:
+            self.__running = False
+            if self.__timer is not None:
+                self.__timer.cancel()
+                self.__timer = None
+        self.__client._set_supervisor(None)
+        return True
+
+    def is_connected(self):
+        """Get whether client is connected and logged in by supervisor.
+
+        Returns:
+            bool: True - connected, False - disconnected or reconnecting.
+        """
+        with self.__lock:
+            return self.__connected
+
+    def stats(self):
+        """Get reconnect statistics.
+
+        Returns:
+            dict:
+                attempts(int): connect and login attempt count.
+                failures(int): failed attempt count.
+                reconnects(int): reconnect success count after connection lost.
+                connect_time(int): connect and login time of last success. unit: ms.
+                max_connect_time(int): max connect and login time. unit: ms.
+                downtime(int): total time from connection lost to reconnect success. unit: ms.
+        """
+        with self.__lock:
+            return dict(self.__stats)
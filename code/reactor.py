@@ -0,0 +1,375 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :reactor.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :Non-blocking socket I/O loop on select.poll
+@version   :1.0.0
+@date      :2026-10-17 20:06:12
+@copyright :Copyright (c) 2022
+"""
+
+import usys
+import usocket
+import _thread
+
+try:
+    import uselect as select
+except ImportError:
+    import select
+
+from usr.logging import getLogger
+from usr.timer_wheel import TimerWheel
+
+logger = getLogger(__name__)
+
+_EAGAIN = 11
+_EINPROGRESS = 115
+
+
+class Connection(object):
+    """Non-blocking TCP connection serviced by `Reactor`.
+
+    The protocol object receives connection events in reactor thread:
+        connection_made(conn): connection is established.
+        data_received(data): data is received.
+        connection_lost(): connection is failed or closed.
+    """
+
+    def __init__(self, reactor, sock, protocol):
+        self.__reactor = reactor
+        self.__sock = sock
+        self.__protocol = protocol
+        self.__lock = _thread.allocate_lock()
+        self.__buffer = b""
+        self.__connected = False
+        self.__closed = False
+        self.__connect_timer = None
+        self.key = sock.fileno() if hasattr(sock, "fileno") else sock
+
+    def __events(self):
+        """Poll events of this connection, lock must be held."""
+        if not self.__connected or self.__buffer:
+            return select.POLLIN | select.POLLOUT
+        return select.POLLIN
+
+    def __send_buffer(self):
+        """Write buffered data as much as possible, lock must be held."""
+        while self.__buffer:
+            try:
+                num = self.__sock.send(self.__buffer)
+            except OSError as e:
+                if e.args[0] == _EAGAIN:
+                    return
+                raise
+            if not num:
+                return
+            self.__buffer = self.__buffer[num:]
+
+    def is_connected(self):
+        """Get connection status.
+
+        Returns:
+            bool: True - connected, False - connecting or closed.
+        """
+        return self.__connected and not self.__closed
+
+    def write(self, data):
+        """Write data, it can be called in any thread.
+
+        Data is written at once if socket is writable, the rest data is written by reactor thread.
+
+        Args:
+            data(bytes): byte stream.
+
+        Returns:
+            bool: True - written or buffered, False - connection is closed.
+        """
+        error = False
+        with self.__lock:
+            if self.__closed:
+                return False
+            idle = not self.__buffer
+            self.__buffer += data
+            if self.__connected:
+                try:
+                    self.__send_buffer()
+                except Exception as e:
+                    usys.print_exception(e)
+                    error = True
+            if not error and idle and self.__buffer:
+                self.__reactor._modify(self, self.__events())
+        if error:
+            self.__reactor.call_soon(self.close)
+            return False
+        return True
+
+    def close(self):
+        """Close connection, protocol `connection_lost` is called in reactor thread."""
+        with self.__lock:
+            if self.__closed:
+                return
+            self.__closed = True
+            self.__buffer = b""
+        if self.__connect_timer is not None:
+            self.__connect_timer.cancel()
+        self.__reactor._unregister(self)
+        try:
+            self.__sock.close()
+        except Exception as e:
+            usys.print_exception(e)
+        self.__reactor.call_soon(self.__protocol.connection_lost)
+
+    def _start(self, addr, timeout):
+        """Start non-blocking connect."""
+        self.__sock.setblocking(False)
+        try:
+            self.__sock.connect(addr)
+        except OSError as e:
+            if e.args[0] not in (_EINPROGRESS, _EAGAIN):
+                usys.print_exception(e)
+                self.close()
+                return
+        # Register after connect is started, socket not connecting is reported as hung up by poll.
+        self.__reactor._register(self, self.__events())
+        self.__connect_timer = self.__reactor.call_later(timeout, self.__connect_timeout)
+
+    def __connect_timeout(self):
+        if not self.__connected:
+            logger.error("Connect timeout.")
+            self.close()
+
+    def _handle(self, events):
+        """Handle poll events in reactor thread."""
+        if events & (select.POLLERR | select.POLLHUP) and (not self.__connected or not events & select.POLLIN):
+            self.close()
+            return
+        if events & select.POLLIN:
+            try:
+                data = self.__sock.recv(4096)
+            except OSError as e:
+                if e.args[0] == _EAGAIN:
+                    return
+                data = b""
+            if not data:
+                self.close()
+                return
+            self.__protocol.data_received(data)
+        if events & select.POLLOUT:
+            made = False
+            try:
+                with self.__lock:
+                    if self.__closed:
+                        return
+                    if not self.__connected:
+                        made = self.__connected = True
+                    self.__send_buffer()
+                    self.__reactor._modify(self, self.__events())
+            except Exception as e:
+                usys.print_exception(e)
+                self.close()
+                return
+            if made:
+                if self.__connect_timer is not None:
+                    self.__connect_timer.cancel()
+                self.__protocol.connection_made(self)
+
+
+class Reactor(object):
+    """This class services socket connects, reads, writes and timers of many connections in one thread.
+
+    Functions in this class can be called in any thread, callbacks are run in reactor thread.
+    """
+
+    def __init__(self, poll_interval=1000, wheel=None):
+        """
+        Args:
+            poll_interval(int): max time of one poll. unit: ms. (default: {1000})
+            wheel(TimerWheel): timer wheel for all timers of reactor, a new one is created if None. (default: {None})
+        """
+        self.__poll_interval = poll_interval
+        self.__poll = select.poll()
+        self.__lock = _thread.allocate_lock()
+        self.__wheel = wheel if wheel is not None else TimerWheel()
+        self.__poll_deadline = 0
+        self.__handlers = {}
+        self.__thread = None
+        self.__running = False
+        self.__wakeup_sock = None
+        if hasattr(usocket, "socketpair"):
+            # Wake up poll when events or timers are changed by other threads.
+            self.__wakeup_sock, wakeup_read_sock = usocket.socketpair()
+            self.__wakeup_sock.setblocking(False)
+            wakeup_read_sock.setblocking(False)
+            self.add_reader(wakeup_read_sock, wakeup_read_sock.recv, 64)
+
+    def __wakeup(self):
+        if self.__wakeup_sock is not None:
+            try:
+                self.__wakeup_sock.send(b"\x00")
+            except Exception:
+                pass
+
+    def _register(self, handler, events):
+        with self.__lock:
+            self.__handlers[handler.key] = handler
+            self.__poll.register(handler.key, events)
+        self.__wakeup()
+
+    def _modify(self, handler, events):
+        with self.__lock:
+            if handler.key in self.__handlers:
+                self.__poll.modify(handler.key, events)
+        self.__wakeup()
+
+    def _unregister(self, handler):
+        with self.__lock:
+            if self.__handlers.pop(handler.key, None) is not None:
+                self.__poll.unregister(handler.key)
+
+    def now(self):
+        """Get reactor monotonic time.
+
+        Returns:
+            int: unit: ms.
+        """
+        return self.__wheel.now()
+
+    def call_later(self, delay, func, *args):
+        """Run function in reactor thread after delay.
+
+        Args:
+            delay(int): unit: ms.
+            func(function): function to run.
+            args: function args.
+
+        Returns:
+            Timer: timer handle, it can be cancelled.
+        """
+        timer = self.__wheel.schedule(delay, func, *args)
+        if self.__wheel.now() + delay < self.__poll_deadline:
+            self.__wakeup()
+        return timer
+
+    def call_soon(self, func, *args):
+        """Run function in reactor thread as soon as possible.
+
+        Returns:
+            Timer: timer handle.
+        """
+        return self.call_later(0, func, *args)
+
+    def connect(self, addr, protocol, timeout=30000):
+        """Start non-blocking TCP connect.
+
+        Args:
+            addr(tuple): (ip, port).
+            protocol(object): connection event receiver, see `Connection`.
+            timeout(int): connect timeout. unit: ms. (default: {30000})
+
+        Returns:
+            Connection: connection object.
+        """
+        af = usocket.AF_INET6 if addr[0].find(":") != -1 else usocket.AF_INET
+        sock = usocket.socket(af, usocket.SOCK_STREAM, usocket.IPPROTO_TCP)
+        conn = Connection(self, sock, protocol)
+        conn._start(addr, timeout)
+        return conn
+
+    def add_reader(self, sock, func, *args):
+        """Run function in reactor thread when socket is readable.
+
+        Args:
+            sock(usocket.socket): socket object.
+            func(function): function to run.
+            args: function args.
+        """
+        self._register(_Reader(sock, func, args), select.POLLIN)
+
+    def remove_reader(self, sock):
+        """Stop watching socket added by `add_reader`, call it before socket is closed.
+
+        Args:
+            sock(usocket.socket): socket object.
+        """
+        self._unregister(_Reader(sock, None, ()))
+
+    def run_once(self, timeout=None):
+        """Poll socket events once and run due timers.
+
+        Args:
+            timeout(int): max poll time, poll interval is used if None. unit: ms. (default: {None})
+        """
+        timeout = self.__poll_interval if timeout is None else timeout
+        delay = self.__wheel.next_delay()
+        if delay is not None:
+            timeout = min(delay, timeout)
+        self.__poll_deadline = self.__wheel.now() + timeout
+        for item in self.__poll.poll(timeout):
+            handler = self.__handlers.get(item[0])
+            if handler is not None:
+                try:
+                    handler._handle(item[1])
+                except Exception as e:
+                    usys.print_exception(e)
+
+        self.__poll_deadline = 0
+        self.__wheel.advance()
+
+    def __loop(self):
+        while self.__running:
+            self.run_once()
+
+    def run(self):
+        """Run reactor loop in current thread until `stop` is called."""
+        self.__running = True
+        self.__loop()
+
+    def start(self):
+        """Start reactor thread.
+
+        Returns:
+            bool: True - success, False - failed.
+        """
+        if not self.__running:
+            self.__running = True
+            self.__thread = _thread.start_new_thread(self.__loop, ())
+        return True
+
+    def stop(self):
+        """Stop reactor loop, connections are not closed.
+
+        Returns:
+            bool: True - success, False - failed.
+        """
+        self.__running = False
+        self.__thread = None
+        self.__wakeup()
+        return True
+
+
+class _Reader(object):
+    """Socket watched by `Reactor.add_reader`."""
+
+    def __init__(self, sock, func, args):
+        self.key = sock.fileno() if hasattr(sock, "fileno") else sock
+        self.__func = func
+        self.__args = args
+
+    def _handle(self, events):
+        self.__func(*self.__args)
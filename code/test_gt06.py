@@ -27,7 +27,9 @@
 import net
 import utime
 import modem
+import ubinascii
 from usr.gt06 import GT06
+from usr.gt06_msg import pack_msg, GT06MsgParse, GT06MsgFramer
 from usr.logging import getLogger
 
 logger = getLogger(__name__)
@@ -60,6 +62,37 @@ def test_gt06_server_callback(args):
     logger.debug("Server command args: %s" % str(args))
 
 
+def test_gt06_msg_pack():
+    err_msg = "Test GT06 message pack %s"
+    imei = ubinascii.unhexlify("0353413532150362")
+    msg = ubinascii.unhexlify("78780d01035341353215036200011f9d0d0a")
+    assert pack_msg(0x01, 1, imei) == msg, err_msg % "falied"
+    logger.debug(err_msg % "success")
+
+
+def test_gt06_msg_parse():
+    err_msg = "Test GT06 message parse %s"
+    msg = pack_msg(0x80, 7, b"\x09\x00\x00\x30\x39hello")
+    msg_info = GT06MsgParse().parse(msg)
+    assert msg_info is not None, err_msg % "falied"
+    assert (msg_info.protocol_no, msg_info.msg_no) == (0x80, 7), err_msg % "falied"
+    assert (msg_info.server_flag, msg_info.cmd_data) == (12345, "hello"), err_msg % "falied"
+    assert GT06MsgParse().parse(msg[:-4] + b"\x00\x00\x0d\x0a") is None, err_msg % "falied"
+    logger.debug(err_msg % "success")
+
+
+def test_gt06_msg_framer():
+    err_msg = "Test GT06 message framer %s"
+    msgs = [pack_msg(0x13, 1), pack_msg(0x80, 2, b"\x05\x00\x00\x00\x01")]
+    stream = b"\x00" + msgs[0] + msgs[1]
+    framer = GT06MsgFramer()
+    assert framer.feed(stream[:4]) == [], err_msg % "falied"
+    assert [bytes(i) for i in framer.feed(stream[4:20])] == msgs[:1], err_msg % "falied"
+    assert [bytes(i) for i in framer.feed(stream[20:])] == msgs[1:], err_msg % "falied"
+    assert framer.pending() == 0, err_msg % "falied"
+    logger.debug(err_msg % "success")
+
+
 def test_gt06_init():
     ip = "220.180.239.212"
     port = 7611
@@ -146,6 +179,9 @@ def test_gt06_disconnect():
 
 
 def test_gt06():
+    test_gt06_msg_pack()
+    test_gt06_msg_parse()
+    test_gt06_msg_framer()
     test_gt06_init()
     test_gt06_set_callback()
     test_gt06_set_device_status()
@@ -0,0 +1,189 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :timer_wheel.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :Hierarchical timer wheel
+@version   :1.0.0
+@date      :2026-10-17 21:40:05
+@copyright :Copyright (c) 2022
+"""
+
+import usys
+import _thread
+from usr.common import MonotonicClock
+
+
+class Timer(object):
+    """Timer handle returned by `TimerWheel.schedule`."""
+
+    def __init__(self, wheel, expires, func, args):
+        self.expires = expires
+        self.cancelled = False
+        self._slot = None
+        self.__wheel = wheel
+        self.__func = func
+        self.__args = args
+
+    def cancel(self):
+        """Cancel timer, it does nothing if the timer is already run."""
+        self.__wheel._cancel(self)
+
+    def _run(self):
+        self.__func(*self.__args)
+
+
+class TimerWheel(object):
+    """This class is hierarchical timer wheel, schedule and cancel are O(1).
+
+    Level 0 has one slot per tick, each slot of level n covers all slots of level n - 1. Timers of upper
+    levels are moved down when the lower level wraps around. Timers further than the wheel range are kept
+    in the last level and moved again when they are reached. All timers use the clock of the wheel.
+    """
+
+    def __init__(self, tick_ms=10, slot_bits=6, levels=4):
+        """
+        Args:
+            tick_ms(int): time of one tick, it is the timer precision. unit: ms. (default: {10})
+            slot_bits(int): each level has 2 ** slot_bits slots. (default: {6})
+            levels(int): level count, wheel range is tick_ms * 2 ** (slot_bits * levels). (default: {4})
+        """
+        self.__tick_ms = tick_ms
+        self.__bits = slot_bits
+        self.__mask = (1 << slot_bits) - 1
+        self.__levels = [[{} for _ in range(1 << slot_bits)] for _ in range(levels)]
+        self.__lock = _thread.allocate_lock()
+        self.__clock = MonotonicClock()
+        self.__current = 0
+        self.__count = 0
+
+    def __insert(self, timer):
+        """Put timer to the slot of its expire tick, lock must be held."""
+        diff = timer.expires - self.__current
+        level = 0
+        while level < len(self.__levels) - 1 and diff >= 1 << (self.__bits * (level + 1)):
+            level += 1
+        expires = timer.expires
+        if diff >= 1 << (self.__bits * (level + 1)):
+            # Out of wheel range, keep it in the last slot of the last level.
+            expires = self.__current + (1 << (self.__bits * (level + 1))) - 1
+        slot = self.__levels[level][(expires >> (self.__bits * level)) & self.__mask]
+        slot[id(timer)] = timer
+        timer._slot = slot
+
+    def __cascade(self, level):
+        """Move timers of current slot of the level to lower levels, lock must be held."""
+        slot = self.__levels[level][(self.__current >> (self.__bits * level)) & self.__mask]
+        timers = list(slot.values())
+        slot.clear()
+        for timer in timers:
+            self.__insert(timer)
+
+    def now(self):
+        """Get wheel clock time.
+
+        Returns:
+            int: monotonic time. unit: ms.
+        """
+        with self.__lock:
+            return self.__clock.now()
+
+    def schedule(self, delay, func, *args):
+        """Run function after delay when `advance` is called.
+
+        Args:
+            delay(int): unit: ms.
+            func(function): function to run.
+            args: function args.
+
+        Returns:
+            Timer: timer handle, it can be cancelled.
+        """
+        with self.__lock:
+            # Round up, timer never runs before the delay.
+            expires = (self.__clock.now() + max(delay, 0) + self.__tick_ms - 1) // self.__tick_ms
+            timer = Timer(self, max(expires, self.__current + 1), func, args)
+            self.__insert(timer)
+            self.__count += 1
+        return timer
+
+    def _cancel(self, timer):
+        with self.__lock:
+            if timer._slot is not None:
+                timer._slot.pop(id(timer), None)
+                timer._slot = None
+                timer.cancelled = True
+                self.__count -= 1
+
+    def advance(self):
+        """Run timers expired by wheel clock.
+
+        Returns:
+            int: count of run timers.
+        """
+        timers = []
+        with self.__lock:
+            target = self.__clock.now() // self.__tick_ms
+            if self.__count == 0:
+                self.__current = max(self.__current, target)
+            while self.__current < target:
+                self.__current += 1
+                for level in range(len(self.__levels) - 1, 0, -1):
+                    if self.__current & ((1 << (self.__bits * level)) - 1) == 0:
+                        self.__cascade(level)
+                slot = self.__levels[0][self.__current & self.__mask]
+                for timer in slot.values():
+                    timer._slot = None
+                    timers.append(timer)
+                slot.clear()
+            self.__count -= len(timers)
+        for timer in timers:
+            try:
+                timer._run()
+            except Exception as e:
+                usys.print_exception(e)
+        return len(timers)
+
+    def next_delay(self):
+        """Get the time to call `advance` again.
+
+        Timers of upper levels are reported at the next wrap around of level 0.
+
+        Returns:
+            int: unit: ms. None if no timer is waiting.
+        """
+        with self.__lock:
+            if self.__count == 0:
+                return None
+            elapsed = self.__clock.now() - self.__current * self.__tick_ms
+            level0 = self.__levels[0]
+            for offset in range(1, len(level0) + 1):
+                index = (self.__current + offset) & self.__mask
+                if level0[index]:
+                    return max(offset * self.__tick_ms - elapsed, 0)
+                if index == 0:
+                    break
+            return max(offset * self.__tick_ms - elapsed, 0)
+
+    def size(self):
+        """Get count of waiting timers.
+
+        Returns:
+            int: timer count.
+        """
+        return self.__count
@@ -0,0 +1,44 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :misc.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :QuecPython misc on CPython
+@version   :1.0.0
+@date      :2026-10-17 01:26:04
+@copyright :Copyright (c) 2022
+"""
+
+import os
+import sys
+
+
+class Power(object):
+    """Device power on host, restart and power down exit the process."""
+
+    @staticmethod
+    def powerRestart():
+        print("Power restart, exit process.")
+        sys.stdout.flush()
+        os._exit(1)
+
+    @staticmethod
+    def powerDown():
+        print("Power down, exit process.")
+        sys.stdout.flush()
+        os._exit(0)
@@ -0,0 +1,112 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :osTimer.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :QuecPython osTimer on CPython
+@version   :1.0.0
+@date      :2026-10-17 01:18:26
+@copyright :Copyright (c) 2022
+"""
+
+import sys
+import heapq
+import threading
+import traceback
+from time import monotonic
+
+_lock = threading.Condition()
+_heap = []
+_seq = 0
+_task = None
+
+
+def _run():
+    """Timer task, all timer callbacks run one by one like QuecPython."""
+    while True:
+        with _lock:
+            while not _heap or _heap[0][0] > monotonic():
+                _lock.wait(_heap[0][0] - monotonic() if _heap else None)
+            _, _, timer, gen = heapq.heappop(_heap)
+            if gen != timer._gen:
+                continue
+            if timer._periodic:
+                timer._push()
+            else:
+                timer._gen += 1
+            callback = timer._callback
+        try:
+            callback(None)
+        except Exception as e:
+            traceback.print_exception(type(e), e, e.__traceback__, file=sys.stdout)
+
+
+class osTimer(object):
+    """CPython timer with QuecPython osTimer functions."""
+
+    def __init__(self):
+        self._gen = 0
+        self._period = 0
+        self._periodic = 0
+        self._callback = None
+
+    def _push(self):
+        """Put timer to the heap, lock must be held."""
+        global _seq, _task
+        _seq += 1
+        heapq.heappush(_heap, (monotonic() + self._period / 1000, _seq, self, self._gen))
+        if _task is None:
+            _task = threading.Thread(target=_run, name="osTimer", daemon=True)
+            _task.start()
+        _lock.notify()
+
+    def start(self, period, periodic, callback):
+        """Start timer.
+
+        Args:
+            period(int): unit: ms.
+            periodic(int): 1 - periodic, 0 - once.
+            callback(function): callback(args), args is None.
+
+        Returns:
+            int: 0 - success.
+        """
+        with _lock:
+            self._gen += 1
+            self._period = period
+            self._periodic = periodic
+            self._callback = callback
+            self._push()
+        return 0
+
+    def stop(self):
+        """Stop timer.
+
+        Returns:
+            int: 0 - success.
+        """
+        with _lock:
+            self._gen += 1
+        return 0
+
+    def delete_timer(self):
+        return self.stop()
+
+
+# `import osTimer` gets the class like QuecPython.
+sys.modules[__name__] = osTimer
@@ -0,0 +1,27 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :ubinascii.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :QuecPython ubinascii on CPython
+@version   :1.0.0
+@date      :2026-10-17 01:08:30
+@copyright :Copyright (c) 2022
+"""
+
+from binascii import a2b_base64, b2a_base64, crc32, hexlify, unhexlify
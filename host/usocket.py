@@ -0,0 +1,129 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :usocket.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :QuecPython usocket on CPython
+@version   :1.0.0
+@date      :2026-10-17 01:12:45
+@copyright :Copyright (c) 2022
+"""
+
+import errno
+import socket as _socket
+from socket import (
+    AF_INET, AF_INET6, SOCK_STREAM, SOCK_DGRAM, SOCK_RAW, IPPROTO_IP, IPPROTO_TCP, IPPROTO_UDP,
+    SOL_SOCKET, SO_REUSEADDR, SO_KEEPALIVE, TCP_NODELAY, getaddrinfo
+)
+
+# lwIP TCP state returned by getsocketsta, indexed by Linux TCP_INFO state.
+_TCP_STATES = {1: 4, 2: 2, 3: 3, 4: 5, 5: 6, 6: 10, 7: 0, 8: 7, 9: 9, 10: 1, 11: 8}
+
+
+class socket(_socket.socket):
+    """CPython socket with QuecPython functions.
+
+    Timeout raises OSError(ETIMEDOUT) like QuecPython instead of socket.timeout.
+    """
+
+    def __init__(self, af=AF_INET, type=SOCK_STREAM, proto=0, fileno=None):
+        super().__init__(af, type, proto, fileno)
+
+    def connect(self, address):
+        try:
+            return super().connect(address)
+        except _socket.timeout:
+            raise OSError(errno.ETIMEDOUT)
+
+    def accept(self):
+        try:
+            fd, address = self._accept()
+        except _socket.timeout:
+            raise OSError(errno.ETIMEDOUT)
+        sock = socket(self.family, self.type, self.proto, fileno=fd)
+        if _socket.getdefaulttimeout() is None and self.gettimeout():
+            sock.setblocking(True)
+        return sock, address
+
+    def recv(self, bufsize, flags=0):
+        try:
+            return super().recv(bufsize, flags)
+        except _socket.timeout:
+            raise OSError(errno.ETIMEDOUT)
+
+    def recvfrom(self, bufsize, flags=0):
+        try:
+            return super().recvfrom(bufsize, flags)
+        except _socket.timeout:
+            raise OSError(errno.ETIMEDOUT)
+
+    def send(self, data, flags=0):
+        try:
+            return super().send(data, flags)
+        except _socket.timeout:
+            raise OSError(errno.ETIMEDOUT)
+
+    def sendall(self, data, flags=0):
+        try:
+            return super().sendall(data, flags)
+        except _socket.timeout:
+            raise OSError(errno.ETIMEDOUT)
+
+    def sendto(self, data, address):
+        try:
+            return super().sendto(data, address)
+        except _socket.timeout:
+            raise OSError(errno.ETIMEDOUT)
+
+    def read(self, size=4096):
+        return self.recv(size)
+
+    def write(self, data):
+        return self.send(data)
+
+    def getsocketsta(self):
+        """Get TCP state.
+
+        Returns:
+            int: lwIP TCP state, 0 - CLOSED, 2 - SYN_SENT, 4 - ESTABLISHED, 7 - CLOSE_WAIT ...
+        """
+        if self.fileno() < 0:
+            return 0
+        try:
+            info = self.getsockopt(IPPROTO_TCP, _socket.TCP_INFO, 1)
+            return _TCP_STATES.get(info[0], 0)
+        except (AttributeError, OSError):
+            # TCP_INFO is only on Linux.
+            try:
+                self.getpeername()
+                return 4
+            except OSError:
+                return 0
+
+
+def socketpair():
+    """Get a pair of connected sockets.
+
+    Returns:
+        tuple: (socket, socket)
+    """
+    sock1, sock2 = _socket.socketpair()
+    return (
+        socket(sock1.family, sock1.type, sock1.proto, sock1.detach()),
+        socket(sock2.family, sock2.type, sock2.proto, sock2.detach()),
+    )
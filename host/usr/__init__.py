@@ -0,0 +1,56 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :__init__.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :`usr` package on CPython, it is the code directory like /usr on the device
+@version   :1.0.0
+@date      :2026-10-17 01:31:40
+@copyright :Copyright (c) 2022
+"""
+
+import os
+import ctypes
+import _thread
+
+__path__.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "code"))
+
+
+def _stop_thread(thread_id):
+    """Stop thread like QuecPython `_thread.stop_thread`.
+
+    CPython can not kill a thread, SystemExit is raised in the thread when it runs python code again,
+    so a thread blocked in socket read stops after the socket is closed or read timeout.
+
+    Args:
+        thread_id(int): thread id returned by `_thread.start_new_thread`.
+
+    Returns:
+        int: 0 - success, -1 - failed.
+    """
+    if thread_id == _thread.get_ident():
+        raise SystemExit()
+    try:
+        res = ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(thread_id), ctypes.py_object(SystemExit))
+    except AttributeError:
+        return -1
+    return 0 if res == 1 else -1
+
+
+if not hasattr(_thread, "stop_thread"):
+    _thread.stop_thread = _stop_thread
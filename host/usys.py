@@ -0,0 +1,39 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :usys.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :QuecPython usys on CPython
+@version   :1.0.0
+@date      :2026-10-17 01:02:11
+@copyright :Copyright (c) 2022
+"""
+
+import sys
+import traceback
+from sys import argv, byteorder, exit, implementation, maxsize, modules, path, platform, stderr, stdin, stdout, version, version_info
+
+
+def print_exception(exc, file=None):
+    """Print exception with traceback like MicroPython.
+
+    Args:
+        exc(Exception): exception object.
+        file: output stream, sys.stdout is used if None. (default: {None})
+    """
+    traceback.print_exception(type(exc), exc, exc.__traceback__, file=file if file is not None else sys.stdout)
@@ -0,0 +1,82 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :utime.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :QuecPython utime on CPython
+@version   :1.0.0
+@date      :2026-10-17 01:04:37
+@copyright :Copyright (c) 2022
+"""
+
+import time as _time
+
+# Ticks wrap around like MicroPython, so code must use ticks_diff.
+_TICKS_PERIOD = 1 << 30
+_TICKS_MAX = _TICKS_PERIOD - 1
+_TICKS_HALF = _TICKS_PERIOD // 2
+
+
+def sleep(seconds):
+    _time.sleep(seconds)
+
+
+def sleep_ms(ms):
+    _time.sleep(ms / 1000)
+
+
+def sleep_us(us):
+    _time.sleep(us / 1000000)
+
+
+def ticks_ms():
+    return int(_time.monotonic() * 1000) & _TICKS_MAX
+
+
+def ticks_us():
+    return int(_time.monotonic() * 1000000) & _TICKS_MAX
+
+
+def ticks_cpu():
+    return _time.perf_counter_ns() & _TICKS_MAX
+
+
+def ticks_add(ticks, delta):
+    return (ticks + delta) & _TICKS_MAX
+
+
+def ticks_diff(ticks1, ticks2):
+    """Get signed difference of two ticks values, it is correct after ticks wrap around."""
+    return ((ticks1 - ticks2 + _TICKS_HALF) & _TICKS_MAX) - _TICKS_HALF
+
+
+def time():
+    return int(_time.time())
+
+
+def localtime(secs=None):
+    """Get local time.
+
+    Returns:
+        tuple: (year, month, mday, hour, minute, second, weekday, yearday)
+    """
+    return tuple(_time.localtime(secs)[:8])
+
+
+def mktime(t):
+    return int(_time.mktime(tuple(t[:8]) + (-1,)))
@@ -0,0 +1,44 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :conftest.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :Host tests run on CPython with `host` modules and `tools`
+@version   :1.0.0
+@date      :2026-10-17 09:02:15
+@copyright :Copyright (c) 2022
+"""
+
+import os
+import sys
+import pytest
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for _path in ("host", "tools"):
+    if os.path.join(_ROOT, _path) not in sys.path:
+        sys.path.insert(0, os.path.join(_ROOT, _path))
+
+
+@pytest.fixture
+def server():
+    """Loopback GT06 server, stopped after the test."""
+    from gt06_server import GT06Server
+    server = GT06Server()
+    server.start()
+    yield server
+    server.stop()
@@ -0,0 +1,380 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :test_common.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :CallbackDispatcher, WriteBatcher, Resolver and SocketBase tests
+@version   :1.0.0
+@date      :2026-10-17 10:40:22
+@copyright :Copyright (c) 2022
+"""
+
+import time
+import pytest
+import threading
+
+import usocket
+from usr.common import CallbackDispatcher, get_dispatcher, DISPATCH_DROP_OLDEST, DISPATCH_REJECT, DISPATCH_BLOCK
+from usr.common import WriteBatcher, Resolver, SocketBase, RESOLVE_ROUND_ROBIN, RESOLVE_FASTEST
+
+HOST = "gt06.example.com"
+IPS = ["10.0.0.1", "10.0.0.2", "10.0.0.3"]
+
+
+def _wait(func, timeout=2):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if func():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+def _busy(dispatcher):
+    """Occupy the only worker until the returned event is set."""
+    started = threading.Event()
+    release = threading.Event()
+
+    def run():
+        started.set()
+        release.wait(5)
+
+    assert dispatcher.submit(run, key="busy")
+    assert started.wait(2)
+    return release
+
+
+def test_reject():
+    dispatcher = CallbackDispatcher(size=1, queue_size=1, policy=DISPATCH_REJECT)
+    done = []
+    release = _busy(dispatcher)
+    assert dispatcher.submit(done.append, (1,))
+    assert not dispatcher.submit(done.append, (2,))
+    release.set()
+    assert _wait(lambda: dispatcher.stats()["done"] == 2)
+    assert done == [1]
+    stats = dispatcher.stats()
+    assert stats["submitted"] == 3 and stats["rejected"] == 1 and stats["dropped"] == 0
+
+
+def test_drop_oldest():
+    dispatcher = CallbackDispatcher(size=1, queue_size=2, policy=DISPATCH_DROP_OLDEST)
+    done = []
+    release = _busy(dispatcher)
+    for i in range(4):
+        assert dispatcher.submit(done.append, (i,))
+    assert dispatcher.stats()["depth"] == 2
+    release.set()
+    assert _wait(lambda: dispatcher.stats()["done"] == 3)
+    assert done == [2, 3]
+    stats = dispatcher.stats()
+    assert stats["dropped"] == 2 and stats["rejected"] == 0 and stats["max_depth"] == 2
+
+
+def test_block():
+    dispatcher = CallbackDispatcher(size=1, queue_size=1, policy=DISPATCH_BLOCK)
+    done = []
+    release = _busy(dispatcher)
+    assert dispatcher.submit(done.append, (1,))
+    results = []
+    submitter = threading.Thread(target=lambda: results.append(dispatcher.submit(done.append, (2,))))
+    submitter.start()
+    submitter.join(0.2)
+    assert submitter.is_alive()
+    release.set()
+    submitter.join(2)
+    assert results == [True]
+    assert _wait(lambda: dispatcher.stats()["done"] == 3)
+    assert done == [1, 2]
+
+
+def test_key_order():
+    dispatcher = CallbackDispatcher(size=4, queue_size=32)
+    done = {"a": [], "b": []}
+    running = {"a": 0, "b": 0}
+    overlapped = []
+    lock = threading.Lock()
+
+    def run(key, i):
+        with lock:
+            running[key] += 1
+            if running[key] > 1:
+                overlapped.append(key)
+        time.sleep(0.005)
+        with lock:
+            running[key] -= 1
+            done[key].append(i)
+
+    for i in range(10):
+        assert dispatcher.submit(run, ("a", i), key="a")
+        assert dispatcher.submit(run, ("b", i), key="b")
+    assert _wait(lambda: dispatcher.stats()["done"] == 20)
+    assert done == {"a": list(range(10)), "b": list(range(10))}
+    assert overlapped == []
+
+
+def test_stats():
+    dispatcher = CallbackDispatcher(size=1, queue_size=4)
+    release = _busy(dispatcher)
+    time.sleep(0.05)
+
+    def error():
+        raise ValueError("callback error")
+
+    assert dispatcher.submit(error)
+    assert dispatcher.submit(lambda: None)
+    assert dispatcher.stats()["depth"] == 2
+    time.sleep(0.05)
+    release.set()
+    assert _wait(lambda: dispatcher.stats()["done"] == 3)
+    stats = dispatcher.stats()
+    assert stats["submitted"] == 3 and stats["errors"] == 1
+    assert stats["depth"] == 0 and stats["max_depth"] == 2
+    assert stats["max_latency"] >= 50 and 0 < stats["latency"] <= stats["max_latency"]
+
+
+def test_shared_dispatcher():
+    assert get_dispatcher() is get_dispatcher()
+
+
+class _Clock(object):
+
+    def __init__(self):
+        self.time = 0
+
+    def now(self):
+        return self.time
+
+
+class _Dns(object):
+    """getaddrinfo replacement counting queries."""
+
+    def __init__(self, ips):
+        self.ips = ips
+        self.queries = 0
+
+    def __call__(self, host, port):
+        self.queries += 1
+        if self.ips is None:
+            raise OSError("DNS failed")
+        return [(usocket.AF_INET, usocket.SOCK_STREAM, usocket.IPPROTO_TCP, "", (ip, port)) for ip in self.ips]
+
+
+@pytest.fixture
+def dns(monkeypatch):
+    dns = _Dns(list(IPS))
+    monkeypatch.setattr(usocket, "getaddrinfo", dns)
+    return dns
+
+
+def _resolver(**kwargs):
+    resolver = Resolver(**kwargs)
+    clock = _Clock()
+    resolver._Resolver__clock = clock
+    return resolver, clock
+
+
+def test_resolve_ttl(dns):
+    resolver, clock = _resolver(ttl=300)
+    assert resolver.resolve(HOST, 7611) == IPS
+    clock.time = 299999
+    assert resolver.resolve(HOST, 7611) == IPS
+    assert dns.queries == 1
+    dns.ips = IPS[:1]
+    clock.time = 300000
+    assert resolver.resolve(HOST, 7611) == IPS[:1]
+    assert dns.queries == 2
+    resolver.invalidate(HOST)
+    assert resolver.resolve(HOST, 7611) == IPS[:1]
+    assert dns.queries == 3
+
+
+def test_resolve_negative_cache(dns):
+    resolver, clock = _resolver(ttl=300, negative_ttl=30)
+    dns.ips = None
+    with pytest.raises(ValueError):
+        resolver.get_addr(HOST, 7611)
+    dns.ips = list(IPS)
+    clock.time = 29999
+    with pytest.raises(ValueError):
+        resolver.resolve(HOST, 7611)
+    assert dns.queries == 1
+    clock.time = 30000
+    assert resolver.resolve(HOST, 7611) == IPS
+    assert dns.queries == 2
+
+
+def test_round_robin(dns):
+    resolver, clock = _resolver(negative_ttl=30, policy=RESOLVE_ROUND_ROBIN)
+    assert [resolver.get_addr(HOST, 7611) for i in range(4)] == IPS + IPS[:1]
+    # Failed address is skipped for negative TTL.
+    resolver.report(IPS[1], ok=False)
+    ips = [resolver.get_addr(HOST, 7611) for i in range(4)]
+    assert sorted(ips) == [IPS[0], IPS[0], IPS[2], IPS[2]] and ips[0] != ips[1]
+    clock.time = 30000
+    assert resolver.get_addr(HOST, 7611) in IPS
+    assert IPS[1] in [resolver.get_addr(HOST, 7611) for i in range(3)]
+    assert dns.queries == 1
+
+
+def test_all_failed(dns):
+    resolver, clock = _resolver(policy=RESOLVE_ROUND_ROBIN)
+    resolver.get_addr(HOST, 7611)
+    for ip in IPS:
+        resolver.report(ip, ok=False)
+    # All addresses are tried again, and host is resolved again next time.
+    assert resolver.get_addr(HOST, 7611) in IPS
+    assert dns.queries == 1
+    resolver.get_addr(HOST, 7611)
+    assert dns.queries == 2
+
+
+def test_fastest(dns):
+    resolver, clock = _resolver(policy=RESOLVE_FASTEST)
+    # Addresses not measured are tried first.
+    assert resolver.get_addr(HOST, 7611) == IPS[0]
+    resolver.report(IPS[0], rtt=300)
+    assert resolver.get_addr(HOST, 7611) == IPS[1]
+    resolver.report(IPS[1], rtt=100)
+    assert resolver.get_addr(HOST, 7611) == IPS[2]
+    resolver.report(IPS[2], rtt=200)
+    assert resolver.get_addr(HOST, 7611) == IPS[1]
+    # Connect time is smoothed, 100 * 7 / 8 + 900 / 8 = 200.
+    resolver.report(IPS[1], rtt=900)
+    assert resolver.get_addr(HOST, 7611) in IPS[1:]
+    resolver.report(IPS[1], rtt=900)
+    assert resolver.get_addr(HOST, 7611) == IPS[2]
+    resolver.report(IPS[2], ok=False)
+    assert resolver.get_addr(HOST, 7611) == IPS[1]
+
+
+def test_socket_port_required(dns):
+    with pytest.raises(ValueError):
+        SocketBase(domain=HOST, resolver=Resolver())
+    with pytest.raises(ValueError):
+        SocketBase(ip="127.0.0.1")
+    assert dns.queries == 0
+    SocketBase(domain=HOST, port=7611, resolver=Resolver())
+    assert dns.queries == 1
+
+
+class _BlockWriter(object):
+    """Write function whose first write blocks until released."""
+
+    def __init__(self, error=None):
+        self.writes = []
+        self.error = error
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self, data):
+        if not self.writes:
+            self.writes.append(data)
+            self.entered.set()
+            self.release.wait(2)
+            return True
+        self.writes.append(data)
+        if self.error is not None:
+            raise self.error
+        return True
+
+
+def _senders(batcher, datas):
+    results = {}
+
+    def _send(data):
+        results[data] = batcher.send((data,))
+
+    threads = [threading.Thread(target=_send, args=(data,)) for data in datas]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def test_write_coalesce():
+    write = _BlockWriter()
+    batcher = WriteBatcher(write)
+    threads, results = _senders(batcher, [b"first"])
+    assert write.entered.wait(2)
+    more, more_results = _senders(batcher, [b"a1", b"b22", b"c333"])
+    assert _wait(lambda: len(batcher._WriteBatcher__pending) == 3)
+    write.release.set()
+    for thread in threads + more:
+        thread.join(2)
+    results.update(more_results)
+    assert all(results.values()) and len(results) == 4
+    assert len(write.writes) == 2
+    assert sorted(write.writes[1]) == sorted(b"a1b22c333")
+    stats = batcher.stats()
+    assert stats == {"writes": 2, "msgs": 4, "bytes": 14, "max_msgs": 3}
+
+
+def test_write_batch_size():
+    write = _BlockWriter()
+    batcher = WriteBatcher(write, batch_size=4)
+    threads, results = _senders(batcher, [b"first"])
+    assert write.entered.wait(2)
+    more, more_results = _senders(batcher, [b"aaa", b"bbb", b"ccccc"])
+    assert _wait(lambda: len(batcher._WriteBatcher__pending) == 3)
+    write.release.set()
+    for thread in threads + more:
+        thread.join(2)
+    results.update(more_results)
+    assert all(results.values())
+    # One sender's data is never split, a sender larger than batch size is written alone.
+    assert sorted(write.writes[1:]) == [b"aaa", b"bbb", b"ccccc"]
+
+
+def test_write_error_wakes_waiters():
+    write = _BlockWriter(error=OSError(104))
+    batcher = WriteBatcher(write)
+    threads, results = _senders(batcher, [b"first"])
+    assert write.entered.wait(2)
+    more, more_results = _senders(batcher, [b"a", b"b"])
+    assert _wait(lambda: len(batcher._WriteBatcher__pending) == 2)
+    write.release.set()
+    for thread in threads + more:
+        thread.join(2)
+        assert not thread.is_alive()
+    assert results == {b"first": True}
+    assert more_results == {b"a": False, b"b": False}
+    assert batcher.stats()["writes"] == 1
+    # The failed write does not keep the writer role, later sends are written.
+    write.error = None
+    assert batcher.send((b"next",)) is True
+    assert write.writes[-1] == b"next"
+
+
+class _PartialSocket(object):
+    """Socket which writes at most 3 bytes each time."""
+
+    def __init__(self):
+        self.data = b""
+
+    def write(self, data):
+        self.data += bytes(data[:3])
+        return len(data[:3])
+
+
+def test_socket_partial_write():
+    client = SocketBase(ip="127.0.0.1", port=7611)
+    sock = _PartialSocket()
+    client._SocketBase__socket = sock
+    assert client._send(b"0123456789") is True
+    assert sock.data == b"0123456789"
+    assert client.get_send_stats()["bytes"] == 10
@@ -0,0 +1,73 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :test_gt06.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :GT06 client tests against the loopback GT06 server
+@version   :1.0.0
+@date      :2026-10-17 14:20:36
+@copyright :Copyright (c) 2022
+"""
+
+import time
+
+from usr.gt06 import GT06
+from usr.gt06_msg import GT06MsgFramer
+from usr.gt06_queue import GT06Queue
+from usr.gt06_capture import WireCapture, CaptureReader, CAPTURE_OUT
+
+IMEI = "0353413532150362"
+LOCATION = ("220707164353", 9, 31.82, 117.22, 40, 90, 1, 0, 1, 0, 460, 0, 0x5D2A, 0x1234)
+
+
+def _wait(func, timeout=3):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if func():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_replay_queue_after_reboot(server, tmp_path):
+    path = str(tmp_path / "q")
+    # Reports saved while offline, then the device reboots and serial numbers start again.
+    client = GT06(ip="127.0.0.1", port=server.port, timeout=2, queue=GT06Queue(path))
+    for i in range(8):
+        assert client.report_location(*LOCATION, include_device_status=True)
+    queue = GT06Queue(path)
+    assert queue.size() == 8
+
+    capture = WireCapture(str(tmp_path / "gt06.cap"))
+    client = GT06(ip="127.0.0.1", port=server.port, timeout=2, window_size=2, queue=queue, capture=capture)
+    assert client.connect()
+    assert client.login(IMEI)
+    assert all([client.report_location(*LOCATION, include_device_status=True) for i in range(8)])
+    assert _wait(lambda: queue.size() == 0)
+    assert server.stats()["frames"][0x16] == 16
+    assert client.report_device_status()
+    assert client.disconnect()
+    capture.close()
+
+    # Replayed messages use serial numbers of this session, they do not collide with live messages.
+    framer = GT06MsgFramer()
+    msg_nos = []
+    for record_type, _, data in CaptureReader(str(tmp_path / "gt06.cap")).records():
+        if record_type == CAPTURE_OUT:
+            msg_nos.extend((msg[-6] << 8) | msg[-5] for msg in framer.feed(data))
+    assert len(msg_nos) == 18 and len(set(msg_nos)) == 18
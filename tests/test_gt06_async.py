@@ -0,0 +1,126 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :test_gt06_async.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :AsyncGT06 tests against the loopback GT06 server
+@version   :1.0.0
+@date      :2026-10-17 10:12:37
+@copyright :Copyright (c) 2022
+"""
+
+import asyncio
+
+from usr.gt06_async import AsyncGT06
+
+IMEI = "0353413532150362"
+LOCATION = ("220707164353", 9, 31.82, 117.22, 40, 90, 1, 0, 1, 0, 460, 0, 0x5D2A, 0x1234)
+
+
+async def _wait(func, timeout=2):
+    for i in range(int(timeout * 100)):
+        if func():
+            return True
+        await asyncio.sleep(0.01)
+    return False
+
+
+def test_login_and_report(server):
+    async def run():
+        client = AsyncGT06(ip="127.0.0.1", port=server.port, timeout=1)
+        assert await client.connect()
+        assert await client.login(IMEI)
+        assert client.set_device_status(1, 1, 0, 0, 1, 1, 5, 4)
+        assert await client.report_device_status()
+        assert await client.report_location(*LOCATION, include_device_status=True)
+        assert await client.disconnect()
+
+    asyncio.run(asyncio.wait_for(run(), 10))
+    stats = server.stats()
+    assert stats["frames"][0x01] == 1 and stats["frames"][0x13] == 1 and stats["frames"][0x16] == 1
+
+
+def test_invalid_args(server):
+    async def run():
+        client = AsyncGT06(ip="127.0.0.1", port=server.port, timeout=1)
+        assert await client.connect()
+        assert await client.login(IMEI)
+        assert not client.set_device_status(alarm=5)
+        assert not client.set_device_status(gsm_signal=7)
+        assert not await client.report_location("2207071643", *LOCATION[1:])
+        assert not await client.report_location(LOCATION[0], 16, *LOCATION[2:])
+        assert not await client.report_location(*LOCATION[:5], 360, *LOCATION[6:])
+        assert await client.disconnect()
+
+    asyncio.run(asyncio.wait_for(run(), 10))
+    assert 0x12 not in server.stats()["frames"]
+
+
+def test_closed_by_server(server):
+    async def run():
+        client = AsyncGT06(ip="127.0.0.1", port=server.port, timeout=1)
+        assert await client.connect()
+        assert await client.login(IMEI)
+        writer = client._AsyncGT06__writer
+        server.close_sessions()
+        assert await _wait(lambda: client.status() == 2)
+        assert await _wait(writer.is_closing)
+        assert await client.disconnect()
+
+    asyncio.run(asyncio.wait_for(run(), 10))
+
+
+def test_async_callback_task(server):
+    async def run():
+        client = AsyncGT06(ip="127.0.0.1", port=server.port, timeout=1)
+        tasks = client._AsyncGT06__callback_tasks
+        release = asyncio.Event()
+        received = []
+
+        async def _callback(args):
+            received.append(args)
+            await release.wait()
+
+        client.set_callback(_callback)
+        assert await client.connect()
+        assert await client.login(IMEI)
+        server.push_command(1, "WHERE#", IMEI)
+        assert await _wait(lambda: received)
+        # Running callback task is referenced by client until it is done.
+        assert len(tasks) == 1
+        release.set()
+        assert await _wait(lambda: not tasks)
+        assert await client.disconnect()
+
+    asyncio.run(asyncio.wait_for(run(), 10))
+
+
+def test_connect_again(server):
+    async def run():
+        client = AsyncGT06(ip="127.0.0.1", port=server.port, timeout=1)
+        assert await client.connect()
+        old_tasks = list(client._AsyncGT06__tasks)
+        old_writer = client._AsyncGT06__writer
+        assert await client.connect()
+        assert await _wait(lambda: all(task.done() for task in old_tasks))
+        assert await _wait(old_writer.is_closing)
+        assert await client.login(IMEI)
+        assert await client.disconnect()
+
+    asyncio.run(asyncio.wait_for(run(), 10))
+    assert server.stats()["frames"][0x01] == 1
@@ -0,0 +1,88 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :test_gt06_capture.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :Capture and replay round trip tests against the loopback GT06 server
+@version   :1.0.0
+@date      :2026-10-17 12:58:31
+@copyright :Copyright (c) 2022
+"""
+
+import time
+
+from gt06_replay import replay_client, replay_server
+from usr.gt06 import GT06
+from usr.gt06_msg import GT06MsgFramer
+from usr.gt06_capture import WireCapture, CaptureReader, CAPTURE_OUT, CAPTURE_IN, CAPTURE_CONNECT, CAPTURE_CLOSE
+
+IMEI = "0353413532150362"
+LOCATION = ("220707164353", 9, 31.82, 117.22, 40, 90, 1, 0, 1, 0, 460, 0, 0x5D2A, 0x1234)
+REPORTS = 50
+
+
+def _capture(server, path):
+    capture = WireCapture(path, max_size=1024 * 1024)
+    client = GT06(ip="127.0.0.1", port=server.port, timeout=2, capture=capture)
+    assert client.connect()
+    assert client.login(IMEI)
+    client.set_device_status(1, 1, 0, 0, 1, 1, 5, 4)
+    for i in range(REPORTS):
+        assert client.report_device_status()
+        assert client.report_location(*LOCATION, include_device_status=True)
+    assert client.disconnect()
+    capture.close()
+    return list(CaptureReader(path).records())
+
+
+def _messages(records, record_type):
+    """Get (protocol_no, msg_no) of captured messages with their record index."""
+    framer = GT06MsgFramer()
+    msgs = []
+    for index, record in enumerate(records):
+        if record[0] == record_type:
+            for msg in framer.feed(record[2]):
+                msgs.append(((msg[3], (msg[-6] << 8) | msg[-5]), index))
+    return msgs
+
+
+def test_capture_order(server, tmp_path):
+    records = _capture(server, str(tmp_path / "gt06.cap"))
+    assert records[0][0] == CAPTURE_CONNECT and records[-1][0] == CAPTURE_CLOSE
+    assert [i[1] for i in records] == sorted(i[1] for i in records)
+    requests = dict(_messages(records, CAPTURE_OUT))
+    responses = _messages(records, CAPTURE_IN)
+    assert len(responses) == 1 + REPORTS * 2
+    for key, index in responses:
+        assert requests[key] < index
+
+
+def test_replay_client(server, tmp_path):
+    records = _capture(server, str(tmp_path / "gt06.cap"))
+    stats = replay_client(records, repeat=3)
+    assert stats["sent"] == (1 + REPORTS * 2) * 3
+    assert stats["responses"] == stats["sent"] and stats["timeouts"] == 0 and stats["retransmitted"] == 0
+
+
+def test_replay_server(server, tmp_path):
+    records = _capture(server, str(tmp_path / "gt06.cap"))
+    acks = server.stats()["acks"]
+    stats = replay_server(records, "127.0.0.1", server.port, wait=0.2)
+    assert stats["connections"] == 1 and stats["errors"] == 0
+    assert stats["acks"] == 1 + REPORTS * 2
+    assert server.stats()["acks"] == acks * 2
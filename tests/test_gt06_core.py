@@ -0,0 +1,287 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :test_gt06_core.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :GT06Protocol tests driven by a virtual clock
+@version   :1.0.0
+@date      :2026-10-17 09:31:06
+@copyright :Copyright (c) 2022
+"""
+
+from usr.gt06_msg import pack_msg
+from usr.gt06_core import GT06Protocol, EVENT_RESPONSE, EVENT_TIMEOUT, EVENT_COMMAND
+
+IMEI = "0353413532150362"
+STATUS = (1, 1, 0, 1, 1, 0, 5, 4)
+
+
+def _core(**kwargs):
+    core = GT06Protocol(**kwargs)
+    core.set_device_status(STATUS)
+    core.connection_made(0)
+    return core
+
+
+def _heart_beat(core, now):
+    msg_no, data = core.get_device_status_msg()
+    core.send(data, 0x13, msg_no, now)
+    return msg_no, data
+
+
+def _login(core, now=0, rtt=100):
+    msg_no, data = core.get_login_msg(IMEI)
+    core.send(data, 0x01, msg_no, now)
+    core.data_to_send()
+    core.receive_data(pack_msg(0x01, msg_no), now + rtt)
+    return core.events()
+
+
+def test_login_response():
+    core = _core()
+    msg_no, data = core.get_login_msg(IMEI)
+    assert core.send(data, 0x01, msg_no, 0)
+    assert core.data_to_send() == data
+    assert core.data_to_send() == b""
+    assert not core.is_logged_in()
+    core.receive_data(pack_msg(0x01, msg_no), 120)
+    events = core.events()
+    assert [(i.type, i.protocol_no, i.msg_no, i.rtt) for i in events] == [(EVENT_RESPONSE, 0x01, msg_no, 120)]
+    assert core.is_logged_in()
+    assert core.rto_info()["srtt"] == 120
+    assert core.in_flight() == 0
+
+
+def test_send_without_response():
+    core = _core()
+    msg_no, data = core.get_device_cmd_msg(1, "DWXX=OK")
+    assert core.send(data, None, msg_no, 0)
+    assert core.data_to_send() == data
+    assert core.in_flight() == 0
+    assert core.next_deadline() is None
+
+
+def test_send_not_connected():
+    core = GT06Protocol()
+    msg_no, data = core.get_login_msg(IMEI)
+    assert not core.send(data, 0x01, msg_no, 0)
+    assert core.data_to_send() == b""
+    assert [(i.type, i.msg_no) for i in core.events()] == [(EVENT_TIMEOUT, msg_no)]
+
+
+def test_response_split_and_merged():
+    core = _core()
+    msg_nos = [_heart_beat(core, 0)[0] for _ in range(3)]
+    stream = b"".join([pack_msg(0x13, i) for i in msg_nos])
+    for i in range(len(stream)):
+        core.receive_data(stream[i:i + 1], 50)
+    assert [i.msg_no for i in core.events()] == msg_nos
+
+
+def test_response_matched_by_serial_number():
+    core = _core()
+    first, _ = _heart_beat(core, 0)
+    second, _ = _heart_beat(core, 10)
+    core.receive_data(pack_msg(0x13, second), 60)
+    core.receive_data(pack_msg(0x13, first), 80)
+    assert [(i.msg_no, i.rtt) for i in core.events()] == [(second, 50), (first, 80)]
+
+
+def test_response_by_protocol_number():
+    core = _core()
+    first, _ = _heart_beat(core, 0)
+    _heart_beat(core, 10)
+    # Some servers respond protocol number as serial number, the earliest request is matched.
+    core.receive_data(pack_msg(0x13, 0x13), 60)
+    assert [i.msg_no for i in core.events()] == [first]
+    assert core.in_flight() == 1
+
+
+def test_retransmit_and_timeout():
+    core = _core(retry_count=2, timeout=1000)
+    msg_no, data = _heart_beat(core, 0)
+    assert core.data_to_send() == data
+    assert core.next_deadline() == 1000
+    core.tick(999)
+    assert core.data_to_send() == b""
+    core.tick(1000)
+    assert core.data_to_send() == data
+    assert core.rto_info()["rto"] == 2000
+    assert core.next_deadline() == 3000
+    core.tick(3000)
+    assert core.data_to_send() == data
+    assert core.next_deadline() == 7000
+    core.tick(7000)
+    assert core.data_to_send() == b""
+    assert [(i.type, i.msg_no) for i in core.events()] == [(EVENT_TIMEOUT, msg_no)]
+    assert core.in_flight() == 0
+    assert core.next_deadline() is None
+
+
+def test_retransmitted_response_not_sampled():
+    core = _core(timeout=1000)
+    msg_no, _ = _heart_beat(core, 0)
+    core.tick(1000)
+    core.receive_data(pack_msg(0x13, msg_no), 1100)
+    events = core.events()
+    assert [(i.type, i.rtt) for i in events] == [(EVENT_RESPONSE, 100)]
+    assert core.rto_info()["srtt"] == -1
+    assert core.rto_info()["rto"] == 2000
+
+
+def test_backoff_once_per_tick():
+    core = _core(timeout=1000)
+    for _ in range(3):
+        _heart_beat(core, 0)
+    core.data_to_send()
+    core.tick(1000)
+    assert core.rto_info()["rto"] == 2000
+    assert len(core.data_to_send()) == 3 * 15
+    assert core.next_deadline() == 3000
+
+
+def test_window_backlog():
+    core = _core(window_size=2)
+    msgs = [_heart_beat(core, 0) for _ in range(3)]
+    assert core.data_to_send() == msgs[0][1] + msgs[1][1]
+    assert core.in_flight() == 3
+    core.receive_data(pack_msg(0x13, msgs[0][0]), 100)
+    assert core.data_to_send() == msgs[2][1]
+    core.receive_data(pack_msg(0x13, msgs[1][0]) + pack_msg(0x13, msgs[2][0]), 200)
+    assert [(i.msg_no, i.rtt) for i in core.events()] == [(msgs[0][0], 100), (msgs[1][0], 200), (msgs[2][0], 100)]
+    assert core.in_flight() == 0
+
+
+def test_window_per_protocol_number():
+    core = _core(window_size=1)
+    _heart_beat(core, 0)
+    _heart_beat(core, 0)
+    msg_no, data = core.get_login_msg(IMEI)
+    core.send(data, 0x01, msg_no, 0)
+    assert core.data_to_send().endswith(data)
+    assert core.in_flight() == 3
+
+
+def test_connection_lost():
+    core = _core(window_size=1)
+    msg_nos = [_heart_beat(core, 0)[0] for _ in range(2)]
+    _login(core, 0)
+    core.connection_lost(500)
+    assert not core.is_connected()
+    assert not core.is_logged_in()
+    assert core.data_to_send() == b""
+    assert sorted([(i.type, i.msg_no) for i in core.events()]) == [(EVENT_TIMEOUT, i) for i in msg_nos]
+    assert core.in_flight() == 0
+    assert core.next_deadline() is None
+
+
+def test_server_command():
+    core = _core()
+    core.receive_data(pack_msg(0x80, 7, bytes((4 + 5,)) + (12345).to_bytes(4, "big") + b"DWXX#"), 10)
+    events = core.events()
+    assert [(i.type, i.msg_no) for i in events] == [(EVENT_COMMAND, 7)]
+    assert (events[0].msg_info.server_flag, events[0].msg_info.cmd_data) == (12345, "DWXX#")
+
+
+def test_heart_beat_after_idle():
+    core = _core(life_time=10)
+    _login(core, 0)
+    assert core.next_deadline() == 10100
+    core.tick(10099)
+    assert core.data_to_send() == b""
+    core.tick(10100)
+    data = core.data_to_send()
+    assert data[3] == 0x13
+    core.receive_data(pack_msg(0x13, (data[-6] << 8) | data[-5]), 10200)
+    assert core.next_deadline() == 20200
+
+
+def test_heart_beat_window_full():
+    core = _core(window_size=1, life_time=10)
+    _login(core, 0)
+    _heart_beat(core, 100)
+    core.data_to_send()
+    for i in range(5):
+        core.tick(10100)
+        assert core.next_deadline() > 10100
+    # One heart beat in flight, one waiting for window.
+    assert core.in_flight() == 2
+    # The queued heart beat is timeout after the time of all retransmissions, the next one is queued.
+    core.events()
+    core.tick(20100)
+    assert [i.type for i in core.events()] == [EVENT_TIMEOUT]
+    assert core.in_flight() == 2
+
+
+def test_duplicate_request():
+    core = _core(window_size=2)
+    msg_no, data = _heart_beat(core, 0)
+    core.send(data, 0x13, msg_no, 10)
+    assert core.data_to_send() == data * 2
+    assert core.in_flight() == 1
+    core.receive_data(pack_msg(0x13, msg_no), 100)
+    assert [(i.type, i.msg_no, i.rtt) for i in core.events()] == [(EVENT_RESPONSE, msg_no, 90)]
+    # Both window slots are usable again.
+    msg_nos = [_heart_beat(core, 200)[0] for i in range(3)]
+    assert len(core.data_to_send()) == len(data) * 2
+    assert core.in_flight() == 3
+    # Request waiting for window is replaced too.
+    core.send(data, 0x13, msg_nos[2], 210)
+    assert core.in_flight() == 3
+
+
+def test_backlog_timeout():
+    core = _core(window_size=1, timeout=1000, retry_count=3)
+    first_no, _ = _heart_beat(core, 0)
+    second_no, _ = _heart_beat(core, 0)
+    assert core.in_flight() == 2
+    core.tick(1000)
+    core.tick(3000)
+    assert core.events() == []
+    assert core.next_deadline() == 4000
+    core.tick(4000)
+    assert [(i.type, i.msg_no) for i in core.events()] == [(EVENT_TIMEOUT, second_no)]
+    assert core.in_flight() == 1
+    core.receive_data(pack_msg(0x13, first_no), 4100)
+    assert [(i.type, i.msg_no) for i in core.events()] == [(EVENT_RESPONSE, first_no)]
+    assert core.in_flight() == 0 and core.data_to_send().count(b"\x78\x78") == 3
+
+
+def test_resend_msg():
+    core = _core()
+    gps = ("220707164353", 12, 31.8, 117.2, 120, 126, 1, 0, 1, 1)
+    lbs = (460, 0, 0x5D2A, 0x1234)
+    _, msg_no, data = core.get_location_msg(gps, lbs, True)
+    new_no, new_data = core.get_resend_msg(data)
+    assert new_no == msg_no + 1
+    assert new_data == pack_msg(0x16, new_no, data[4:-6])
+    assert new_data[:-6] == data[:-6]
+
+
+def test_piggyback_status():
+    core = _core(piggyback=True)
+    gps = ("220707164353", 12, 31.8, 117.2, 120, 126, 1, 0, 1, 1)
+    lbs = (460, 0, 0x5D2A, 0x1234)
+    assert core.get_location_msg(gps, lbs)[0] == 0x16
+    assert core.get_location_msg(gps, lbs)[0] is None
+    core.set_device_status(STATUS)
+    assert core.get_location_msg(gps, lbs)[0] is None
+    core.set_device_status((0, 0, 0, 0, 0, 0, 1, 1))
+    protocol_no, _, data = core.get_location_msg(gps, lbs)
+    assert (protocol_no, data[3]) == (0x16, 0x16)
+    assert core.get_location_msg(gps, lbs)[0] is None
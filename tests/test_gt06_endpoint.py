@@ -0,0 +1,143 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :test_gt06_endpoint.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :EndpointPool and GT06 endpoint failover tests
+@version   :1.0.0
+@date      :2026-10-17 17:36:52
+@copyright :Copyright (c) 2022
+"""
+
+import pytest
+
+from gt06_server import GT06Server
+from usr.gt06 import GT06
+from usr.gt06_endpoint import EndpointPool
+
+IMEI = "0353413532150362"
+
+
+class _Clock(object):
+
+    def __init__(self):
+        self.time = 0
+
+    def now(self):
+        return self.time
+
+
+def _pool(endpoints, fail_time=60):
+    pool = EndpointPool(endpoints, fail_time=fail_time)
+    clock = _Clock()
+    pool._EndpointPool__clock = clock
+    return pool, clock
+
+
+@pytest.fixture
+def servers():
+    """Fast and slow loopback GT06 servers."""
+    servers = [GT06Server(delay=0), GT06Server(delay=150)]
+    for server in servers:
+        server.start()
+    yield servers
+    for server in servers:
+        server.stop()
+
+
+def test_select_order():
+    a, b, c = ("10.0.0.1", 7611), ("10.0.0.2", 7611), ("10.0.0.3", 7611)
+    pool, clock = _pool([a, b, c])
+    # Servers not measured are tried first.
+    assert pool.select() == a
+    pool.report(a, rtt=300)
+    assert pool.select() == b
+    pool.report(b, rtt=100)
+    assert pool.select() == c
+    pool.report(c, rtt=200)
+    assert pool.select() == b
+    with pytest.raises(ValueError):
+        EndpointPool([])
+
+
+def test_fail_time_skip():
+    a, b = ("10.0.0.1", 7611), ("10.0.0.2", 7611)
+    pool, clock = _pool([a, b], fail_time=60)
+    pool.report(a, rtt=100)
+    pool.report(b, rtt=500)
+    clock.time = 1000
+    pool.report(a, ok=False)
+    assert pool.select() == b
+    assert [i["healthy"] for i in pool.stats()] == [False, True]
+    clock.time = 2000
+    pool.report(b, ok=False)
+    # All servers failed, the one failed earliest is tried.
+    assert pool.select() == a
+    clock.time = 61000
+    assert pool.select() == a
+    assert [i["healthy"] for i in pool.stats()] == [True, False]
+    clock.time = 62000
+    assert pool.select() == a
+    assert [i["failures"] for i in pool.stats()] == [1, 1]
+
+
+def test_probe_selects_faster(servers):
+    fast, slow = servers
+    endpoints = [("127.0.0.1", slow.port), ("127.0.0.1", fast.port)]
+    client = GT06(endpoints=endpoints, timeout=2)
+    stats = client.probe_endpoints(IMEI)
+    assert [i["port"] for i in stats] == [slow.port, fast.port]
+    assert 0 <= stats[1]["rtt"] < stats[0]["rtt"] and stats[0]["rtt"] >= 150
+    assert client.status() != 0
+    assert client.connect()
+    assert client.login(IMEI)
+    assert client.disconnect()
+    assert fast.stats()["frames"][0x01] == 2 and slow.stats()["frames"][0x01] == 1
+
+
+def test_connect_failover(servers):
+    fast, slow = servers
+    pool, clock = _pool([("127.0.0.1", fast.port), ("127.0.0.1", slow.port)], fail_time=60)
+    client = GT06(endpoints=pool, timeout=2, retry_count=0)
+    client.probe_endpoints(IMEI)
+    fast_port = fast.port
+    fast.stop()
+
+    # Selected fast server is down, the slow one is connected in the same connect call.
+    assert client.connect()
+    assert client.login(IMEI)
+    assert client.disconnect()
+    stats = pool.stats()
+    assert stats[0]["failures"] == 1 and not stats[0]["healthy"]
+    assert slow.stats()["frames"][0x01] == 2
+
+    # Fast server is back, it is skipped until fail time passes.
+    fast = GT06Server(port=fast_port)
+    fast.start()
+    try:
+        clock.time = 30000
+        assert client.connect()
+        assert client.disconnect()
+        assert fast.stats()["connections"] == 0
+        clock.time = 61000
+        assert client.connect()
+        assert client.login(IMEI)
+        assert client.disconnect()
+        assert fast.stats()["frames"][0x01] == 1
+    finally:
+        fast.stop()
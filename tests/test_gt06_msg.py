@@ -0,0 +1,73 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :test_gt06_msg.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :GT06MsgTemplate and crc16_update tests
+@version   :1.0.0
+@date      :2026-10-17 18:24:09
+@copyright :Copyright (c) 2022
+"""
+
+import random
+import pytest
+
+from usr.common import SerialNo
+from usr.crc_itu import crc16, crc16_update, CRC_INIT
+from usr.gt06_msg import GT06MsgTemplate, pack_msg, T01, T13
+
+STATUS = [(1, 1, 0, 1, 1, 0, 5, 4), (0, 0, 1, 4, 0, 1, 6, 0), (0, 0, 0, 0, 0, 0, 0, 0)]
+
+
+def test_crc16_update():
+    rand = random.Random(7)
+    for size in (0, 1, 2, 5, 17, 64, 255):
+        data = bytes(rand.getrandbits(8) for _ in range(size))
+        for split in sorted(set((0, size // 2, size))):
+            fcs = crc16_update(CRC_INIT, data[:split])
+            assert crc16_update(fcs, data[split:]) ^ 0xffff == crc16(data)
+            assert crc16_update(fcs, memoryview(data)[split:]) ^ 0xffff == crc16(data)
+            assert crc16_update(fcs, tuple(data[split:])) ^ 0xffff == crc16(data)
+
+
+def test_template_equals_get_msg():
+    # Start near the end of serial number space to cover wrap around.
+    msg_serial_no, template_serial_no = SerialNo(start_no=0xFFFD), SerialNo(start_no=0xFFFD)
+    for status in STATUS:
+        msg = T13(msg_serial_no)
+        msg.set_device_status(*status)
+        template_msg = T13(template_serial_no)
+        template_msg.set_device_status(*status)
+        template = template_msg.get_template()
+        for i in range(3):
+            assert template.get_msg() == msg.get_msg()
+
+
+def test_template_equals_pack_msg():
+    t01 = T01()
+    t01.set_imei("0353413532150362")
+    t13 = T13()
+    t13.set_device_status(*STATUS[0])
+    contents = [(0x01, t01._init_content_byte()), (0x13, t13._init_content_byte()), (0x23, b""), (0x80, bytes(250))]
+    for protocol_no, content in contents:
+        template = GT06MsgTemplate(protocol_no, content, SerialNo(start_no=0xFFFE))
+        for i in range(3):
+            msg_no, data = template.get_msg()
+            assert data == pack_msg(protocol_no, msg_no, content)
+    with pytest.raises(ValueError):
+        GT06MsgTemplate(0x80, bytes(251))
@@ -0,0 +1,154 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :test_gt06_queue.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :GT06Queue tests on a plain file directory
+@version   :1.0.0
+@date      :2026-10-17 09:10:37
+@copyright :Copyright (c) 2022
+"""
+
+import os
+
+from usr.gt06_msg import pack_msg
+from usr.gt06_queue import GT06Queue
+
+
+def _msg(msg_no):
+    return pack_msg(0x13, msg_no, bytes((0x4B, 0x05, 0x04, 0x01, 0x02)))
+
+
+def test_put_peek_pop(tmp_path):
+    queue = GT06Queue(str(tmp_path / "q"), max_size=1024, flush_size=0)
+    for i in range(5):
+        assert queue.put(_msg(i), timestamp=100 + i)
+    assert queue.size() == 5
+    assert queue.peek(3) == [(100 + i, _msg(i)) for i in range(3)]
+    assert queue.pop(2)
+    assert queue.peek(10) == [(100 + i, _msg(i)) for i in range(2, 5)]
+    queue.clear()
+    assert queue.size() == 0
+    assert queue.peek(10) == []
+
+
+def test_peek_sorted_by_timestamp(tmp_path):
+    queue = GT06Queue(str(tmp_path / "q"), max_size=1024, flush_size=0)
+    queue.put(_msg(1), timestamp=300)
+    queue.put(_msg(2), timestamp=100)
+    queue.put(_msg(3), timestamp=200)
+    assert [i[0] for i in queue.peek(3)] == [100, 200, 300]
+
+
+def test_buffered_messages(tmp_path):
+    queue = GT06Queue(str(tmp_path / "q"), max_size=1024, flush_size=100)
+    queue.put(_msg(1), timestamp=1)
+    assert queue.size() == 1
+    # Buffered messages are not in file until flush.
+    assert GT06Queue(str(tmp_path / "q"), max_size=1024).size() == 0
+    assert queue.flush()
+    assert GT06Queue(str(tmp_path / "q"), max_size=1024).size() == 1
+
+
+def test_wrap_around(tmp_path):
+    # Record size is 6 + 15 bytes, 4 records fit in 100 bytes.
+    queue = GT06Queue(str(tmp_path / "q"), max_size=100, flush_size=0)
+    for i in range(10):
+        assert queue.put(_msg(i), timestamp=i)
+    assert queue.size() == 4
+    assert queue.peek(10) == [(i, _msg(i)) for i in range(6, 10)]
+    assert queue.pop(1)
+    for i in range(10, 12):
+        assert queue.put(_msg(i), timestamp=i)
+    assert queue.peek(10) == [(i, _msg(i)) for i in range(8, 12)]
+
+
+def test_flush_size_greater_than_max_size(tmp_path):
+    queue = GT06Queue(str(tmp_path / "q"), max_size=100, flush_size=512)
+    for i in range(10):
+        assert queue.put(_msg(i), timestamp=i)
+    assert queue.flush()
+    assert queue.peek(10) == [(i, _msg(i)) for i in range(6, 10)]
+
+
+def test_buffer_larger_than_max_size(tmp_path):
+    queue = GT06Queue(str(tmp_path / "q"), max_size=100, flush_size=100)
+    queue.put(_msg(0), timestamp=0)
+    # The fifth record makes buffer larger than the ring buffer, the oldest buffered record is discarded.
+    for i in range(1, 5):
+        assert queue.put(_msg(i), timestamp=i)
+    assert queue.size() == 4
+    assert queue.peek(10) == [(i, _msg(i)) for i in range(1, 5)]
+
+
+def test_reload_after_restart(tmp_path):
+    path = str(tmp_path / "q")
+    queue = GT06Queue(path, max_size=100, flush_size=0)
+    for i in range(7):
+        queue.put(_msg(i), timestamp=i)
+    queue.pop(1)
+    queue = GT06Queue(path, max_size=100, flush_size=0)
+    assert queue.size() == 3
+    assert queue.peek(10) == [(i, _msg(i)) for i in range(4, 7)]
+
+
+def test_broken_index_slot_fallback(tmp_path):
+    path = str(tmp_path / "q")
+    queue = GT06Queue(path, max_size=1024, flush_size=0)
+    queue.put(_msg(1), timestamp=1)
+    queue.put(_msg(2), timestamp=2)
+    # The last index write is broken, the previous slot with one message is used.
+    with open(os.path.join(path, "index"), "r+b") as f:
+        data = bytearray(f.read())
+        latest = 0 if data[3] > data[18 + 3] else 18
+        data[latest + 17] ^= 0xFF
+        f.seek(0)
+        f.write(data)
+    queue = GT06Queue(path, max_size=1024, flush_size=0)
+    assert queue.peek(10) == [(1, _msg(1))]
+
+
+def test_broken_index_reset(tmp_path):
+    path = str(tmp_path / "q")
+    queue = GT06Queue(path, max_size=1024, flush_size=0)
+    queue.put(_msg(1), timestamp=1)
+    with open(os.path.join(path, "index"), "r+b") as f:
+        f.write(bytes(36))
+    queue = GT06Queue(path, max_size=1024, flush_size=0)
+    assert queue.size() == 0
+    assert queue.put(_msg(2), timestamp=2)
+    assert queue.peek(10) == [(2, _msg(2))]
+
+
+def test_broken_record_reset(tmp_path):
+    path = str(tmp_path / "q")
+    queue = GT06Queue(path, max_size=1024, flush_size=0)
+    queue.put(_msg(1), timestamp=1)
+    with open(os.path.join(path, "data"), "r+b") as f:
+        f.write(b"\xff\xff")
+    assert queue.peek(10) == []
+    assert queue.size() == 0
+    assert queue.put(_msg(2), timestamp=2)
+    assert queue.peek(10) == [(2, _msg(2))]
+
+
+def test_reject_invalid_message(tmp_path):
+    queue = GT06Queue(str(tmp_path / "q"), max_size=1024, flush_size=0)
+    assert not queue.put(b"\x78\x78")
+    assert not queue.put(bytes(300))
+    assert queue.size() == 0
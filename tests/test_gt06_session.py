@@ -0,0 +1,158 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :test_gt06_session.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :GT06SessionManager tests against the loopback GT06 server
+@version   :1.0.0
+@date      :2026-10-17 11:05:48
+@copyright :Copyright (c) 2022
+"""
+
+import time
+import pytest
+
+from usr.gt06_session import GT06SessionManager, GT06Connection
+
+IMEI = "0353413532150362"
+LOCATION = ("220707164353", 9, 31.82, 117.22, 40, 90, 1, 0, 1, 0, 460, 0, 0x5D2A, 0x1234)
+
+
+def _wait(func, timeout=3):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if func():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def _imei(i):
+    return "%016d" % (353413532150000 + i)
+
+
+@pytest.fixture
+def manager():
+    manager = GT06SessionManager(poll_interval=50)
+    manager.start()
+    yield manager
+    for session in manager.sessions():
+        manager.remove_session(session)
+    manager.stop()
+
+
+def test_sessions(server, manager):
+    sessions = [manager.create_session(ip="127.0.0.1", port=server.port, timeout=2) for i in range(5)]
+    for i, session in enumerate(sessions):
+        assert session.connect()
+        assert session.login(_imei(i))
+        assert session.set_device_status(1, 1, 0, 0, 1, 1, 5, 4)
+        assert session.report_device_status()
+        assert session.report_location(*LOCATION, include_device_status=True)
+    assert sorted(server.sessions()) == sorted(_imei(i) for i in range(5))
+    stats = server.stats()
+    assert stats["frames"][0x01] == 5 and stats["frames"][0x13] == 5 and stats["frames"][0x16] == 5
+
+    manager.remove_session(sessions[0])
+    assert manager.sessions() == sessions[1:]
+    assert _wait(lambda: _imei(0) not in server.sessions())
+
+
+def test_session_command(server, manager):
+    session = manager.create_session(ip="127.0.0.1", port=server.port, timeout=2)
+    commands = []
+
+    def callback(msg_info):
+        commands.append(msg_info)
+        session.report_device_cmd(msg_info["content"]["server_flag"], "DWXX=OK")
+
+    assert session.set_callback(callback)
+    assert session.connect()
+    assert session.login(IMEI)
+    server.push_command(7, "DWXX#", IMEI)
+    assert _wait(lambda: server.replies())
+    assert commands[0]["protocol_no"] == 0x80 and commands[0]["content"] == {"server_flag": 7, "cmd_data": "DWXX#"}
+    assert server.replies() == [(IMEI, 7, "DWXX=OK")]
+
+
+def test_connections(server, manager):
+    connections = [manager.create_connection("127.0.0.1", server.port, timeout=2) for i in range(5)]
+    waiters = [conn.connect(timeout=5) for conn in connections]
+    assert [waiter.wait() for waiter in waiters] == [True] * 5
+    waiters = [conn.login(_imei(i)) for i, conn in enumerate(connections)]
+    assert all(waiter.wait() is not None for waiter in waiters)
+    assert all(waiter.rtt >= 0 for waiter in waiters)
+
+    done = []
+    waiters = [conn.report_location(*LOCATION, include_device_status=True, callback=done.append) for conn in connections]
+    assert all(waiter.wait() is not None for waiter in waiters)
+    assert sorted(id(i) for i in done) == sorted(id(i) for i in waiters)
+    assert connections[0].report_device_cmd(1, "DWXX=OK").wait() is True
+    assert server.stats()["frames"][0x16] == 5
+
+
+def test_connection_heart_beat(server, manager):
+    conn = manager.create_connection("127.0.0.1", server.port, timeout=2, life_time=1)
+    assert conn.connect().wait() is True
+    assert conn.login(IMEI).wait() is not None
+    assert _wait(lambda: server.stats()["frames"].get(0x13, 0) >= 1, timeout=3)
+
+
+def test_connection_lost(server, manager):
+    conn = manager.create_connection("127.0.0.1", server.port, timeout=2)
+    assert conn.connect().wait() is True
+    assert conn.login(IMEI).wait() is not None
+    server.close_sessions()
+    assert _wait(lambda: conn.status() == 2)
+    assert conn.report_device_status().wait() is None
+
+
+class _SlowReactor(object):
+    """Reactor whose connect returns late, connection callbacks may run before it returns."""
+
+    def __init__(self, reactor):
+        self.__reactor = reactor
+
+    def connect(self, *args):
+        conn = self.__reactor.connect(*args)
+        time.sleep(0.3)
+        return conn
+
+    def __getattr__(self, name):
+        return getattr(self.__reactor, name)
+
+
+def test_connect_callback_race(server, manager):
+    conn = GT06Connection(_SlowReactor(manager.get_reactor()), "127.0.0.1", server.port, timeout=1)
+    status = []
+    waiter = conn.connect(callback=lambda waiter: status.append(conn.status()))
+    assert waiter.wait() is True
+    assert _wait(lambda: status)
+    # Connection is saved before its connection_made callback is run.
+    assert status == [0]
+    assert conn.login(IMEI).wait() is not None
+    conn.disconnect()
+    assert _wait(lambda: conn.status() == 2)
+
+
+def test_connect_refused(server, manager):
+    port = server.port
+    server.stop()
+    conn = manager.create_connection("127.0.0.1", port)
+    assert conn.connect(timeout=2).wait() is None
+    assert conn.status() == 2
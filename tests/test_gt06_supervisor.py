@@ -0,0 +1,126 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :test_gt06_supervisor.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :ReconnectSupervisor tests against the loopback GT06 server
+@version   :1.0.0
+@date      :2026-10-17 12:20:14
+@copyright :Copyright (c) 2022
+"""
+
+import time
+
+import usocket
+
+from usr.gt06 import GT06, get_timer_service
+from usr.gt06_session import GT06SessionManager
+from usr.gt06_supervisor import ReconnectSupervisor, Backoff
+
+IMEI = "0353413532150362"
+
+
+def _wait(func, timeout=3):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if func():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_backoff():
+    backoff = Backoff(base_delay=100, max_delay=500, jitter=0)
+    assert [backoff.next() for i in range(5)] == [100, 200, 400, 500, 500]
+    backoff.reset()
+    assert backoff.next() == 100
+    backoff = Backoff(base_delay=1000, jitter=0.5)
+    assert all(500 <= backoff.next() <= 1000 * 2 ** i for i in range(5))
+
+
+def test_reconnect_in_manager(server):
+    manager = GT06SessionManager(poll_interval=50)
+    manager.start()
+    try:
+        session = manager.create_session(ip="127.0.0.1", port=server.port, timeout=2)
+        supervisor = ReconnectSupervisor(session, IMEI, backoff=Backoff(base_delay=50, jitter=0))
+        assert supervisor._ReconnectSupervisor__timers is manager.get_reactor()
+        assert supervisor.start()
+        assert _wait(supervisor.is_connected)
+        assert server.sessions() == [IMEI]
+
+        server.close_sessions()
+        assert _wait(lambda: supervisor.stats()["reconnects"] == 1)
+        assert supervisor.is_connected()
+        assert _wait(lambda: server.sessions() == [IMEI])
+        stats = supervisor.stats()
+        assert stats["attempts"] == 2 and stats["failures"] == 0 and stats["downtime"] > 0
+        assert supervisor.stop()
+        assert session.disconnect()
+    finally:
+        manager.stop()
+
+
+def test_one_connect_per_attempt(server):
+    port = server.port
+    server.stop()
+    client = GT06(ip="127.0.0.1", port=port, retry_count=3)
+    connects = []
+    connect = client._SocketBase__connect
+
+    def count_connect():
+        connects.append(time.time())
+        return connect()
+
+    client._SocketBase__connect = count_connect
+    supervisor = ReconnectSupervisor(client, IMEI, backoff=Backoff(base_delay=20, max_delay=20, jitter=0))
+    assert supervisor._ReconnectSupervisor__timers is get_timer_service()
+    assert supervisor.start()
+    assert _wait(lambda: supervisor.stats()["failures"] >= 3)
+    supervisor.stop()
+    time.sleep(0.1)
+    stats = supervisor.stats()
+    assert stats["attempts"] == stats["failures"] and not supervisor.is_connected()
+    assert len(connects) == stats["attempts"]
+
+
+def test_supervisor_stops_power_restart(server, monkeypatch):
+    port = server.port
+    server.stop()
+    sockets = []
+    socket = usocket.socket
+
+    def new_socket(*args):
+        sockets.append(socket(*args))
+        return sockets[-1]
+
+    monkeypatch.setattr(usocket, "socket", new_socket)
+    client = GT06(ip="127.0.0.1", port=port, retry_count=1)
+    assert not client.connect()
+    # Failed connect closes its socket.
+    assert len(sockets) == 2 and all(sock.fileno() == -1 for sock in sockets)
+    assert client._SocketBase__socket is None
+    assert client._GT06__power_restart_timer is not None
+
+    supervisor = ReconnectSupervisor(client, IMEI, backoff=Backoff(base_delay=20, max_delay=20, jitter=0))
+    assert supervisor.start()
+    assert client._GT06__power_restart_timer is None
+    assert _wait(lambda: supervisor.stats()["failures"] >= 2)
+    supervisor.stop()
+    assert client._GT06__power_restart_timer is None
+    assert all(sock.fileno() == -1 for sock in sockets)
@@ -0,0 +1,161 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :test_reactor.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :Reactor tests against the loopback GT06 server
+@version   :1.0.0
+@date      :2026-10-17 11:27:03
+@copyright :Copyright (c) 2022
+"""
+
+import time
+import socket
+import pytest
+
+from usr.reactor import Reactor
+from usr.gt06_msg import GT06MsgFramer, GT06MsgParse, T01, T13
+
+IMEI = "0353413532150362"
+
+
+def _wait(func, timeout=3):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if func():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class _Protocol(object):
+    """Record connection events and parse server messages."""
+
+    def __init__(self):
+        self.conn = None
+        self.made = False
+        self.lost = False
+        self.msgs = []
+        self.framer = GT06MsgFramer()
+        self.parser = GT06MsgParse()
+
+    def connection_made(self, conn):
+        self.conn = conn
+        self.made = True
+
+    def data_received(self, data):
+        for msg in self.framer.feed(data):
+            self.parser.set_msg(msg)
+            self.msgs.append(self.parser.get_msg_info())
+
+    def connection_lost(self):
+        self.lost = True
+
+
+@pytest.fixture
+def reactor():
+    reactor = Reactor(poll_interval=50)
+    reactor.start()
+    yield reactor
+    reactor.stop()
+
+
+def _connect(reactor, server):
+    protocol = _Protocol()
+    conn = reactor.connect(("127.0.0.1", server.port), protocol, 2000)
+    assert _wait(lambda: protocol.made)
+    assert conn.is_connected() and protocol.conn is conn
+    return conn, protocol
+
+
+def test_call_later(reactor):
+    calls = []
+    start = reactor.now()
+    reactor.call_later(60, calls.append, "b")
+    reactor.call_later(20, calls.append, "a")
+    reactor.call_later(40, calls.append, "cancelled").cancel()
+    reactor.call_soon(calls.append, "soon")
+    assert _wait(lambda: len(calls) == 3)
+    assert calls == ["soon", "a", "b"]
+    assert reactor.now() - start >= 60
+    time.sleep(0.05)
+    assert calls == ["soon", "a", "b"]
+
+
+def test_request_response(reactor, server):
+    conn, protocol = _connect(reactor, server)
+    up_msg_obj = T01()
+    up_msg_obj.set_imei(IMEI)
+    login_no, login = up_msg_obj.get_msg()
+    up_msg_obj = T13()
+    up_msg_obj.set_device_status(1, 1, 0, 0, 1, 1, 5, 4)
+    status_no, status = up_msg_obj.get_msg()
+    assert conn.write(login)
+    assert conn.write(status * 3)
+    assert _wait(lambda: len(protocol.msgs) == 4)
+    assert [(i["protocol_no"], i["msg_no"]) for i in protocol.msgs] == [(0x01, login_no)] + [(0x13, status_no)] * 3
+    assert server.sessions() == [IMEI]
+
+
+def test_large_write(reactor, server):
+    conn, protocol = _connect(reactor, server)
+    up_msg_obj = T13()
+    up_msg_obj.set_device_status(1, 1, 0, 0, 1, 1, 5, 4)
+    status = up_msg_obj.get_msg()[1]
+    # More than socket buffer, the rest is written by reactor thread when socket is writable.
+    assert conn.write(status * 20000)
+    assert _wait(lambda: len(protocol.msgs) == 20000, timeout=10)
+
+
+def test_closed_by_server(reactor, server):
+    conn, protocol = _connect(reactor, server)
+    server.close_sessions()
+    assert _wait(lambda: protocol.lost)
+    assert not conn.is_connected()
+    assert not conn.write(b"\x00")
+
+
+def test_close(reactor, server):
+    conn, protocol = _connect(reactor, server)
+    conn.close()
+    assert _wait(lambda: protocol.lost)
+    assert _wait(lambda: server.stats()["closed"] == 1)
+
+
+def test_connect_refused(reactor, server):
+    port = server.port
+    server.stop()
+    protocol = _Protocol()
+    conn = reactor.connect(("127.0.0.1", port), protocol, 2000)
+    assert _wait(lambda: protocol.lost)
+    assert not protocol.made and not conn.is_connected()
+
+
+def test_reader(reactor):
+    read_sock, write_sock = socket.socketpair()
+    read_sock.setblocking(False)
+    data = []
+    reactor.add_reader(read_sock, lambda: data.append(read_sock.recv(64)))
+    write_sock.send(b"abc")
+    assert _wait(lambda: data == [b"abc"])
+    reactor.remove_reader(read_sock)
+    write_sock.send(b"def")
+    time.sleep(0.1)
+    assert data == [b"abc"]
+    read_sock.close()
+    write_sock.close()
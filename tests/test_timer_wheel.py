@@ -0,0 +1,139 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :test_timer_wheel.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :TimerWheel tests driven by a virtual clock
+@version   :1.0.0
+@date      :2026-10-17 11:52:40
+@copyright :Copyright (c) 2022
+"""
+
+from usr.timer_wheel import TimerWheel
+
+
+class _Clock(object):
+
+    def __init__(self):
+        self.time = 0
+
+    def now(self):
+        return self.time
+
+
+def _wheel():
+    # 4 slots of 10 ms per level, level ranges are 40, 160 and 640 ms.
+    wheel = TimerWheel(tick_ms=10, slot_bits=2, levels=3)
+    clock = _Clock()
+    wheel._TimerWheel__clock = clock
+    return wheel, clock
+
+
+def _run_until(wheel, clock, end, step=10):
+    while clock.time < end:
+        clock.time += step
+        wheel.advance()
+
+
+def test_expiry_across_levels():
+    wheel, clock = _wheel()
+    runs = []
+    delays = [10, 30, 40, 50, 150, 160, 170, 630, 640, 1000, 5000]
+    for delay in delays:
+        wheel.schedule(delay, lambda d: runs.append((d, clock.time)), delay)
+    assert wheel.size() == len(delays)
+    _run_until(wheel, clock, 6000)
+    assert runs == [(i, i) for i in delays]
+    assert wheel.size() == 0
+
+
+def test_round_up_and_late_advance():
+    wheel, clock = _wheel()
+    runs = []
+    wheel.schedule(15, runs.append, 15)
+    wheel.schedule(0, runs.append, 0)
+    _run_until(wheel, clock, 10)
+    assert runs == [0]
+    _run_until(wheel, clock, 20)
+    assert runs == [0, 15]
+    # Advance after a long time runs all expired timers at once.
+    wheel.schedule(100, runs.append, 100)
+    wheel.schedule(500, runs.append, 500)
+    clock.time += 1000
+    assert wheel.advance() == 2
+    assert runs == [0, 15, 100, 500]
+
+
+def test_cancel():
+    wheel, clock = _wheel()
+    runs = []
+    timers = [wheel.schedule(delay, runs.append, delay) for delay in (20, 100, 300, 900)]
+    timers[0].cancel()
+    timers[3].cancel()
+    assert wheel.size() == 2
+    assert timers[0].cancelled and not timers[1].cancelled
+    # Cancel after the timer is cascaded to a lower level.
+    _run_until(wheel, clock, 290)
+    assert runs == [100]
+    timers[2].cancel()
+    assert wheel.size() == 0
+    _run_until(wheel, clock, 1000)
+    assert runs == [100]
+    # Cancel of a run timer does nothing.
+    timers[1].cancel()
+    assert not timers[1].cancelled and wheel.size() == 0
+
+
+def test_rearm():
+    wheel, clock = _wheel()
+    runs = []
+
+    def periodic():
+        runs.append(clock.time)
+        if len(runs) < 5:
+            wheel.schedule(70, periodic)
+
+    wheel.schedule(70, periodic)
+    _run_until(wheel, clock, 1000)
+    assert runs == [70, 140, 210, 280, 350]
+    assert wheel.size() == 0
+
+
+def test_next_delay():
+    wheel, clock = _wheel()
+    assert wheel.next_delay() is None
+    timer = wheel.schedule(30, lambda: None)
+    assert wheel.next_delay() == 30
+    clock.time = 15
+    assert wheel.next_delay() == 15
+    wheel.advance()
+    assert wheel.next_delay() == 15
+    timer.cancel()
+    assert wheel.next_delay() is None
+
+    # Upper level timer is reported at the next wrap around of level 0.
+    clock.time = 20
+    wheel.advance()
+    wheel.schedule(200, lambda: None)
+    assert wheel.next_delay() == 20
+    _run_until(wheel, clock, 40)
+    assert wheel.next_delay() == 40
+    _run_until(wheel, clock, 200)
+    assert wheel.next_delay() == 20
+    _run_until(wheel, clock, 220)
+    assert wheel.next_delay() is None
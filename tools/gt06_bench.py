@@ -0,0 +1,307 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :gt06_bench.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :GT06 message hot path microbenchmarks with baseline regression check
+@version   :1.0.0
+@date      :2026-10-17 03:20:44
+@copyright :Copyright (c) 2022
+"""
+
+import os
+import gc
+import sys
+import json
+import time
+import platform
+import argparse
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "host"))
+
+from usr.common import SerialNo
+from usr.crc_itu import crc16
+from usr.gt06_core import GT06Protocol
+from usr.gt06_msg import pack_msg, GT06MsgParse, GT06MsgFramer, T01, T12, T13, T15, T16
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "gt06_bench_baseline.json")
+
+_GPS = ("220707164353", 12, 31.8, 117.2, 120, 126, 1, 0, 1, 1)
+_LBS = (460, 0, 0x5D2A, 0x1234)
+_STATUS = (1, 1, 0, 1, 1, 0, 5, 4)
+_REFERENCE_DATA = bytes(range(64))
+
+
+def _benchmarks():
+    """Get benchmarks.
+
+    Returns:
+        list: (name, function), each function call is one op.
+    """
+    serial_no_obj = SerialNo(start_no=1)
+    t01 = T01(serial_no_obj)
+    t01.set_imei("0353413532150362")
+    t12 = T12(serial_no_obj)
+    t12.set_gps(*_GPS)
+    t12.set_lbs(*_LBS)
+    t13 = T13(serial_no_obj)
+    t13.set_device_status(*_STATUS)
+    t15 = T15(serial_no_obj)
+    t15.set_device_cmd(1, "DWXX=OK")
+    t16 = T16(serial_no_obj)
+    t16.set_gps(*_GPS)
+    t16.set_lbs(*_LBS)
+    t16.set_device_status(*_STATUS)
+
+    ack = pack_msg(0x13, 0x0102)
+    cmd = pack_msg(0x80, 0x0001, bytes([4 + 5]) + (1).to_bytes(4, "big") + b"DWXX#")
+    parser = GT06MsgParse()
+    merged = ack * 10
+    framer = GT06MsgFramer()
+    heartbeat = bytes(memoryview(t13.get_msg()[1])[2:-4])
+    location = bytes(memoryview(t16.get_msg()[1])[2:-4])
+
+    core = GT06Protocol()
+    core.set_device_status(_STATUS)
+
+    def feed_split():
+        framer.feed(ack[:7])
+        framer.feed(ack[7:])
+
+    return [
+        ("T01.get_msg", t01.get_msg),
+        ("T12.get_msg", t12.get_msg),
+        ("T13.get_msg", t13.get_msg),
+        ("T15.get_msg", t15.get_msg),
+        ("T16.get_msg", t16.get_msg),
+        ("T12.set_gps_lbs", lambda: (t12.set_gps(*_GPS), t12.set_lbs(*_LBS))),
+        ("T13.set_device_status", lambda: t13.set_device_status(*_STATUS)),
+        ("GT06Protocol.get_device_status_msg", core.get_device_status_msg),
+        ("GT06MsgParse.set_msg.ack", lambda: parser.set_msg(ack)),
+        ("GT06MsgParse.set_msg.command", lambda: parser.set_msg(cmd)),
+        ("GT06MsgParse.get_msg_info.command", lambda: (parser.set_msg(cmd), parser.get_msg_info())),
+        ("crc16.heartbeat", lambda: crc16(heartbeat)),
+        ("crc16.location", lambda: crc16(location)),
+        ("GT06MsgFramer.feed.10_merged", lambda: framer.feed(merged)),
+        ("GT06MsgFramer.feed.split", feed_split),
+        ("SerialNo.get_serial_no", serial_no_obj.get_serial_no),
+    ]
+
+
+def _reference():
+    """Fixed pure Python workload, benchmark speed is divided by its speed measured in the same run."""
+    total = 0
+    for i in _REFERENCE_DATA:
+        total = ((total << 1) ^ i) & 0xFFFF
+    return total
+
+
+def _number(func, run_time):
+    """Get op count of one run which lasts about run_time."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= run_time / 10:
+            break
+        number *= 10
+    return max(int(number * run_time / max(elapsed, 1e-9)), 1)
+
+
+def _ops(func, number):
+    """Get ops/s of one run."""
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return number / (time.perf_counter() - start)
+
+
+def _speed(func, min_time, repeat):
+    """Get speed of a benchmark.
+
+    Each of `repeat` runs is split into 5 short runs, each short run is followed by a short run of the
+    reference workload, so both see the same machine load.
+
+    Returns:
+        tuple: (ops_per_s, ops_ratio), best ops/s of short runs and median ratio of ops/s to reference ops/s.
+    """
+    number = _number(func, min_time / 5)
+    ref_number = _number(_reference, min_time / 5)
+    best = 0
+    ratios = []
+    for _ in range(repeat * 5):
+        ops = _ops(func, number)
+        best = max(best, ops)
+        ratios.append(ops / _ops(_reference, ref_number))
+    ratios.sort()
+    return best, ratios[len(ratios) // 2]
+
+
+def _memory(func, number):
+    """Get memory blocks and bytes allocated by one op.
+
+    Ops run with gc disabled and results are kept, so allocs_per_op and bytes_per_op are memory kept alive by
+    an op, including its result. peak_bytes is the max memory of one op, including temporary objects.
+
+    Returns:
+        tuple: (allocs_per_op, bytes_per_op, peak_bytes)
+    """
+    func()
+    results = [None] * number
+    gc.collect()
+    gc.disable()
+    try:
+        tracemalloc.start()
+        blocks = sys.getallocatedblocks()
+        size = tracemalloc.get_traced_memory()[0]
+        for i in range(number):
+            results[i] = func()
+        allocs = (sys.getallocatedblocks() - blocks) / number
+        size = (tracemalloc.get_traced_memory()[0] - size) / number
+        current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        func()
+        peak = tracemalloc.get_traced_memory()[1] - current
+        tracemalloc.stop()
+    finally:
+        gc.enable()
+    return round(allocs, 2), round(size, 1), peak
+
+
+def run(names=None, min_time=0.2, repeat=5, number=1000):
+    """Run benchmarks.
+
+    Args:
+        names(list): benchmark names to run, all if None. (default: {None})
+        min_time(float): time of each run. unit: second. (default: {0.2})
+        repeat(int): run count, see `_speed`. (default: {5})
+        number(int): op count to measure memory. (default: {1000})
+
+    Returns:
+        dict: {name: {"ops_per_s", "ops_ratio", "allocs_per_op", "bytes_per_op", "peak_bytes"}}, ops_ratio is
+            median ratio of ops/s to a reference workload run alternately with it, it does not depend on
+            machine speed and load as much as ops_per_s.
+    """
+    results = {}
+    for name, func in _benchmarks():
+        if names and name not in names:
+            continue
+        allocs, size, peak = _memory(func, number)
+        ops_per_s, ops_ratio = _speed(func, min_time, repeat)
+        results[name] = {
+            "ops_per_s": round(ops_per_s),
+            "ops_ratio": round(ops_ratio, 4),
+            "allocs_per_op": allocs,
+            "bytes_per_op": size,
+            "peak_bytes": peak,
+        }
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Compare results with baseline.
+
+    Speed regresses when ops_ratio is lower than baseline by threshold, absolute ops_per_s is not compared
+    because it depends on the machine, speed is not compared if baseline has no ops_ratio. Memory metrics
+    regress when they are higher than baseline by threshold and by at least 1 block or 16 bytes.
+
+    Args:
+        results(dict): results of `run`.
+        baseline(dict): baseline results.
+        threshold(float): allowed ratio of change.
+
+    Returns:
+        list: regression messages.
+    """
+    regressions = []
+    for name, metrics in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if "ops_ratio" in base and metrics["ops_ratio"] < base["ops_ratio"] * (1 - threshold):
+            regressions.append("%s ops_ratio %s < baseline %s" % (name, metrics["ops_ratio"], base["ops_ratio"]))
+        for key, slack in (("allocs_per_op", 1), ("bytes_per_op", 16), ("peak_bytes", 16)):
+            if metrics[key] > max(base[key] * (1 + threshold), base[key] + slack):
+                regressions.append("%s %s %s > baseline %s" % (name, key, metrics[key], base[key]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GT06 message hot path microbenchmarks.")
+    parser.add_argument("names", nargs="*", help="benchmark names, all if empty.")
+    parser.add_argument("--baseline", default=BASELINE, help="baseline json file.")
+    parser.add_argument("--save", action="store_true", help="save results as baseline instead of comparing.")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed regression ratio.")
+    parser.add_argument("--min-time", type=float, default=0.2, help="time of each run, unit: s.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--list", action="store_true", help="list benchmark names.")
+    args = parser.parse_args()
+
+    if args.list:
+        for name, _ in _benchmarks():
+            print(name)
+        return 0
+
+    results = run(args.names, args.min_time, args.repeat)
+    print("%-36s %12s %8s %8s %8s %8s" % ("benchmark", "ops/s", "ratio", "allocs", "bytes", "peak"))
+    for name, metrics in results.items():
+        print("%-36s %12s %8s %8s %8s %8s" % (name, metrics["ops_per_s"], metrics["ops_ratio"], metrics["allocs_per_op"],
+                                              metrics["bytes_per_op"], metrics["peak_bytes"]))
+
+    meta = {"python": platform.python_version(), "implementation": platform.python_implementation(), "machine": platform.machine()}
+    if args.save:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f).get("results", {})
+        baseline.update(results)
+        with open(args.baseline, "w") as f:
+            json.dump({"meta": meta, "results": baseline}, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print("Baseline saved to %s" % args.baseline)
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No baseline %s, run with --save first." % args.baseline)
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline.get("meta") != meta:
+        print("Baseline is recorded on %s, current is %s, memory metrics and ops_ratio may differ." % (baseline.get("meta"), meta))
+    regressions = compare(results, baseline["results"], args.threshold)
+    for _ in range(2):
+        if not regressions:
+            break
+        # Run regressed benchmarks again, so a noisy run is not reported.
+        names = [i for i in results if [j for j in regressions if j.startswith(i + " ")]]
+        for name, metrics in run(names, args.min_time, args.repeat).items():
+            metrics["ops_per_s"] = max(metrics["ops_per_s"], results[name]["ops_per_s"])
+            metrics["ops_ratio"] = max(metrics["ops_ratio"], results[name]["ops_ratio"])
+            results[name] = metrics
+        regressions = compare(results, baseline["results"], args.threshold)
+    for msg in regressions:
+        print("REGRESSION: %s" % msg)
+    print("%s regression(s), threshold %s" % (len(regressions), args.threshold))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
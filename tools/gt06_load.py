@@ -0,0 +1,346 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :gt06_load.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :GT06 fleet load generator on CPython
+@version   :1.0.0
+@date      :2026-10-17 02:41:08
+@copyright :Copyright (c) 2022
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import heapq
+import random
+import argparse
+import threading
+import multiprocessing
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "host"))
+
+# Hefei, tracks start around it.
+_CENTER = (31.82, 117.22)
+
+
+class GpsTrack(object):
+    """Vehicle track by random walk, speed and course change smoothly and the vehicle stops sometimes."""
+
+    def __init__(self, rand, center=_CENTER, radius=0.2):
+        """
+        Args:
+            rand(random.Random): random generator.
+            center(tuple): (latitude, longitude) of start area. unit: degree. (default: {_CENTER})
+            radius(float): start area radius. unit: degree. (default: {0.2})
+        """
+        self.__random = rand
+        self.__lat = center[0] + rand.uniform(-radius, radius)
+        self.__lon = center[1] + rand.uniform(-radius, radius)
+        self.__course = rand.uniform(0, 360)
+        self.__speed = rand.uniform(0, 60)
+        self.__stop_time = 0
+
+    def next(self, interval):
+        """Move vehicle and get args of `GT06.report_location`.
+
+        Args:
+            interval(float): time since last point. unit: second.
+
+        Returns:
+            tuple: report_location args except include_device_status.
+        """
+        rand = self.__random
+        if self.__stop_time > 0:
+            self.__stop_time -= interval
+            self.__speed = 0
+        elif rand.random() < 0.02:
+            # Traffic light or parking.
+            self.__stop_time = rand.uniform(30, 300)
+            self.__speed = 0
+        else:
+            self.__speed = min(max(self.__speed + rand.gauss(0, 8), 5), 120)
+            self.__course = (self.__course + rand.gauss(0, 15)) % 360
+        distance = self.__speed / 3.6 * interval
+        self.__lat += distance * math.cos(math.radians(self.__course)) / 111320
+        self.__lon += distance * math.sin(math.radians(self.__course)) / (111320 * math.cos(math.radians(self.__lat)))
+        date_time = time.strftime("%y%m%d%H%M%S", time.gmtime())
+        satellite_num = rand.randint(6, 12)
+        return (date_time, satellite_num, abs(self.__lat), abs(self.__lon), int(self.__speed), int(self.__course),
+                1 if self.__lat >= 0 else 0, 0 if self.__lon >= 0 else 1, 1, 0, 460, 0, 0x5D2A, rand.randint(1, 0xFFFE))
+
+
+def _rss():
+    """Get resident memory of this process. unit: byte."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _quiet():
+    """Turn off debug logs of client modules."""
+    for name, module in list(sys.modules.items()):
+        logger = getattr(module, "logger", None) if name.startswith("usr.") else None
+        if logger is not None and hasattr(logger, "set_debug"):
+            logger.set_debug(False)
+            logger.set_level("critical")
+
+
+def _run_worker(worker_no, first_device, device_count, options):
+    """Run devices of one process.
+
+    Returns:
+        dict: result of this process, see `main`.
+    """
+    from usr.gt06 import GT06
+    from usr.gt06_session import GT06SessionManager
+    if not options["verbose"]:
+        _quiet()
+
+    rand = random.Random(options["seed"] * 1000 + worker_no if options["seed"] is not None else None)
+    rss_start = _rss()
+    cpu_start = time.process_time()
+    manager = None
+    if options["mode"] == "manager":
+        manager = GT06SessionManager()
+        manager.start()
+
+    result = {
+        "devices": device_count, "logged_in": 0, "login_failed": 0, "sent": 0, "acked": 0, "failed": 0,
+        "commands": 0, "latency": [], "login_latency": [],
+    }
+    lock = threading.Lock()
+    devices = []
+    for index in range(device_count):
+        imei = "86%013d" % (first_device + index)
+        client = GT06(ip=options["host"], port=options["port"], timeout=options["timeout"], retry_count=options["retry_count"],
+                      life_time=options["life_time"], manager=manager)
+
+        def callback(msg, client=client):
+            with lock:
+                result["commands"] += 1
+            content = msg["content"]
+            client.report_device_cmd(content["server_flag"], "OK" + content["cmd_data"])
+
+        client.set_callback(callback)
+        devices.append((imei, client, GpsTrack(rand)))
+
+    def login(device):
+        imei, client, _ = device
+        start = time.monotonic()
+        res = client.connect() and client.login(imei)
+        with lock:
+            if res:
+                result["logged_in"] += 1
+                result["login_latency"].append((time.monotonic() - start) * 1000)
+            else:
+                result["login_failed"] += 1
+        return res
+
+    # Ramp up logins, then schedule reports of each device at a random phase.
+    start_time = time.monotonic()
+    ready = []
+    for index, device in enumerate(devices):
+        delay = start_time + options["ramp"] * index / max(device_count, 1) - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        if login(device):
+            ready.append(index)
+    rss_ready = _rss()
+
+    end_time = time.monotonic() + options["duration"]
+    cond = threading.Condition()
+    heap = [(time.monotonic() + rand.uniform(0, options["interval"]), i, 0) for i in ready]
+    heapq.heapify(heap)
+
+    def work():
+        while True:
+            with cond:
+                while heap and heap[0][0] > time.monotonic() and heap[0][0] < end_time:
+                    cond.wait(heap[0][0] - time.monotonic())
+                if not heap or heap[0][0] >= end_time:
+                    return
+                _, index, step = heapq.heappop(heap)
+            _, client, track = devices[index]
+            start = time.monotonic()
+            if options["status_every"] and step % options["status_every"] == options["status_every"] - 1:
+                res = client.report_device_status()
+            else:
+                res = client.report_location(*track.next(options["interval"]), include_device_status=options["ack_location"])
+            latency = (time.monotonic() - start) * 1000
+            with lock:
+                result["sent"] += 1
+                if res:
+                    result["acked"] += 1
+                    result["latency"].append(latency)
+                else:
+                    result["failed"] += 1
+            with cond:
+                heapq.heappush(heap, (start + options["interval"], index, step + 1))
+                cond.notify()
+
+    threads = [threading.Thread(target=work, daemon=True) for _ in range(options["threads"])]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    result["cpu"] = time.process_time() - cpu_start
+    result["rss_sessions"] = rss_ready - rss_start
+    result["rss"] = _rss()
+    for _, client, _ in devices:
+        client.disconnect()
+    if manager is not None:
+        manager.stop()
+    return result
+
+
+def _worker_main(args):
+    return _run_worker(*args)
+
+
+def percentile(values, percent):
+    """Get percentile by nearest rank.
+
+    Args:
+        values(list): sorted values.
+        percent(float): 0 - 100.
+
+    Returns:
+        float: percentile, 0 if values is empty.
+    """
+    if not values:
+        return 0
+    return values[min(len(values) - 1, max(int(math.ceil(percent / 100 * len(values))) - 1, 0))]
+
+
+def summarize(results, duration):
+    """Aggregate results of all processes.
+
+    Args:
+        results(list): results of `_run_worker`.
+        duration(float): report duration. unit: second.
+
+    Returns:
+        dict: load test report.
+    """
+    report = {}
+    for key in ("devices", "logged_in", "login_failed", "sent", "acked", "failed", "commands"):
+        report[key] = sum(i[key] for i in results)
+    latency = sorted(j for i in results for j in i["latency"])
+    login_latency = sorted(j for i in results for j in i["login_latency"])
+    devices = max(report["devices"], 1)
+    cpu = sum(i["cpu"] for i in results)
+    report["throughput"] = round(report["acked"] / duration, 1)
+    report["latency_ms"] = {
+        "p50": round(percentile(latency, 50), 1),
+        "p90": round(percentile(latency, 90), 1),
+        "p99": round(percentile(latency, 99), 1),
+        "max": round(latency[-1], 1) if latency else 0,
+    }
+    report["login_latency_ms"] = {
+        "p50": round(percentile(login_latency, 50), 1),
+        "p99": round(percentile(login_latency, 99), 1),
+    }
+    report["cpu_s"] = round(cpu, 2)
+    report["cpu_ms_per_session_s"] = round(cpu * 1000 / devices / duration, 3)
+    report["rss_kb_per_session"] = round(sum(i["rss_sessions"] for i in results) / 1024 / devices, 1)
+    report["rss_mb"] = round(sum(i["rss"] for i in results) / 1024 / 1024, 1)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GT06 fleet load generator, devices run the GT06 client code.")
+    parser.add_argument("--devices", type=int, default=100)
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--threads", type=int, default=16, help="report threads of each process.")
+    parser.add_argument("--mode", choices=("manager", "thread"), default="manager",
+                        help="manager - sessions of a process share one GT06SessionManager, thread - downlink thread each.")
+    parser.add_argument("--duration", type=float, default=60, help="report time after login, unit: s.")
+    parser.add_argument("--interval", type=float, default=10, help="report interval of each device, unit: s.")
+    parser.add_argument("--status-every", type=int, default=6, help="every n-th report is 0x13 device status, 0 - never.")
+    parser.add_argument("--no-ack-location", dest="ack_location", action="store_false",
+                        help="report location by 0x12 without server ack instead of 0x16.")
+    parser.add_argument("--ramp", type=float, default=5, help="login time of all devices of a process, unit: s.")
+    parser.add_argument("--timeout", type=int, default=5)
+    parser.add_argument("--retry-count", type=int, default=3)
+    parser.add_argument("--life-time", type=int, default=180)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0, help="server port, a local stand-in server is started if 0.")
+    parser.add_argument("--delay", type=int, default=0, help="local server ack delay, unit: ms.")
+    parser.add_argument("--jitter", type=int, default=0, help="local server ack jitter, unit: ms.")
+    parser.add_argument("--drop", type=float, default=0.0, help="local server drop probability.")
+    parser.add_argument("--command-interval", type=float, default=0, help="local server pushes a command to all devices, unit: s.")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--json", action="store_true", help="print report as json.")
+    parser.add_argument("--verbose", action="store_true", help="print client debug logs.")
+    args = parser.parse_args()
+
+    server = None
+    port = args.port
+    if not port:
+        from gt06_server import GT06Server
+        server = GT06Server(delay=args.delay, jitter=args.jitter, drop=args.drop, seed=args.seed)
+        port = server.start()
+
+    options = {
+        "host": args.host, "port": port, "mode": args.mode, "threads": args.threads, "duration": args.duration,
+        "interval": args.interval, "status_every": args.status_every, "ack_location": args.ack_location,
+        "ramp": args.ramp, "timeout": args.timeout, "retry_count": args.retry_count, "life_time": args.life_time,
+        "seed": args.seed, "verbose": args.verbose,
+    }
+    processes = max(min(args.processes, args.devices), 1)
+    jobs = []
+    first = 0
+    for worker_no in range(processes):
+        count = args.devices // processes + (1 if worker_no < args.devices % processes else 0)
+        jobs.append((worker_no, first, count, options))
+        first += count
+
+    stop = threading.Event()
+    if server is not None and args.command_interval:
+        def push():
+            flag = 0
+            while not stop.wait(args.command_interval):
+                flag += 1
+                server.push_command(flag, "DWXX#")
+        threading.Thread(target=push, daemon=True).start()
+
+    # Spawn, so workers do not inherit the server thread.
+    with multiprocessing.get_context("spawn").Pool(processes) as pool:
+        results = pool.map(_worker_main, jobs)
+    stop.set()
+
+    report = summarize(results, args.duration)
+    if server is not None:
+        report["server"] = server.stats()
+        server.stop()
+    if args.json:
+        print(json.dumps(report))
+    else:
+        for key, value in report.items():
+            print("%-22s %s" % (key, value))
+
+
+if __name__ == "__main__":
+    main()
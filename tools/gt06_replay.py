@@ -0,0 +1,257 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :gt06_replay.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :Replay GT06 capture file through the client protocol core or to a server
+@version   :1.0.0
+@date      :2026-10-17 04:31:57
+@copyright :Copyright (c) 2022
+"""
+
+import os
+import sys
+import time
+import socket
+import argparse
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "host"))
+
+from usr.gt06_core import GT06Protocol, EVENT_RESPONSE, EVENT_TIMEOUT, EVENT_COMMAND
+from usr.gt06_msg import GT06MsgParse, GT06MsgFramer
+from usr.gt06_capture import CaptureReader, CAPTURE_OUT, CAPTURE_IN, CAPTURE_CONNECT, CAPTURE_CLOSE
+
+# Protocol numbers of messages which have server response.
+_ACK_PROTOCOL_NOS = (0x01, 0x13, 0x16)
+_RECORD_NAMES = {CAPTURE_OUT: "out", CAPTURE_IN: "in", CAPTURE_CONNECT: "connect", CAPTURE_CLOSE: "close"}
+
+
+class _Pacer(object):
+    """Wait until the wall time of a record, speed 0 is as fast as possible."""
+
+    def __init__(self, speed):
+        self.__speed = speed
+        self.__start = None
+
+    def wait(self, record_time):
+        if not self.__speed:
+            return
+        if self.__start is None:
+            self.__start = time.monotonic() - record_time / 1000 / self.__speed
+        delay = self.__start + record_time / 1000 / self.__speed - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+def replay_client(records, speed=0, repeat=1, retry_count=3, timeout=5000, window_size=4):
+    """Feed captured bytes through GT06Protocol, the core clock is the capture time.
+
+    Device messages are sent to the core and server bytes are received by the core in captured order, so the
+    parser, window, ack matching and retransmission timeout run as in the field. Retransmissions in capture
+    are not sent again, heart beat of the core is turned off because captured heart beats are sent.
+
+    Args:
+        records(list): capture records.
+        speed(float): 1 - original speed, 0 - as fast as possible. (default: {0})
+        repeat(int): replay count. (default: {1})
+        retry_count(int): core retransmission count. (default: {3})
+        timeout(int): core initial timeout. unit: ms. (default: {5000})
+        window_size(int): core window size. (default: {4})
+
+    Returns:
+        dict: replay statistics.
+    """
+    stats = {"records": 0, "bytes": 0, "sent": 0, "retransmitted": 0, "responses": 0, "timeouts": 0, "commands": 0,
+             "max_rtt": 0}
+    rtt_sum = 0
+    core = GT06Protocol(retry_count=retry_count, life_time=1 << 30, window_size=window_size, timeout=timeout)
+    framer = GT06MsgFramer()
+    pacer = _Pacer(speed)
+    span = (records[-1][1] + 1) if records else 0
+    outstanding = set()
+    start = time.perf_counter()
+    for index in range(repeat):
+        if records and records[0][0] != CAPTURE_CONNECT:
+            # Capture is started on a connected socket.
+            framer.reset()
+            core.connection_made(index * span)
+        for record_type, record_time, data in records:
+            now = index * span + record_time
+            pacer.wait(now)
+            core.tick(now)
+            stats["records"] += 1
+            stats["bytes"] += len(data)
+            if record_type == CAPTURE_CONNECT:
+                framer.reset()
+                core.connection_made(now)
+            elif record_type == CAPTURE_CLOSE:
+                core.connection_lost(now)
+            elif record_type == CAPTURE_OUT:
+                for msg in framer.feed(data):
+                    protocol_no = msg[3]
+                    msg_no = (msg[-6] << 8) | msg[-5]
+                    if protocol_no not in _ACK_PROTOCOL_NOS:
+                        core.send(bytes(msg), None, msg_no, now)
+                    elif (protocol_no, msg_no) in outstanding:
+                        stats["retransmitted"] += 1
+                        continue
+                    else:
+                        outstanding.add((protocol_no, msg_no))
+                        core.send(bytes(msg), protocol_no, msg_no, now)
+                    stats["sent"] += 1
+            elif record_type == CAPTURE_IN:
+                core.receive_data(data, now)
+            core.data_to_send()
+            for event in core.events():
+                outstanding.discard((event.protocol_no, event.msg_no))
+                if event.type == EVENT_RESPONSE:
+                    stats["responses"] += 1
+                    rtt_sum += event.rtt
+                    stats["max_rtt"] = max(stats["max_rtt"], event.rtt)
+                elif event.type == EVENT_TIMEOUT:
+                    stats["timeouts"] += 1
+                elif event.type == EVENT_COMMAND:
+                    stats["commands"] += 1
+    stats["avg_rtt"] = rtt_sum // stats["responses"] if stats["responses"] else 0
+    stats["rto"] = core.rto_info()
+    return _finish(stats, start)
+
+
+def replay_server(records, host, port, speed=0, repeat=1, wait=1.0):
+    """Send captured device bytes to a server and count server messages.
+
+    Args:
+        records(list): capture records.
+        host(str): server ip address.
+        port(int): server port.
+        speed(float): 1 - original speed, 0 - as fast as possible. (default: {0})
+        repeat(int): replay count. (default: {1})
+        wait(float): time to wait for server messages after the last record. unit: second. (default: {1.0})
+
+    Returns:
+        dict: replay statistics.
+    """
+    stats = {"records": 0, "bytes": 0, "connections": 0, "received": 0, "acks": 0, "commands": 0, "errors": 0}
+    lock = threading.Lock()
+    parser = GT06MsgParse()
+
+    def read(sock):
+        framer = GT06MsgFramer()
+        while True:
+            try:
+                data = sock.recv(4096)
+            except OSError:
+                return
+            if not data:
+                return
+            for msg in framer.feed(data):
+                msg_info = parser.parse(msg)
+                with lock:
+                    stats["received"] += 1
+                    if msg_info is None:
+                        stats["errors"] += 1
+                    elif msg_info.protocol_no == 0x80:
+                        stats["commands"] += 1
+                    else:
+                        stats["acks"] += 1
+
+    def close(conn):
+        # Shutdown wakes up the read thread blocked in recv.
+        try:
+            conn[0].shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        conn[0].close()
+        conn[1].join()
+
+    def connect():
+        sock = socket.create_connection((host, port))
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        thread = threading.Thread(target=read, args=(sock,), daemon=True)
+        thread.start()
+        stats["connections"] += 1
+        return sock, thread
+
+    pacer = _Pacer(speed)
+    span = (records[-1][1] + 1) if records else 0
+    conn = None
+    start = time.perf_counter()
+    for index in range(repeat):
+        for record_type, record_time, data in records:
+            pacer.wait(index * span + record_time)
+            stats["records"] += 1
+            if record_type == CAPTURE_CONNECT or (record_type == CAPTURE_OUT and conn is None):
+                if conn is not None:
+                    close(conn)
+                conn = connect()
+            if record_type == CAPTURE_CLOSE and conn is not None:
+                time.sleep(wait if not speed else 0)
+                close(conn)
+                conn = None
+            elif record_type == CAPTURE_OUT:
+                conn[0].sendall(data)
+                stats["bytes"] += len(data)
+    if conn is not None:
+        time.sleep(wait)
+        close(conn)
+    return _finish(stats, start)
+
+
+def _finish(stats, start):
+    elapsed = time.perf_counter() - start
+    stats["elapsed_s"] = round(elapsed, 3)
+    stats["records_per_s"] = round(stats["records"] / elapsed) if elapsed else 0
+    stats["mb_per_s"] = round(stats["bytes"] / elapsed / 1024 / 1024, 2) if elapsed else 0
+    return stats
+
+
+def dump(records):
+    for record_type, record_time, data in records:
+        print("%10d %-8s %s" % (record_time, _RECORD_NAMES.get(record_type, record_type),
+                                data.decode() if record_type == CAPTURE_CONNECT else data.hex()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay GT06 capture file recorded by WireCapture.")
+    parser.add_argument("capture", help="capture file.")
+    parser.add_argument("--mode", choices=("client", "server", "dump"), default="client",
+                        help="client - feed through client protocol core, server - send device bytes to server, dump - print records.")
+    parser.add_argument("--speed", type=float, default=0, help="1 - original speed, 0 - as fast as possible.")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7611)
+    parser.add_argument("--retry-count", type=int, default=3)
+    parser.add_argument("--timeout", type=int, default=5000, help="client core initial timeout, unit: ms.")
+    parser.add_argument("--window-size", type=int, default=4)
+    args = parser.parse_args()
+
+    records = list(CaptureReader(args.capture).records())
+    if args.mode == "dump":
+        dump(records)
+        return
+    if args.mode == "client":
+        stats = replay_client(records, args.speed, args.repeat, args.retry_count, args.timeout, args.window_size)
+    else:
+        stats = replay_server(records, args.host, args.port, args.speed, args.repeat)
+    for key, value in stats.items():
+        print("%-16s %s" % (key, value))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,425 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+@file      :gt06_server.py
+@author    :Jack Sun (jack.sun@quectel.com)
+@brief     :GT06 stand-in server on CPython with fault injection
+@version   :1.0.0
+@date      :2026-10-17 02:05:19
+@copyright :Copyright (c) 2022
+"""
+
+import os
+import sys
+import time
+import heapq
+import random
+import socket
+import argparse
+import selectors
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "host"))
+
+from usr.logging import getLogger
+from usr.gt06_msg import pack_msg, GT06MsgParse, GT06MsgFramer
+
+logger = getLogger(__name__)
+
+# Protocol numbers acked by server.
+ACK_PROTOCOL_NOS = (0x01, 0x13, 0x16)
+
+
+class _Session(object):
+    """One device connection."""
+
+    def __init__(self, sock, addr):
+        self.sock = sock
+        self.addr = addr
+        self.framer = GT06MsgFramer()
+        self.out = b""
+        self.held = b""
+        self.imei = None
+        self.serial_no = 0
+        self.closed = False
+
+    def name(self):
+        return self.imei if self.imei is not None else "%s:%s" % self.addr
+
+
+class GT06Server(object):
+    """This class is a GT06 server for local tests, all connections are serviced by one thread.
+
+    It accepts T01, T12, T13, T15 and T16, acks login, heart beat and 0x16 location with the serial number
+    of the device message, and pushes 0x80 commands. Faults are injected to acks and commands:
+
+        1. delay and jitter: a message is written after delay + random(0, jitter) ms.
+        2. drop: a message is not written.
+        3. duplicate: a message is written twice.
+        4. split: a message is written by two TCP segments.
+        5. merge: a message is held and written with the next message of the session by one TCP segment.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, delay=0, jitter=0, drop=0.0, duplicate=0.0, split=0.0, merge=0.0,
+                 ack_protocol_nos=ACK_PROTOCOL_NOS, seed=None):
+        """
+        Args:
+            host(str): listen address. (default: {"127.0.0.1"})
+            port(int): listen port, a free port is used if 0. (default: {0})
+            delay(int): delay of acks and commands. unit: ms. (default: {0})
+            jitter(int): max random extra delay. unit: ms. (default: {0})
+            drop(float): probability to drop a message. (default: {0.0})
+            duplicate(float): probability to write a message twice. (default: {0.0})
+            split(float): probability to write a message by two TCP segments. (default: {0.0})
+            merge(float): probability to merge a message with the next message. (default: {0.0})
+            ack_protocol_nos(tuple): protocol numbers acked by server. (default: {ACK_PROTOCOL_NOS})
+            seed(int): random seed to repeat faults. (default: {None})
+        """
+        self.__host = host
+        self.__port = port
+        self.__delay = delay
+        self.__jitter = jitter
+        self.__drop = drop
+        self.__duplicate = duplicate
+        self.__split = split
+        self.__merge = merge
+        self.__ack_protocol_nos = ack_protocol_nos
+        self.__random = random.Random(seed)
+        self.__parser = GT06MsgParse()
+        self.__selector = None
+        self.__listen_sock = None
+        self.__wakeup_socks = None
+        self.__thread = None
+        self.__running = False
+        self.__lock = threading.Lock()
+        self.__calls = []
+        self.__timers = []
+        self.__timer_seq = 0
+        self.__sessions = {}
+        self.__replies = []
+        self.__stats = {
+            "connections": 0, "closed": 0, "frames": {}, "errors": 0, "bytes_in": 0, "bytes_out": 0, "acks": 0,
+            "commands": 0, "replies": 0, "dropped": 0, "duplicated": 0, "split": 0, "merged": 0,
+        }
+
+    @property
+    def port(self):
+        return self.__port
+
+    def start(self):
+        """Start server thread.
+
+        Returns:
+            int: listen port.
+        """
+        self.__selector = selectors.DefaultSelector()
+        self.__listen_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.__listen_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.__listen_sock.bind((self.__host, self.__port))
+        self.__listen_sock.listen(1024)
+        self.__listen_sock.setblocking(False)
+        self.__port = self.__listen_sock.getsockname()[1]
+        self.__selector.register(self.__listen_sock, selectors.EVENT_READ, None)
+        self.__wakeup_socks = socket.socketpair()
+        self.__wakeup_socks[1].setblocking(False)
+        self.__selector.register(self.__wakeup_socks[1], selectors.EVENT_READ, None)
+        self.__running = True
+        self.__thread = threading.Thread(target=self.__loop, name="GT06Server", daemon=True)
+        self.__thread.start()
+        return self.__port
+
+    def stop(self):
+        """Stop server thread and close all connections."""
+        if not self.__running:
+            return
+        self.__running = False
+        self.__wakeup()
+        self.__thread.join()
+        for session in list(self.__sessions.values()):
+            self.__close(session)
+        self.__selector.close()
+        self.__listen_sock.close()
+        for sock in self.__wakeup_socks:
+            sock.close()
+
+    def __wakeup(self):
+        try:
+            self.__wakeup_socks[0].send(b"\x00")
+        except OSError:
+            pass
+
+    def __call(self, func, *args):
+        """Run function in server thread."""
+        with self.__lock:
+            self.__calls.append((func, args))
+        self.__wakeup()
+
+    def __call_later(self, delay, func, *args):
+        """Run function in server thread after delay, it is called in server thread. unit: ms."""
+        self.__timer_seq += 1
+        heapq.heappush(self.__timers, (time.monotonic() + delay / 1000, self.__timer_seq, func, args))
+
+    def __loop(self):
+        while self.__running:
+            timeout = None
+            if self.__timers:
+                timeout = max(self.__timers[0][0] - time.monotonic(), 0)
+            for key, events in self.__selector.select(timeout):
+                if key.fileobj is self.__listen_sock:
+                    self.__accept()
+                elif key.fileobj is self.__wakeup_socks[1]:
+                    try:
+                        self.__wakeup_socks[1].recv(1024)
+                    except OSError:
+                        pass
+                else:
+                    session = key.data
+                    if events & selectors.EVENT_READ:
+                        self.__read(session)
+                    if events & selectors.EVENT_WRITE and not session.closed:
+                        self.__flush(session)
+            with self.__lock:
+                calls = self.__calls
+                self.__calls = []
+            for func, args in calls:
+                func(*args)
+            now = time.monotonic()
+            while self.__timers and self.__timers[0][0] <= now:
+                _, _, func, args = heapq.heappop(self.__timers)
+                func(*args)
+
+    def __accept(self):
+        while True:
+            try:
+                sock, addr = self.__listen_sock.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            sock.setblocking(False)
+            # Each write is a TCP segment, so split and merge are seen by the device.
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            session = _Session(sock, addr)
+            self.__sessions[sock.fileno()] = session
+            self.__selector.register(sock, selectors.EVENT_READ, session)
+            self.__stats["connections"] += 1
+
+    def __close(self, session):
+        if session.closed:
+            return
+        session.closed = True
+        self.__sessions.pop(session.sock.fileno(), None)
+        try:
+            self.__selector.unregister(session.sock)
+        except (KeyError, ValueError):
+            pass
+        session.sock.close()
+        self.__stats["closed"] += 1
+
+    def __read(self, session):
+        try:
+            data = session.sock.recv(4096)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            data = b""
+        if not data:
+            self.__close(session)
+            return
+        self.__stats["bytes_in"] += len(data)
+        for msg in session.framer.feed(data):
+            self.__handle(session, msg)
+
+    def __handle(self, session, msg):
+        msg_info = self.__parser.parse(msg)
+        if msg_info is None:
+            self.__stats["errors"] += 1
+            return
+        protocol_no = msg_info.protocol_no
+        frames = self.__stats["frames"]
+        frames[protocol_no] = frames.get(protocol_no, 0) + 1
+        if protocol_no == 0x01:
+            session.imei = bytes(msg_info.content).hex()
+        elif protocol_no == 0x15:
+            self.__stats["replies"] += 1
+            self.__replies.append((session.name(), msg_info.server_flag, msg_info.cmd_data))
+        if protocol_no in self.__ack_protocol_nos:
+            self.__stats["acks"] += 1
+            self.__send(session, pack_msg(protocol_no, msg_info.msg_no))
+
+    def __send(self, session, data):
+        """Write message with injected faults, it is called in server thread."""
+        if self.__random.random() < self.__drop:
+            self.__stats["dropped"] += 1
+            return
+        count = 1
+        if self.__random.random() < self.__duplicate:
+            self.__stats["duplicated"] += 1
+            count = 2
+        for _ in range(count):
+            delay = self.__delay + (self.__random.uniform(0, self.__jitter) if self.__jitter else 0)
+            if delay > 0:
+                self.__call_later(delay, self.__send_now, session, data)
+            else:
+                self.__send_now(session, data)
+
+    def __send_now(self, session, data):
+        if session.closed:
+            return
+        if self.__random.random() < self.__merge:
+            self.__stats["merged"] += 1
+            session.held += data
+            # Message is written alone if no other message comes.
+            self.__call_later(max(self.__delay, 20), self.__release, session)
+            return
+        data = session.held + data
+        session.held = b""
+        if len(data) > 1 and self.__random.random() < self.__split:
+            self.__stats["split"] += 1
+            index = self.__random.randint(1, len(data) - 1)
+            self.__write(session, data[:index])
+            self.__call_later(5, self.__write, session, data[index:])
+        else:
+            self.__write(session, data)
+
+    def __release(self, session):
+        if session.held and not session.closed:
+            data = session.held
+            session.held = b""
+            self.__write(session, data)
+
+    def __write(self, session, data):
+        if session.closed:
+            return
+        session.out += data
+        self.__flush(session)
+
+    def __flush(self, session):
+        try:
+            while session.out:
+                num = session.sock.send(session.out)
+                self.__stats["bytes_out"] += num
+                session.out = session.out[num:]
+        except (BlockingIOError, InterruptedError):
+            pass
+        except OSError:
+            self.__close(session)
+            return
+        self.__selector.modify(session.sock, selectors.EVENT_READ | (selectors.EVENT_WRITE if session.out else 0), session)
+
+    def __push(self, imei, content):
+        for session in list(self.__sessions.values()):
+            if imei is None or session.imei == imei:
+                session.serial_no = (session.serial_no + 1) & 0xFFFF
+                self.__stats["commands"] += 1
+                self.__send(session, pack_msg(0x80, session.serial_no, content))
+
+    def push_command(self, server_flag, cmd_data, imei=None):
+        """Push 0x80 command to devices.
+
+        Args:
+            server_flag(int): server flag, device replies it in 0x15 message.
+            cmd_data(str): command data.
+            imei(str): device imei number, all devices if None. (default: {None})
+        """
+        cmd_data = cmd_data.encode() if isinstance(cmd_data, str) else cmd_data
+        content = bytes([4 + len(cmd_data)]) + server_flag.to_bytes(4, "big") + cmd_data
+        self.__call(self.__push, imei, content)
+
+    def close_sessions(self, imei=None):
+        """Close device connections to simulate server failure.
+
+        Args:
+            imei(str): device imei number, all devices if None. (default: {None})
+        """
+        def close():
+            for session in list(self.__sessions.values()):
+                if imei is None or session.imei == imei:
+                    self.__close(session)
+        self.__call(close)
+
+    def sessions(self):
+        """Get connected devices.
+
+        Returns:
+            list: imei number, or address if not logged in.
+        """
+        return [i.name() for i in list(self.__sessions.values())]
+
+    def replies(self):
+        """Get 0x15 device command replies.
+
+        Returns:
+            list: (imei, server_flag, cmd_data)
+        """
+        return list(self.__replies)
+
+    def stats(self):
+        """Get server statistics.
+
+        Returns:
+            dict:
+                connections(int): accepted connection count.
+                closed(int): closed connection count.
+                frames(dict): received message count of each protocol number.
+                errors(int): received illegal message count.
+                bytes_in(int): received bytes.
+                bytes_out(int): written bytes.
+                acks(int): ack count, before fault injection.
+                commands(int): pushed 0x80 command count.
+                replies(int): received 0x15 count.
+                dropped(int): dropped message count.
+                duplicated(int): duplicated message count.
+                split(int): split write count.
+                merged(int): merged message count.
+        """
+        stats = dict(self.__stats)
+        stats["frames"] = dict(stats["frames"])
+        return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GT06 stand-in server with fault injection.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7611)
+    parser.add_argument("--delay", type=int, default=0, help="ack delay, unit: ms.")
+    parser.add_argument("--jitter", type=int, default=0, help="max random extra delay, unit: ms.")
+    parser.add_argument("--drop", type=float, default=0.0, help="probability to drop a message.")
+    parser.add_argument("--duplicate", type=float, default=0.0, help="probability to write a message twice.")
+    parser.add_argument("--split", type=float, default=0.0, help="probability to split a message.")
+    parser.add_argument("--merge", type=float, default=0.0, help="probability to merge a message with the next one.")
+    parser.add_argument("--command-interval", type=int, default=0, help="push 0x80 command to all devices, unit: s.")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    server = GT06Server(args.host, args.port, args.delay, args.jitter, args.drop, args.duplicate, args.split, args.merge,
+                        seed=args.seed)
+    print("GT06 server listen on %s:%s" % (args.host, server.start()))
+    flag = 0
+    try:
+        while True:
+            time.sleep(args.command_interval or 10)
+            if args.command_interval:
+                flag += 1
+                server.push_command(flag, "DWXX#")
+            print(server.stats())
+    except KeyboardInterrupt:
+        server.stop()
+        print(server.stats())
+
+
+if __name__ == "__main__":
+    main()